@@ -8,27 +8,46 @@ from __future__ import annotations
 
 import logging
 import math
+import mmap
 import random
+import struct
 import sys
-from collections.abc import Iterable, Sequence
+import uuid
+import weakref
+from array import array
+from collections.abc import Callable, Iterable, Sequence
 from logging import getLogger
-from typing import Optional, Protocol, Self, TextIO, TypeVar, final
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Protocol, Self, TextIO, TypeVar, final
 
 from roar_net_api.operations import (
     SupportsApplyMove,
+    SupportsBoundedObjectiveValueIncrement,
     SupportsConstructionNeighbourhood,
     SupportsCopySolution,
+    SupportsDestructionNeighbourhood,
+    SupportsDistanceIncrement,
     SupportsEmptySolution,
+    SupportsHashIncrement,
     SupportsLocalNeighbourhood,
+    SupportsLocalNeighbourhoods,
     SupportsLowerBound,
     SupportsLowerBoundIncrement,
+    SupportsMoveCount,
     SupportsMoves,
+    SupportsMovesDelta,
+    SupportsMovesRange,
     SupportsObjectiveValue,
     SupportsObjectiveValueIncrement,
+    SupportsObjectiveValueIncrements,
     SupportsRandomMove,
     SupportsRandomMovesWithoutReplacement,
     SupportsRandomSolution,
+    SupportsSolutionDistance,
+    SupportsSolutionHash,
+    SupportsTabuAttribute,
 )
+from roar_net_api.utils.shared_memory import SharedSegments, attach
 
 log = getLogger(__name__)
 
@@ -58,12 +77,34 @@ def sparse_fisher_yates_iter(n: int) -> Iterable[int]:
 
 
 @final
-class Solution(SupportsCopySolution, SupportsObjectiveValue, SupportsLowerBound):
-    def __init__(self, problem: Problem, tour: list[int], not_visited: set[int], lb: int):
+class Solution(
+    SupportsCopySolution,
+    SupportsObjectiveValue,
+    SupportsLowerBound,
+    SupportsSolutionHash,
+    SupportsSolutionDistance["Solution"],
+):
+    def __init__(
+        self,
+        problem: Problem,
+        tour: list[int],
+        not_visited: set[int],
+        lb: int,
+        vhash: int = 0,
+        ehash: int = 0,
+        pos: Optional[list[int]] = None,
+    ):
         self.problem = problem
         self.tour = tour
         self.not_visited = not_visited
         self.lb = lb
+        # Hash of the set of visited cities and the last city
+        self.vhash = vhash
+        # Hash of the edges in the tour, except the closing one
+        self.ehash = ehash
+        # Position of each city in the tour, computed on demand and
+        # discarded by moves
+        self.pos = pos
 
     def __str__(self) -> str:
         return " ".join(map(str, self.tour))
@@ -79,7 +120,7 @@ class Solution(SupportsCopySolution, SupportsObjectiveValue, SupportsLowerBound)
         f.write("\nEOF\n")
 
     def copy_solution(self) -> Self:
-        return self.__class__(self.problem, self.tour.copy(), self.not_visited.copy(), self.lb)
+        return self.__class__(self.problem, self.tour.copy(), self.not_visited.copy(), self.lb, self.vhash, self.ehash)
 
     def objective_value(self) -> Optional[int]:
         if self.is_feasible:
@@ -89,12 +130,34 @@ class Solution(SupportsCopySolution, SupportsObjectiveValue, SupportsLowerBound)
     def lower_bound(self) -> int:
         return self.lb
 
+    def solution_hash(self) -> int:
+        # Partial tours with the same visited cities and last city are
+        # equivalent for completion purposes, while feasible tours are
+        # identified by their set of edges
+        if self.is_feasible:
+            return self.ehash ^ self.problem.edge_hash(self.tour[-1], self.tour[0])
+        return self.vhash
+
+    def has_edge(self, i: int, j: int) -> bool:
+        assert self.is_feasible
+        if self.pos is None:
+            self.pos = [0] * self.problem.n
+            for ix, c in enumerate(self.tour):
+                self.pos[c] = ix
+        d = self.pos[i] - self.pos[j]
+        return d == 1 or d == -1 or d == self.problem.n - 1 or d == 1 - self.problem.n
+
+    def solution_distance(self, other: Solution) -> int:
+        # Number of edges that are not in the other tour
+        t = self.tour
+        return sum(not other.has_edge(t[ix - 1], t[ix]) for ix in range(len(t)))
+
 
 # ----------------------------------- Moves -----------------------------------
 
 
 @final
-class AddMove(SupportsApplyMove[Solution], SupportsLowerBoundIncrement[Solution]):
+class AddMove(SupportsApplyMove[Solution], SupportsLowerBoundIncrement[Solution], SupportsHashIncrement[Solution]):
     def __init__(self, neighbourhood: AddNeighbourhood, i: int, j: int):
         self.neighbourhood = neighbourhood
         # i and j are cities
@@ -110,7 +173,11 @@ class AddMove(SupportsApplyMove[Solution], SupportsLowerBoundIncrement[Solution]
             solution.lb += prob.dist[self.j][solution.tour[0]]
         # Tighter, but *not* better!
         # solution.lb += prob.dist[self.j][solution.tour[0]] - prob.dist[self.i][solution.tour[0]]
+        # Update hashes
+        solution.vhash ^= prob.zc[self.j] ^ prob.zl[self.i] ^ prob.zl[self.j]
+        solution.ehash ^= prob.edge_hash(self.i, self.j)
         # Update solution
+        solution.pos = None
         solution.tour.append(self.j)
         solution.not_visited.remove(self.j)
         return solution
@@ -125,9 +192,114 @@ class AddMove(SupportsApplyMove[Solution], SupportsLowerBoundIncrement[Solution]
         # incr += prob.dist[self.j][solution.tour[0]] - prob.dist[self.i][solution.tour[0]]
         return incr
 
+    def hash_increment(self, solution: Solution) -> int:
+        assert solution.tour[-1] == self.i
+        prob = solution.problem
+        if len(solution.not_visited) == 1:
+            # The solution becomes feasible
+            ehash = solution.ehash ^ prob.edge_hash(self.i, self.j) ^ prob.edge_hash(self.j, solution.tour[0])
+            return solution.vhash ^ ehash
+        return prob.zc[self.j] ^ prob.zl[self.i] ^ prob.zl[self.j]
+
+
+@final
+class RemoveMove(SupportsApplyMove[Solution]):
+    def __init__(self, neighbourhood: RemoveNeighbourhood, ix: int):
+        self.neighbourhood = neighbourhood
+        # ix is an index
+        self.ix = ix
+
+    def apply_move(self, solution: Solution) -> Solution:
+        prob = solution.problem
+        t, ix = solution.tour, self.ix
+        # Update lower bound, which no longer includes the closing edge
+        if solution.is_feasible:
+            solution.lb -= prob.dist[t[-1]][t[0]]
+        solution.lb -= prob.dist[t[ix - 1]][t[ix]]
+        if ix + 1 < len(t):
+            solution.lb += prob.dist[t[ix - 1]][t[ix + 1]] - prob.dist[t[ix]][t[ix + 1]]
+        # Update hashes
+        solution.vhash ^= prob.zc[t[ix]]
+        solution.ehash ^= prob.edge_hash(t[ix - 1], t[ix])
+        if ix + 1 < len(t):
+            solution.ehash ^= prob.edge_hash(t[ix], t[ix + 1]) ^ prob.edge_hash(t[ix - 1], t[ix + 1])
+        else:
+            solution.vhash ^= prob.zl[t[ix]] ^ prob.zl[t[ix - 1]]
+        # Update solution
+        solution.pos = None
+        solution.not_visited.add(t.pop(ix))
+        return solution
+
+
+@final
+class InsertMove(SupportsApplyMove[Solution], SupportsLowerBoundIncrement[Solution]):
+    def __init__(self, neighbourhood: InsertNeighbourhood, i: int, j: int, k: Optional[int]):
+        self.neighbourhood = neighbourhood
+        # j is inserted between the consecutive cities i and k, or
+        # appended after i if k is None
+        self.i = i
+        self.j = j
+        self.k = k
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, InsertMove):
+            return NotImplemented
+        return self.i == other.i and self.j == other.j and self.k == other.k
+
+    def __hash__(self) -> int:
+        return hash((self.i, self.j, self.k))
+
+    def apply_move(self, solution: Solution) -> Solution:
+        prob = solution.problem
+        t, i, j, k = solution.tour, self.i, self.j, self.k
+        # Update lower bound
+        solution.lb += self._increment(solution)
+        # Update hashes
+        solution.vhash ^= prob.zc[j]
+        solution.ehash ^= prob.edge_hash(i, j)
+        if k is None:
+            solution.vhash ^= prob.zl[i] ^ prob.zl[j]
+        else:
+            solution.ehash ^= prob.edge_hash(j, k) ^ prob.edge_hash(i, k)
+        # Update solution
+        solution.pos = None
+        if k is None:
+            assert t[-1] == i
+            t.append(j)
+        else:
+            ix = t.index(i) + 1
+            assert t[ix] == k
+            t.insert(ix, j)
+        solution.not_visited.remove(j)
+        return solution
+
+    def lower_bound_increment(self, solution: Solution) -> float:
+        return self._increment(solution)
+
+    def _increment(self, solution: Solution) -> int:
+        d = solution.problem.dist
+        i, j, k = self.i, self.j, self.k
+        if k is None:
+            incr = d[i][j]
+            last = j
+        else:
+            incr = d[i][j] + d[j][k] - d[i][k]
+            last = solution.tour[-1]
+        if len(solution.not_visited) == 1:
+            # The tour is closed
+            incr += d[last][solution.tour[0]]
+        return incr
+
 
 @final
-class TwoOptMove(SupportsApplyMove[Solution], SupportsObjectiveValueIncrement[Solution]):
+class TwoOptMove(
+    SupportsApplyMove[Solution],
+    SupportsObjectiveValueIncrement[Solution],
+    SupportsBoundedObjectiveValueIncrement[Solution],
+    SupportsTabuAttribute[Solution],
+    SupportsHashIncrement[Solution],
+    SupportsDistanceIncrement[Solution],
+):
     def __init__(self, neighbourhood: TwoOptNeighbourhood, ix: int, jx: int):
         self.neighbourhood = neighbourhood
         # ix and jx are indices
@@ -141,8 +313,14 @@ class TwoOptMove(SupportsApplyMove[Solution], SupportsObjectiveValueIncrement[So
         t = solution.tour
         solution.lb -= prob.dist[t[ix - 1]][t[ix]] + prob.dist[t[jx - 1]][t[jx % n]]
         solution.lb += prob.dist[t[ix - 1]][t[jx - 1]] + prob.dist[t[ix]][t[jx % n]]
+        # Update hashes, as the closing edge and the last city may change
+        h = solution.ehash ^ prob.edge_hash(t[-1], t[0]) ^ self.hash_increment(solution)
+        if jx == n:
+            solution.vhash ^= prob.zl[t[-1]] ^ prob.zl[t[ix]]
         # Update solution
+        solution.pos = None
         solution.tour[ix:jx] = solution.tour[ix:jx][::-1]
+        solution.ehash = h ^ prob.edge_hash(t[-1], t[0])
         return solution
 
     def objective_value_increment(self, solution: Solution) -> float:
@@ -154,6 +332,105 @@ class TwoOptMove(SupportsApplyMove[Solution], SupportsObjectiveValueIncrement[So
         incr -= prob.dist[t[ix - 1]][t[ix]] + prob.dist[t[jx - 1]][t[jx % n]]
         return incr
 
+    def bounded_objective_value_increment(self, solution: Solution, bound: float) -> float:
+        prob = solution.problem
+        n, ix, jx = prob.n, self.ix, self.jx
+        t = solution.tour
+        # Distances are non-negative, so the increment is greater than the bound as soon as the removed edges and
+        # some of the added ones are
+        incr = prob.dist[t[ix - 1]][t[jx - 1]] - prob.dist[t[ix - 1]][t[ix]] - prob.dist[t[jx - 1]][t[jx % n]]
+        if incr > bound:
+            return incr
+        return incr + prob.dist[t[ix]][t[jx % n]]
+
+    def tabu_attribute(self, solution: Solution) -> tuple[int, int]:
+        # Reversing the segment back has the same pair of end cities
+        a, b = solution.tour[self.ix], solution.tour[self.jx - 1]
+        return (a, b) if a < b else (b, a)
+
+    def hash_increment(self, solution: Solution) -> int:
+        prob = solution.problem
+        n, ix, jx = prob.n, self.ix, self.jx
+        t = solution.tour
+        incr = prob.edge_hash(t[ix - 1], t[jx - 1]) ^ prob.edge_hash(t[ix], t[jx % n])
+        incr ^= prob.edge_hash(t[ix - 1], t[ix]) ^ prob.edge_hash(t[jx - 1], t[jx % n])
+        return incr
+
+    def distance_increment(self, solution: Solution, target: Solution) -> int:
+        n, ix, jx = solution.problem.n, self.ix, self.jx
+        t = solution.tour
+        incr = target.has_edge(t[ix - 1], t[ix]) + target.has_edge(t[jx - 1], t[jx % n])
+        incr -= target.has_edge(t[ix - 1], t[jx - 1]) + target.has_edge(t[ix], t[jx % n])
+        return incr
+
+
+@final
+class OrOptMove(
+    SupportsApplyMove[Solution],
+    SupportsObjectiveValueIncrement[Solution],
+    SupportsBoundedObjectiveValueIncrement[Solution],
+):
+    def __init__(self, neighbourhood: OrOptNeighbourhood, ix: int, length: int, jx: int):
+        self.neighbourhood = neighbourhood
+        # The segment of the tour starting at index ix with the given
+        # length is moved to right after index jx
+        self.ix = ix
+        self.length = length
+        self.jx = jx
+
+    def _edges(self, solution: Solution) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
+        # Cities at the ends of the removed and added edges, respectively
+        n, ix, jx = solution.problem.n, self.ix, self.jx
+        t = solution.tour
+        p, s0, sl, nx = t[ix - 1], t[ix], t[ix + self.length - 1], t[(ix + self.length) % n]
+        a, b = t[jx], t[(jx + 1) % n]
+        return (p, s0, sl), (nx, a, b)
+
+    def apply_move(self, solution: Solution) -> Solution:
+        prob = solution.problem
+        ix, length, jx = self.ix, self.length, self.jx
+        t = solution.tour
+        (p, s0, sl), (nx, a, b) = self._edges(solution)
+        d = prob.dist
+        # Update tour length
+        solution.lb += d[p][nx] + d[a][s0] + d[sl][b] - d[p][s0] - d[sl][nx] - d[a][b]
+        # Update hashes, as the closing edge and the last city may change
+        h = solution.ehash ^ prob.edge_hash(t[-1], t[0])
+        h ^= prob.edge_hash(p, s0) ^ prob.edge_hash(sl, nx) ^ prob.edge_hash(a, b)
+        h ^= prob.edge_hash(p, nx) ^ prob.edge_hash(a, s0) ^ prob.edge_hash(sl, b)
+        last = t[-1]
+        # Update solution
+        solution.pos = None
+        seg = t[ix : ix + length]
+        if jx > ix:
+            t[ix : jx + 1] = t[ix + length : jx + 1] + seg
+        else:
+            t[jx + 1 : ix + length] = seg + t[jx + 1 : ix]
+        solution.vhash ^= prob.zl[last] ^ prob.zl[t[-1]]
+        solution.ehash = h ^ prob.edge_hash(t[-1], t[0])
+        return solution
+
+    def objective_value_increment(self, solution: Solution) -> float:
+        d = solution.problem.dist
+        (p, s0, sl), (nx, a, b) = self._edges(solution)
+        # Tour length increment
+        incr = d[p][nx] + d[a][s0] + d[sl][b]
+        incr -= d[p][s0] + d[sl][nx] + d[a][b]
+        return incr
+
+    def bounded_objective_value_increment(self, solution: Solution, bound: float) -> float:
+        d = solution.problem.dist
+        (p, s0, sl), (nx, a, b) = self._edges(solution)
+        # Distances are non-negative, so the increment is greater than the bound as soon as the removed edges and
+        # some of the added ones are
+        incr = d[p][nx] - d[p][s0] - d[sl][nx] - d[a][b]
+        if incr > bound:
+            return incr
+        incr += d[a][s0]
+        if incr > bound:
+            return incr
+        return incr + d[sl][b]
+
 
 # ------------------------------- Neighbourhood ------------------------------
 
@@ -166,15 +443,71 @@ class AddNeighbourhood(SupportsMoves[Solution, AddMove]):
     def moves(self, solution: Solution) -> Iterable[AddMove]:
         assert self.problem == solution.problem
         i = solution.tour[-1]
-        for j in solution.not_visited:
+        # Sort the cities, since the iteration order of a set depends on its history and may change when it is copied
+        # or pickled
+        for j in sorted(solution.not_visited):
             yield AddMove(self, i, j)
 
 
+@final
+class RemoveNeighbourhood(SupportsRandomMove[Solution, RemoveMove]):
+    def __init__(self, problem: Problem):
+        self.problem = problem
+
+    def random_move(self, solution: Solution) -> Optional[RemoveMove]:
+        assert self.problem == solution.problem
+        # The first city is never removed
+        if len(solution.tour) < 2:
+            return None
+        return RemoveMove(self, random.randrange(1, len(solution.tour)))
+
+
+@final
+class InsertNeighbourhood(SupportsMoves[Solution, InsertMove], SupportsMovesDelta[Solution, InsertMove]):
+    """
+    Neighbourhood inserting an unvisited city between any two consecutive
+    cities of a partial tour, or at its end, which can undo any sequence
+    of removals
+    """
+
+    def __init__(self, problem: Problem):
+        self.problem = problem
+
+    def moves(self, solution: Solution) -> Iterable[InsertMove]:
+        assert self.problem == solution.problem
+        t = solution.tour
+        for j in sorted(solution.not_visited):
+            for ix in range(len(t) - 1):
+                yield InsertMove(self, t[ix], j, t[ix + 1])
+            yield InsertMove(self, t[-1], j, None)
+
+    def moves_delta(self, solution: Solution, move: InsertMove) -> tuple[Iterable[InsertMove], Iterable[InsertMove]]:
+        assert self.problem == solution.problem
+        i, j, k = move.i, move.j, move.k
+        t = solution.tour
+        rest = sorted(solution.not_visited)
+        # Moves of the inserted city, and moves into the edge it split
+        removed = [InsertMove(self, t[ix], j, t[ix + 1]) for ix in range(len(t) - 1)]
+        removed += [move, InsertMove(self, t[-1], j, None)]
+        removed += [InsertMove(self, i, c, k) for c in rest]
+        if len(rest) == 1:
+            # Closing the tour changes all the increments of the last city
+            added = list(self.moves(solution))
+            return removed + added, added
+        # Moves into the two new edges, or after the new last city
+        added = [InsertMove(self, i, c, j) for c in rest]
+        added += [InsertMove(self, j, c, k) for c in rest]
+        return removed, added
+
+
 @final
 class TwoOptNeighbourhood(
     SupportsMoves[Solution, TwoOptMove],
     SupportsRandomMovesWithoutReplacement[Solution, TwoOptMove],
     SupportsRandomMove[Solution, TwoOptMove],
+    SupportsMoveCount[Solution],
+    SupportsMovesRange[Solution, TwoOptMove],
+    SupportsObjectiveValueIncrements[Solution],
 ):
     def __init__(self, problem: Problem):
         self.problem = problem
@@ -229,6 +562,97 @@ class TwoOptNeighbourhood(
     def random_move(self, solution: Solution) -> Optional[TwoOptMove]:
         return next(iter(self.random_moves_without_replacement(solution)), None)
 
+    def move_count(self, solution: Solution) -> int:
+        n = self.problem.n
+        return n * (n - 3) // 2
+
+    def moves_range(self, solution: Solution, start: int, stop: int) -> Iterable[TwoOptMove]:
+        assert self.problem == solution.problem
+        n = self.problem.n
+        assert solution.is_feasible
+        # Moves are numbered as in random_moves_without_replacement, but
+        # (a, b) is only computed for the first one and then incremented
+        a = (1 + math.isqrt(1 + 8 * start)) // 2
+        b = start - a * (a - 1) // 2
+        for _ in range(start, stop):
+            ix, jx = b + 1, a + 2
+            # Handle special case
+            if ix == 1 and jx == n:
+                ix = n - 2
+            yield TwoOptMove(self, ix, jx)
+            b += 1
+            if b == a:
+                a += 1
+                b = 0
+
+    def objective_value_increments(self, solution: Solution) -> list[int]:
+        assert self.problem == solution.problem
+        n = self.problem.n
+        assert solution.is_feasible
+        d = self.problem.dist
+        t = solution.tour
+        # Length of the edge ending at each index
+        e = [d[t[ix - 1]][t[ix]] for ix in range(n)]
+        # Increments are listed in the order of moves_range, that is, for
+        # each jx, for each ix < jx - 1. The symmetry of the distances is
+        # used to look up a single row of the matrix for each jx
+        incrs: list[int] = []
+        for jx in range(3, n + 1):
+            d1, d2, ej = d[t[jx - 1]], d[t[jx % n]], e[jx % n]
+            incrs.extend([d1[t[ix - 1]] + d2[t[ix]] - e[ix] - ej for ix in range(1, jx - 1)])
+        # Handle special case
+        incrs[(n - 2) * (n - 3) // 2] = incrs[-1]
+        del incrs[-1]
+        return incrs
+
+
+@final
+class OrOptNeighbourhood(
+    SupportsMoves[Solution, OrOptMove],
+    SupportsRandomMovesWithoutReplacement[Solution, OrOptMove],
+    SupportsRandomMove[Solution, OrOptMove],
+):
+    """
+    Moves segments of up to `max_length` consecutive cities elsewhere in
+    the tour
+    """
+
+    def __init__(self, problem: Problem, max_length: int = 3):
+        self.problem = problem
+        self.max_length = max_length
+
+    def _move(self, length: int, ix: int, jx: int) -> Optional[OrOptMove]:
+        # The segment may not contain the first city, and inserting it
+        # right after the city before it would not change the tour
+        if ix < 1 or ix + length > self.problem.n or ix - 1 <= jx < ix + length:
+            return None
+        return OrOptMove(self, ix, length, jx)
+
+    def moves(self, solution: Solution) -> Iterable[OrOptMove]:
+        assert self.problem == solution.problem
+        n = self.problem.n
+        # This is only meant to be used as a local neighbourhood, so solution should be feasible
+        assert solution.is_feasible
+        for length in range(1, self.max_length + 1):
+            for ix in range(1, n - length + 1):
+                for jx in range(n):
+                    move = self._move(length, ix, jx)
+                    if move is not None:
+                        yield move
+
+    def random_moves_without_replacement(self, solution: Solution) -> Iterable[OrOptMove]:
+        assert self.problem == solution.problem
+        n = self.problem.n
+        assert solution.is_feasible
+        # Sample triples (length, ix, jx) at random, skipping invalid ones
+        for x in sparse_fisher_yates_iter(self.max_length * n * n):
+            move = self._move(x // (n * n) + 1, x // n % n, x % n)
+            if move is not None:
+                yield move
+
+    def random_move(self, solution: Solution) -> Optional[OrOptMove]:
+        return next(iter(self.random_moves_without_replacement(solution)), None)
+
 
 # ---------------------------------- Problem --------------------------------
 
@@ -236,16 +660,49 @@ class TwoOptNeighbourhood(
 @final
 class Problem(
     SupportsConstructionNeighbourhood[AddNeighbourhood],
+    SupportsDestructionNeighbourhood[RemoveNeighbourhood],
     SupportsLocalNeighbourhood[TwoOptNeighbourhood],
+    SupportsLocalNeighbourhoods[TwoOptNeighbourhood | OrOptNeighbourhood],
     SupportsEmptySolution[Solution],
     SupportsRandomSolution[Solution],
 ):
-    def __init__(self, dist: tuple[tuple[int, ...], ...], name: str):
-        self.dist = tuple(tuple(t) for t in dist)
+    def __init__(
+        self,
+        dist: Sequence[Sequence[int]],
+        name: str,
+        key: Optional[str] = None,
+        path: Optional[str] = None,
+        shm: Optional[SharedMemory] = None,
+    ):
+        self.dist = dist
         self.name = name
         self.n = len(self.dist)
+        # Binary file or shared memory segment the distances are mapped
+        # from, if any
+        self.path = path
+        self.shm = shm
         self.c_nbhood: Optional[AddNeighbourhood] = None
+        self.d_nbhood: Optional[RemoveNeighbourhood] = None
+        self.r_nbhood: Optional[InsertNeighbourhood] = None
         self.l_nbhood: Optional[TwoOptNeighbourhood] = None
+        self.o_nbhood: Optional[OrOptNeighbourhood] = None
+        self.key = uuid.uuid4().hex if key is None else key
+        _problems[self.key] = self
+        # Zobrist keys for hashing solutions, drawn with a fixed seed so
+        # that copies of the problem hash solutions in the same way
+        rng = random.Random(0)
+        self.zc = [rng.getrandbits(64) for _ in range(self.n)]
+        self.zl = [rng.getrandbits(64) for _ in range(self.n)]
+        self.ze = [rng.getrandbits(64) | 1 for _ in range(self.n)]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self.path is not None:
+            # Map the file again instead of copying the distances
+            return (_unpickle_problem, (self.key, None, self.name, self.path))
+        if self.shm is not None:
+            # Attach to the segment instead of copying the distances
+            return (_unpickle_problem, (self.key, None, self.name, None, self.shm.name))
+        return (_unpickle_problem, (self.key, self.dist, self.name, None))
 
     def __str__(self) -> str:
         out: list[str] = []
@@ -253,54 +710,145 @@ class Problem(
             out.append(" ".join(map(str, row)))
         return "\n".join(out)
 
+    def edge_hash(self, i: int, j: int) -> int:
+        return ((self.ze[i] * self.ze[j]) >> 32) & 0xFFFFFFFFFFFFFFFF
+
+    def tour_hashes(self, tour: list[int]) -> tuple[int, int]:
+        vhash = self.zl[tour[-1]]
+        ehash = 0
+        for ix in range(len(tour)):
+            vhash ^= self.zc[tour[ix]]
+            if ix > 0:
+                ehash ^= self.edge_hash(tour[ix - 1], tour[ix])
+        return vhash, ehash
+
     def construction_neighbourhood(self) -> AddNeighbourhood:
         if self.c_nbhood is None:
             self.c_nbhood = AddNeighbourhood(self)
         return self.c_nbhood
 
+    def destruction_neighbourhood(self) -> RemoveNeighbourhood:
+        if self.d_nbhood is None:
+            self.d_nbhood = RemoveNeighbourhood(self)
+        return self.d_nbhood
+
+    def repair_neighbourhood(self) -> InsertNeighbourhood:
+        # Construction neighbourhood for lns, since cities removed by the
+        # destruction neighbourhood can only be inserted back in place
+        if self.r_nbhood is None:
+            self.r_nbhood = InsertNeighbourhood(self)
+        return self.r_nbhood
+
     def local_neighbourhood(self) -> TwoOptNeighbourhood:
         if self.l_nbhood is None:
             self.l_nbhood = TwoOptNeighbourhood(self)
         return self.l_nbhood
 
+    def local_neighbourhoods(self) -> list[TwoOptNeighbourhood | OrOptNeighbourhood]:
+        # 2-opt has about n**2/2 moves, and Or-opt about 3*n**2
+        if self.o_nbhood is None:
+            self.o_nbhood = OrOptNeighbourhood(self)
+        return [self.local_neighbourhood(), self.o_nbhood]
+
     @classmethod
     def from_textio(cls, f: TextIO) -> Self:
         """
         Create a problem from a text I/O source `f` in TSPLIB format
+
+        Supported edge weight types are EUC_2D, ATT, GEO and EXPLICIT,
+        the latter in the FULL_MATRIX, UPPER_ROW, LOWER_ROW,
+        UPPER_DIAG_ROW and LOWER_DIAG_ROW formats. Data sections are
+        read in chunks and stored in typed arrays. Each chunk is still
+        split into a list of tokens that are converted one at a time,
+        since the standard library has no bulk conversion from text,
+        so large instances are best converted once with `to_binary`
+        and loaded with `from_binary`.
         """
         s = f.readline().strip()
         n = None
         dt = None
+        fmt = None
         name = "unnamed"
-        while s != "NODE_COORD_SECTION" and s != "":
+        while not s.endswith("_SECTION") and s != "" and s != "EOF":
             line = s.split(":", 1)
             k = line[0].strip()
             if k == "DIMENSION":
                 n = int(line[1])
             elif k == "EDGE_WEIGHT_TYPE":
                 dt = line[1].strip()
+            elif k == "EDGE_WEIGHT_FORMAT":
+                fmt = line[1].strip()
             elif k == "NAME":
                 name = line[1].strip()
             s = f.readline().strip()
-        if n is not None and dt == "EUC_2D":
-            kxy: list[tuple[float, ...]] = []
-            for i in range(n):
-                kxy.append(tuple(map(float, f.readline().split())))
-            kxy = sorted(kxy)
-            dist: list[tuple[int, ...]] = []
-            for i in range(n):
-                if kxy[i][0] != i + 1:
-                    raise Exception("Invalid instance")
-                aux: list[int] = []
-                for j in range(n):
-                    aux.append(int(0.5 + math.sqrt((kxy[i][1] - kxy[j][1]) ** 2 + (kxy[i][2] - kxy[j][2]) ** 2)))
-                dist.append(tuple(aux))
-            return cls(tuple(dist), name)
+        if n is None:
+            raise Exception("Instance dimension not given")
+        if dt in _COORD_DISTANCES and s == "NODE_COORD_SECTION":
+            return cls(_coord_distances(_Tokens(f), n, dt), name)
+        elif dt == "EXPLICIT" and s == "EDGE_WEIGHT_SECTION":
+            return cls(_explicit_distances(_Tokens(f), n, fmt), name)
         else:
             raise Exception(f"Instance format {dt} not supported")
 
+    @classmethod
+    def from_binary(cls, path: str) -> Self:
+        """
+        Create a problem by memory-mapping a file written by
+        `to_binary`, which takes constant time and memory
+        """
+        dist, name = _map_binary(path)
+        return cls(dist, name, path=path)
+
+    @classmethod
+    def from_file(cls, path: str) -> Self:
+        """
+        Create a problem from a file in either TSPLIB or binary format
+        """
+        with open(path, "rb") as f:
+            binary = f.read(len(_MAGIC)) == _MAGIC
+        if binary:
+            return cls.from_binary(path)
+        with open(path) as f:
+            return cls.from_textio(f)
+
+    def to_binary(self, path: str) -> None:
+        """
+        Write the problem to `path` in a binary form that can be
+        memory-mapped by `from_binary`
+        """
+        with open(path, "wb") as f:
+            f.write(self._binary_header())
+            for row in self.dist:
+                f.write(array("i", row).tobytes())
+
+    def to_shared_memory(self, segments: SharedSegments) -> Self:
+        """
+        Create a copy of the problem whose distances are stored in a
+        shared memory segment owned by `segments`, in the same form as
+        written by `to_binary`. Pickling the copy only sends the name
+        of the segment, which worker processes attach to without
+        copying the distances.
+        """
+        header = self._binary_header()
+        n = self.n
+        shm = segments.create(len(header) + 4 * n * n)
+        buf = shm.buf
+        assert buf is not None
+        buf[: len(header)] = header
+        mv = buf[len(header) : len(header) + 4 * n * n].cast("i")
+        for i, row in enumerate(self.dist):
+            mv[i * n : (i + 1) * n] = array("i", row)
+        mv.release()
+        dist, name = _parse_binary(buf)
+        return self.__class__(dist, name, shm=shm)
+
+    def _binary_header(self) -> bytes:
+        name = self.name.encode()
+        header = struct.pack("<8sqq", _MAGIC, self.n, len(name)) + name
+        return header + bytes(-len(header) % 8)
+
     def empty_solution(self) -> Solution:
-        return Solution(self, [0], set(range(1, self.n)), 0)
+        return Solution(self, [0], set(range(1, self.n)), 0, *self.tour_hashes([0]))
 
     def random_solution(self) -> Solution:
         c = list(range(1, self.n))
@@ -309,7 +857,173 @@ class Problem(
         obj = self.dist[c[-1]][c[0]]
         for ix in range(1, self.n):
             obj += self.dist[c[ix - 1]][c[ix]]
-        return Solution(self, c, set(), obj)
+        return Solution(self, c, set(), obj, *self.tour_hashes(c))
+
+
+# Problems are unpickled to an existing object with the same key, if there is
+# one, so that solutions sent back by a process pool refer to the original
+# problem and the identity checks above hold
+_problems: weakref.WeakValueDictionary[str, Problem] = weakref.WeakValueDictionary()
+
+
+def _unpickle_problem(
+    key: str, dist: Optional[Sequence[Sequence[int]]], name: str, path: Optional[str], shm_name: Optional[str] = None
+) -> Problem:
+    problem = _problems.get(key)
+    if problem is None:
+        shm = None
+        if path is not None:
+            dist, name = _map_binary(path)
+        elif shm_name is not None:
+            shm = attach(shm_name)
+            assert shm.buf is not None
+            dist, name = _parse_binary(shm.buf)
+        assert dist is not None
+        problem = Problem(dist, name, key, path, shm)
+    return problem
+
+
+# ------------------------------ Instance loading -----------------------------
+
+_CHUNK_SIZE = 1 << 20
+
+_MAGIC = b"TSPDIST1"
+
+
+class _Tokens:
+    """
+    Reader of whitespace-separated numbers from a text I/O source,
+    which reads the source in chunks of `_CHUNK_SIZE` characters
+
+    The tokens of a chunk are kept in a list of strings and converted
+    one by one into the array returned by `read`, so the temporary
+    objects are bounded by the chunk size, not by the instance size.
+    """
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.tokens: list[str] = []
+        self.pos = 0
+        self.tail = ""
+
+    def _fill(self) -> None:
+        chunk = self.f.read(_CHUNK_SIZE)
+        if chunk == "":
+            if self.tail == "":
+                raise Exception("Unexpected end of instance")
+            self.tokens = [self.tail]
+            self.tail = ""
+        else:
+            chunk = self.tail + chunk
+            self.tokens = chunk.split()
+            # The last token may continue in the next chunk
+            self.tail = "" if chunk[-1].isspace() else self.tokens.pop()
+        self.pos = 0
+
+    def read(self, count: int, typecode: str = "i") -> array[Any]:
+        conv: Callable[[str], Any] = float if typecode == "d" else int
+        out = array(typecode)
+        while count > 0:
+            if self.pos == len(self.tokens):
+                self._fill()
+            k = min(count, len(self.tokens) - self.pos)
+            out.extend(map(conv, self.tokens[self.pos : self.pos + k]))
+            self.pos += k
+            count -= k
+        return out
+
+
+def _euc_2d(xi: float, yi: float, xj: float, yj: float) -> int:
+    return int(0.5 + math.sqrt((xi - xj) ** 2 + (yi - yj) ** 2))
+
+
+def _att(xi: float, yi: float, xj: float, yj: float) -> int:
+    r = math.sqrt(((xi - xj) ** 2 + (yi - yj) ** 2) / 10.0)
+    t = int(0.5 + r)
+    return t + 1 if t < r else t
+
+
+def _geo_radians(x: float) -> float:
+    # Degrees are truncated as in the reference implementations, which
+    # the optimal values in TSPLIB were computed with
+    deg = int(x)
+    return 3.141592 * (deg + 5.0 * (x - deg) / 3.0) / 180.0
+
+
+def _geo(lat_i: float, lon_i: float, lat_j: float, lon_j: float) -> int:
+    # Coordinates are already converted to radians by _coord_distances
+    q1 = math.cos(lon_i - lon_j)
+    q2 = math.cos(lat_i - lat_j)
+    q3 = math.cos(lat_i + lat_j)
+    return int(6378.388 * math.acos(max(-1.0, min(1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))) + 1.0)
+
+
+_COORD_DISTANCES: dict[str, Callable[[float, float, float, float], int]] = {
+    "EUC_2D": _euc_2d,
+    "ATT": _att,
+    "GEO": _geo,
+}
+
+
+def _coord_distances(tokens: _Tokens, n: int, dt: str) -> list[array[int]]:
+    data = tokens.read(3 * n, "d")
+    ids = data[0::3]
+    xs = data[1::3]
+    ys = data[2::3]
+    if sorted(ids) != [float(i + 1) for i in range(n)]:
+        raise Exception("Invalid instance")
+    order = sorted(range(n), key=ids.__getitem__)
+    xs = array("d", (xs[i] for i in order))
+    ys = array("d", (ys[i] for i in order))
+    if dt == "GEO":
+        xs = array("d", map(_geo_radians, xs))
+        ys = array("d", map(_geo_radians, ys))
+    d = _COORD_DISTANCES[dt]
+    dist: list[array[int]] = []
+    for i in range(n):
+        xi, yi = xs[i], ys[i]
+        row = array("i", (d(xi, yi, xj, yj) for xj, yj in zip(xs, ys)))
+        row[i] = 0
+        dist.append(row)
+    return dist
+
+
+def _explicit_distances(tokens: _Tokens, n: int, fmt: Optional[str]) -> list[array[int]]:
+    if fmt == "FULL_MATRIX":
+        return [tokens.read(n) for _ in range(n)]
+    # Fill a flat matrix with slice assignments, which mirror each row
+    # of the triangle into the corresponding column
+    flat = array("i", bytes(4 * n * n))
+    for i in range(n):
+        if fmt == "UPPER_ROW" or fmt == "UPPER_DIAG_ROW":
+            j = i + 1 if fmt == "UPPER_ROW" else i
+            vals = tokens.read(n - j)
+            flat[i * n + j : (i + 1) * n] = vals
+            flat[j * n + i :: n] = vals
+        elif fmt == "LOWER_ROW" or fmt == "LOWER_DIAG_ROW":
+            j = i if fmt == "LOWER_ROW" else i + 1
+            vals = tokens.read(j)
+            flat[i * n : i * n + j] = vals
+            flat[i : j * n : n] = vals
+        else:
+            raise Exception(f"Edge weight format {fmt} not supported")
+    return [flat[i * n : (i + 1) * n] for i in range(n)]
+
+
+def _map_binary(path: str) -> tuple[list[memoryview], str]:
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _parse_binary(memoryview(mm))
+
+
+def _parse_binary(buf: memoryview) -> tuple[list[memoryview], str]:
+    magic, n, k = struct.unpack_from("<8sqq", buf)
+    if magic != _MAGIC:
+        raise Exception("Invalid binary instance")
+    name = bytes(buf[24 : 24 + k]).decode()
+    offset = 24 + k + (-(24 + k) % 8)
+    mv = buf[offset : offset + 4 * n * n].cast("i")
+    return [mv[i * n : (i + 1) * n] for i in range(n)], name
 
 
 if __name__ == "__main__":
@@ -317,7 +1031,12 @@ if __name__ == "__main__":
 
     logging.basicConfig(stream=sys.stderr, level="INFO", format="%(levelname)s;%(asctime)s;%(message)s")
 
-    problem = Problem.from_textio(sys.stdin)
+    # Read the instance from the file given as argument, if any, which
+    # may also be in the binary format written by Problem.to_binary
+    if len(sys.argv) > 1:
+        problem = Problem.from_file(sys.argv[1])
+    else:
+        problem = Problem.from_textio(sys.stdin)
 
     # Run greedy construction to get an initial solution
     solution = alg.greedy_construction(problem)
@@ -330,6 +1049,9 @@ if __name__ == "__main__":
     # solution = alg.rls(problem, solution, 10.0)
     # solution = alg.best_improvement(problem, solution)
     # solution = alg.first_improvement(problem, solution)
+    # solution = alg.lns(problem, solution, 10.0, repair=problem.repair_neighbourhood())
+    # solution = alg.tabu_search(problem, solution, 10.0)
+    # solution = alg.vnd(problem, solution)
     log.info(f"Objective value after local search: {solution.objective_value()}")
 
     # Print the final solution to stdout
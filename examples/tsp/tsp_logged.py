@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import argparse
 import math
 import random
 import sys
@@ -31,6 +32,7 @@ from roar_net_api.operations import (
 )
 
 from roar_net_api.utils.logging import get_logged_problem, PerformanceLogger
+from roar_net_api.utils.result_cache import ResultCache, file_digest
 
 log = logging.getLogger(__name__)
 
@@ -317,6 +319,10 @@ class Problem(
 if __name__ == "__main__":
     import roar_net_api.algorithms as alg
 
+    parser = argparse.ArgumentParser(description="Run SA and RLS on the instances in instances/ and log their progress")
+    parser.add_argument("--cache", metavar="DIR", help="cache greedy constructions in DIR across invocations")
+    args = parser.parse_args()
+
     log.setLevel(logging.INFO)
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(levelname)s;%(asctime)s;%(message)s"))
@@ -324,17 +330,27 @@ if __name__ == "__main__":
 
     LoggedProblem = get_logged_problem(Problem, Solution)
     perflogger = PerformanceLogger("log_test.csv")
+    cache = None if args.cache is None else ResultCache(args.cache)
     for instance in glob("*.tsp", root_dir="instances"):
         problem = LoggedProblem.from_textio(open(f"instances/{instance}"))
         log.info(f"Read problem {problem.name} of size {problem.n}")
         perflogger.add_attribute("problem", problem.name)
         perflogger.add_attribute("n", problem.n)
+        # The greedy construction is deterministic, so it is only computed once and then copied for every run
+        if cache is None:
+            greedy = alg.greedy_construction(problem)
+        else:
+            greedy = cache.memoize(
+                problem,
+                ResultCache.key(file_digest(f"instances/{instance}"), "greedy_construction"),
+                lambda: alg.greedy_construction(problem),
+            )
 
         log.info("Starting SA runs")
         perflogger.add_attribute("algorithm", "SA")
         for rep in range(5):
             perflogger.reset()
-            solution = alg.greedy_construction(problem)
+            solution = greedy.copy_solution()
             solution = alg.sa(problem, solution, 3.0, 30.0)
             solution.objective_value()
             log.info(f"Objective value after local search: {solution.objective_value()}")
@@ -343,7 +359,7 @@ if __name__ == "__main__":
         perflogger.add_attribute("algorithm", "RLS")
         for rep in range(5):
             perflogger.reset()
-            solution = alg.greedy_construction(problem)
+            solution = greedy.copy_solution()
             solution = alg.rls(problem, solution, 3.0)
             solution.objective_value()
             log.info(f"Objective value after local search: {solution.objective_value()}")
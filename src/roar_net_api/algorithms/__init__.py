@@ -2,20 +2,41 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from .beam_search import beam_search
+from .beam_search import beam_search, beam_search_steps
 from .best_improvement import best_improvement
-from .first_improvement import first_improvement
-from .grasp import grasp
+from .branch_and_bound import branch_and_bound
+from .callbacks import Callbacks, Progress
+from .first_improvement import first_improvement, first_improvement_steps
+from .grasp import grasp, grasp_steps
 from .greedy_construction import greedy_construction
-from .rls import rls
-from .sa import sa
+from .lns import lns
+from .path_relinking import path_relinking
+from .rls import rls, rls_steps
+from .sa import sa, sa_steps
+from .tabu_search import tabu_search
+from .termination import StopReason, Termination
+from .vnd import vnd
 
 __all__ = [
+    "Callbacks",
+    "Progress",
+    "StopReason",
+    "Termination",
     "beam_search",
+    "beam_search_steps",
     "best_improvement",
+    "branch_and_bound",
     "first_improvement",
+    "first_improvement_steps",
     "grasp",
+    "grasp_steps",
     "greedy_construction",
+    "lns",
+    "path_relinking",
     "rls",
+    "rls_steps",
     "sa",
+    "sa_steps",
+    "tabu_search",
+    "vnd",
 ]
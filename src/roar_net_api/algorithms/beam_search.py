@@ -3,21 +3,31 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import bisect
-from collections.abc import Callable, Iterator
+import os
+from collections.abc import Callable, Generator, Hashable, Iterator
+from concurrent.futures import Executor
 from logging import getLogger
+from math import inf
 from operator import itemgetter
-from typing import Generic, Optional, Protocol, Self, TypeVar, Union
+from time import perf_counter
+from typing import Generic, Optional, Protocol, Self, TypeVar, Union, cast
 
 from ..operations import (
     SupportsApplyMove,
     SupportsConstructionNeighbourhood,
     SupportsCopySolution,
     SupportsEmptySolution,
+    SupportsHashIncrement,
     SupportsLowerBound,
     SupportsLowerBoundIncrement,
     SupportsMoves,
     SupportsObjectiveValue,
+    SupportsSolutionHash,
 )
+from ..utils.process_pool import submit
+from ..utils.stepwise import run_steps
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination
 
 log = getLogger(__name__)
 
@@ -41,6 +51,9 @@ class _Problem(
 
 BSList = list[tuple[Union[int, float], _TSolution]]
 
+# Lower bound, parent number, move number, move and hash of a candidate
+_Candidate = tuple[Union[int, float], int, int, _Move[_TSolution], int]
+
 
 class KeyProtocol(Protocol):
     def __lt__(self, value: Self, /) -> bool: ...
@@ -55,25 +68,46 @@ class KMin(Generic[Key, Value]):
     """
     Class to keep a set of the k min objects according to a key
     function
+
+    If an `ident` function is given, objects with the same identity
+    are considered duplicates, and only the one with the smallest key
+    is kept.
     """
 
-    def __init__(self, k: int, key: KeyFunc[Value, Key]):
+    def __init__(self, k: int, key: KeyFunc[Value, Key], ident: Optional[Callable[[Value], Hashable]] = None):
         self.k = k
         self.key = key
         self.keys: list[Key] = []
         self.values: list[Value] = []
+        self.ident = ident
+        self.idents: list[Hashable] = []
+        self.index: dict[Hashable, Key] = {}
 
     def insert(self, value: Value) -> None:
         key = self.key(value)
         if len(self.values) == self.k:
             if key > self.keys[-1]:
                 return
+        if self.ident is not None:
+            h = self.ident(value)
+            if h in self.index:
+                if not key < self.index[h]:
+                    return
+                j = self.idents.index(h)
+                del self.keys[j]
+                del self.values[j]
+                del self.idents[j]
+            self.index[h] = key
         i = bisect.bisect_right(self.keys, key)
         self.keys.insert(i, key)
         self.values.insert(i, value)
+        if self.ident is not None:
+            self.idents.insert(i, h)
         if len(self.values) > self.k:
             self.keys.pop()
             self.values.pop()
+            if self.ident is not None:
+                del self.index[self.idents.pop()]
 
     def __iter__(self) -> Iterator[Value]:
         return self.values.__iter__()
@@ -82,44 +116,213 @@ class KMin(Generic[Key, Value]):
         return self.values.__len__()
 
 
-def beam_search(problem: _Problem[_TSolution], solution: Optional[_TSolution] = None, bw: int = 10) -> _TSolution:
+def beam_search(
+    problem: _Problem[_TSolution],
+    solution: Optional[_TSolution] = None,
+    bw: int = 10,
+    termination: Optional[Termination] = None,
+    dedup: bool = False,
+    executor: Optional[Executor] = None,
+    partitions: Optional[int] = None,
+    incumbent: Optional[_TSolution] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> _TSolution:
+    """
+    Solves `problem` with beam search, keeping the `bw` partial solutions with the smallest lower bounds in each layer.
+
+    If `dedup` is true, solutions must support `solution_hash` and moves `hash_increment`. Candidates that lead to the
+    same solution hash are then considered duplicates, and only the one with the smallest lower bound is kept.
+
+    If `executor` is given, the parents of each layer are split into `partitions` contiguous groups (by default, one
+    per CPU) which are expanded by the executor. Each group only sends back its best `bw` candidates, which are merged
+    in their original order so that the result is the same as without an executor. A process pool must be created with
+    `roar_net_api.utils.process_pool.init_worker`, so that the problem is sent to each worker once. The parents and the
+    moves of the candidates are then pickled once per layer, with references to the problem in place of copies.
+
+    If a feasible `incumbent` is given, candidates whose lower bound is not smaller than the objective value of the
+    best solution found so far (initially, the incumbent) are pruned, and the incumbent is returned if nothing better
+    is found.
+
+    `callbacks.on_layer` is called after every layer with the partial solution with the smallest lower bound in it.
+    """
+    return run_steps(
+        beam_search_steps(problem, solution, bw, termination, dedup, executor, partitions, incumbent, callbacks)
+    )
+
+
+def beam_search_steps(
+    problem: _Problem[_TSolution],
+    solution: Optional[_TSolution] = None,
+    bw: int = 10,
+    termination: Optional[Termination] = None,
+    dedup: bool = False,
+    executor: Optional[Executor] = None,
+    partitions: Optional[int] = None,
+    incumbent: Optional[_TSolution] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> Generator[_TSolution, None, _TSolution]:
+    """
+    Step-wise version of `beam_search`.
+
+    Yields the best solution found so far after every layer of the search and returns it once no layer can be
+    expanded any further. Stagnation is only checked once a feasible solution has been found.
+    """
+    if termination is None:
+        termination = Termination()
+
+    _, _, on_improvement, on_layer = hooks(callbacks)
+
     neigh = problem.construction_neighbourhood()
 
     if solution is None:
         solution = problem.empty_solution()
 
-    best = solution
+    best = solution if incumbent is None else incumbent
     bestobj = best.objective_value()
+    if incumbent is not None:
+        assert bestobj is not None
+        if bestobj <= termination.target:
+            termination.stop(StopReason.TARGET)
+            return best
 
-    lb = best.lower_bound()
+    lb = solution.lower_bound()
 
-    if lb is None:
+    if lb is None or (incumbent is not None and bestobj is not None and lb >= bestobj):
+        termination.stop(StopReason.CONVERGED)
         return best
 
-    v: BSList[_TSolution] = [(lb, best)]
+    v: BSList[_TSolution] = [(lb, solution)]
+
+    if executor is not None and partitions is None:
+        partitions = os.cpu_count() or 1
 
+    evals = 0
+    layer = 0
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = perf_counter() + termination.max_time_without_improvement
     while True:
-        candidates = KMin[Union[int, float], tuple[Union[int, float], _TSolution, _Move[_TSolution]]](
-            bw, key=itemgetter(0)
-        )
-        for lb, s in v:
-            for m in neigh.moves(s):
-                incr = m.lower_bound_increment(s)
-                if incr is not None:
-                    candidates.insert((lb + incr, s, m))
+        bound = bestobj if incumbent is not None and bestobj is not None else inf
+        if executor is None:
+            candidates, n = _expand(neigh, v, 0, bw, dedup, bound)
+            evals += n
+        else:
+            assert partitions is not None
+            candidates, n = _expand_partitioned(problem, v, bw, dedup, bound, executor, partitions)
+            evals += n
 
         if len(candidates) == 0:
             break
 
+        parents = v
         v = []
-        for lb, s, m in candidates:
-            ns = s.copy_solution()
+        for lb, px, _, m, _ in candidates:
+            ns = parents[px][1].copy_solution()
             ns = m.apply_move(ns)
             v.append((lb, ns))
             obj = ns.objective_value()
             if obj is not None and (bestobj is None or obj < bestobj):
-                log.info(f"Best solution: {obj}")
+                log.info("Best solution: %s", obj)
                 best = ns
                 bestobj = obj
-
+                if on_improvement is not None:
+                    on_improvement(Progress(best, bestobj, evals))
+                stalled_evals = evals + termination.max_evals_without_improvement
+                stalled_time = perf_counter() + termination.max_time_without_improvement
+
+        layer += 1
+        if on_layer is not None:
+            on_layer(Progress(v[0][1], v[0][1].objective_value(), evals, layer=layer))
+
+        if bestobj is not None:
+            if bestobj <= termination.target:
+                termination.stop(StopReason.TARGET)
+                return best
+            if evals >= stalled_evals:
+                termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+                return best
+            if perf_counter() >= stalled_time:
+                termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+                return best
+
+        paused = perf_counter()
+        yield best
+        stalled_time += perf_counter() - paused
+
+    termination.stop(StopReason.CONVERGED)
     return best
+
+
+def _expand(
+    neigh: _Neighbourhood[_TSolution],
+    parents: BSList[_TSolution],
+    first: int,
+    bw: int,
+    dedup: bool,
+    bound: Union[int, float],
+) -> tuple[KMin[Union[int, float], _Candidate[_TSolution]], int]:
+    """
+    Returns the best `bw` candidates with a lower bound smaller than `bound` obtained by expanding `parents`, numbered
+    from `first`, together with the number of evaluated moves.
+    """
+    candidates = KMin[Union[int, float], _Candidate[_TSolution]](
+        bw, key=itemgetter(0), ident=itemgetter(4) if dedup else None
+    )
+    evals = 0
+    for px, (lb, s) in enumerate(parents, first):
+        sh = cast(SupportsSolutionHash, s).solution_hash() if dedup else 0
+        for mx, m in enumerate(neigh.moves(s)):
+            incr = m.lower_bound_increment(s)
+            evals += 1
+            if incr is not None and lb + incr < bound:
+                h = sh ^ cast(SupportsHashIncrement[_TSolution], m).hash_increment(s) if dedup else 0
+                candidates.insert((lb + incr, px, mx, m, h))
+    return candidates, evals
+
+
+def _expand_group(
+    problem: _Problem[_TSolution],
+    parents: BSList[_TSolution],
+    first: int,
+    bw: int,
+    dedup: bool,
+    bound: Union[int, float],
+) -> tuple[KMin[Union[int, float], _Candidate[_TSolution]], int]:
+    return _expand(problem.construction_neighbourhood(), parents, first, bw, dedup, bound)
+
+
+def _expand_partitioned(
+    problem: _Problem[_TSolution],
+    parents: BSList[_TSolution],
+    bw: int,
+    dedup: bool,
+    bound: Union[int, float],
+    executor: Executor,
+    partitions: int,
+) -> tuple[KMin[Union[int, float], _Candidate[_TSolution]], int]:
+    n = len(parents)
+    bounds = [n * i // partitions for i in range(partitions + 1)]
+    futures = [
+        submit(
+            executor, problem, _expand_group, problem, parents[bounds[i] : bounds[i + 1]], bounds[i], bw, dedup, bound
+        )
+        for i in range(partitions)
+        if bounds[i] < bounds[i + 1]
+    ]
+
+    evals = 0
+    local: list[_Candidate[_TSolution]] = []
+    for f in futures:
+        cands, e = f.result()
+        local.extend(cands)
+        evals += e
+
+    # Inserting the candidates in the order in which they were generated breaks ties exactly as if all parents had
+    # been expanded in a single group. Every candidate that the single group would keep is among the best `bw` of its
+    # own group, so nothing is lost by discarding the others early.
+    local.sort(key=itemgetter(1, 2))
+    candidates = KMin[Union[int, float], _Candidate[_TSolution]](
+        bw, key=itemgetter(0), ident=itemgetter(4) if dedup else None
+    )
+    for c in local:
+        candidates.insert(c)
+    return candidates, evals
@@ -2,16 +2,22 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import Iterable
+import os
+from concurrent.futures import Executor
 from logging import getLogger
-from typing import Protocol, TypeVar, Union
+from typing import Optional, Protocol, TypeVar, Union, cast
 
 from ..operations import (
     SupportsApplyMove,
     SupportsLocalNeighbourhood,
+    SupportsMoveCount,
     SupportsMoves,
+    SupportsMovesRange,
     SupportsObjectiveValueIncrement,
 )
+from ..utils.process_pool import submit
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination, objective_value
 
 log = getLogger(__name__)
 
@@ -25,37 +31,136 @@ class _Move(SupportsApplyMove[_TSolution], SupportsObjectiveValueIncrement[_TSol
 class _Neighbourhood(SupportsMoves[_TSolution, _Move[_TSolution]], Protocol): ...
 
 
-class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
+class _PartitionedNeighbourhood(
+    _Neighbourhood[_TSolution],
+    SupportsMoveCount[_TSolution],
+    SupportsMovesRange[_TSolution, _Move[_TSolution]],
+    Protocol,
+): ...
 
 
-def best_improvement(problem: _Problem[_TSolution], solution: _TSolution) -> _TSolution:
-    neigh = problem.local_neighbourhood()
+class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
 
-    move_iter = iter(_valid_moves_and_increments(neigh, solution))
-    move_and_incr = next(move_iter, None)
-    while move_and_incr is not None:
-        best_move, best_incr = move_and_incr
 
-        for move, incr in move_iter:
-            if incr < best_incr:
-                best_move = move
-                best_incr = incr
+def best_improvement(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    termination: Optional[Termination] = None,
+    executor: Optional[Executor] = None,
+    partitions: Optional[int] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> _TSolution:
+    """
+    Solves `problem` by repeatedly applying the best improving move to `solution`.
 
-        log.info(f"Best increment: {best_incr}")
+    If `executor` is given, the local neighbourhood must also support `move_count` and `moves_range`. It is then split
+    into `partitions` disjoint ranges (by default, one per CPU) which are scanned by the executor against the same
+    solution, and the best moves of each range are reduced before applying the overall best. Ties are broken in favour
+    of the lowest move number. A process pool must be created with `roar_net_api.utils.process_pool.init_worker`, so
+    that the problem is sent to each worker once, and only the solution and the range are pickled per task.
 
-        solution = best_move.apply_move(solution)
+    Note: since every iteration improves the solution, only the target value of `termination` applies.
+    """
+    if termination is None:
+        termination = Termination()
 
-        move_iter = iter(_valid_moves_and_increments(neigh, solution))
-        move_and_incr = next(move_iter, None)
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
 
+    neigh = problem.local_neighbourhood()
+
+    obj = objective_value(solution)
+    if obj is not None and obj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return solution
+
+    if executor is None:
+        best_move, evals = _best_move(neigh, solution)
+    else:
+        pneigh = cast(_PartitionedNeighbourhood[_TSolution], neigh)
+        if partitions is None:
+            partitions = os.cpu_count() or 1
+        best_move, evals = _best_move_partitioned(problem, pneigh, solution, executor, partitions)
+
+    while best_move is not None:
+        move, incr = best_move
+
+        log.info("Best increment: %s", incr)
+
+        solution = move.apply_move(solution)
+
+        if obj is not None:
+            obj += incr
+        if on_accept is not None:
+            on_accept(Progress(solution, obj, evals))
+        if on_improvement is not None:
+            on_improvement(Progress(solution, obj, evals))
+        if on_iteration is not None:
+            on_iteration(Progress(solution, obj, evals))
+        if obj is not None and obj <= termination.target:
+            termination.stop(StopReason.TARGET)
+            return solution
+
+        if executor is None:
+            best_move, count = _best_move(neigh, solution)
+        else:
+            assert partitions is not None
+            best_move, count = _best_move_partitioned(problem, pneigh, solution, executor, partitions)
+        evals += count
+
+    termination.stop(StopReason.CONVERGED)
     return solution
 
 
-def _valid_moves_and_increments(
+def _best_move(
     neigh: _Neighbourhood[_TSolution], solution: _TSolution
-) -> Iterable[tuple[_Move[_TSolution], Union[int, float]]]:
+) -> tuple[Optional[tuple[_Move[_TSolution], Union[int, float]]], int]:
+    best: Optional[tuple[_Move[_TSolution], Union[int, float]]] = None
+    count = 0
     for move in neigh.moves(solution):
         incr = move.objective_value_increment(solution)
         assert incr is not None
-        if incr < 0:
-            yield (move, incr)
+        count += 1
+        if incr < 0 and (best is None or incr < best[1]):
+            best = (move, incr)
+    return best, count
+
+
+def _best_move_partitioned(
+    problem: _Problem[_TSolution],
+    neigh: _PartitionedNeighbourhood[_TSolution],
+    solution: _TSolution,
+    executor: Executor,
+    partitions: int,
+) -> tuple[Optional[tuple[_Move[_TSolution], Union[int, float]]], int]:
+    n = neigh.move_count(solution)
+    bounds = [n * i // partitions for i in range(partitions + 1)]
+    futures = [
+        submit(executor, problem, _best_in_range, problem, solution, bounds[i], bounds[i + 1])
+        for i in range(partitions)
+        if bounds[i] < bounds[i + 1]
+    ]
+
+    best: Optional[tuple[Union[int, float], int]] = None
+    for f in futures:
+        res = f.result()
+        if res is not None and (best is None or res[0] < best[0]):
+            best = res
+    if best is None:
+        return None, n
+
+    # Only the move number is sent back by the workers, so rebuild the move here
+    best_incr, ix = best
+    return (next(iter(neigh.moves_range(solution, ix, ix + 1))), best_incr), n
+
+
+def _best_in_range(
+    problem: _Problem[_TSolution], solution: _TSolution, start: int, stop: int
+) -> Optional[tuple[Union[int, float], int]]:
+    neigh = cast(_PartitionedNeighbourhood[_TSolution], problem.local_neighbourhood())
+    best: Optional[tuple[Union[int, float], int]] = None
+    for ix, move in enumerate(neigh.moves_range(solution, start, stop), start):
+        incr = move.objective_value_increment(solution)
+        assert incr is not None
+        if incr < 0 and (best is None or incr < best[0]):
+            best = (incr, ix)
+    return best
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+from logging import getLogger
+from math import inf
+from time import perf_counter
+from typing import Optional, Protocol, TypeVar, Union
+
+from ..operations import (
+    SupportsApplyMove,
+    SupportsConstructionNeighbourhood,
+    SupportsCopySolution,
+    SupportsEmptySolution,
+    SupportsLowerBound,
+    SupportsLowerBoundIncrement,
+    SupportsMoves,
+    SupportsObjectiveValue,
+)
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination
+
+log = getLogger(__name__)
+
+
+class _Solution(SupportsLowerBound, SupportsObjectiveValue, SupportsCopySolution, Protocol): ...
+
+
+_TSolution = TypeVar("_TSolution", bound=_Solution)
+
+
+class _Move(SupportsLowerBoundIncrement[_TSolution], SupportsApplyMove[_TSolution], Protocol): ...
+
+
+class _Neighbourhood(SupportsMoves[_TSolution, _Move[_TSolution]], Protocol): ...
+
+
+class _Problem(
+    SupportsConstructionNeighbourhood[_Neighbourhood[_TSolution]], SupportsEmptySolution[_TSolution], Protocol
+): ...
+
+
+# Lower bound, node number and partial solution
+_Node = tuple[Union[int, float], int, _TSolution]
+
+
+def branch_and_bound(
+    problem: _Problem[_TSolution],
+    solution: Optional[_TSolution] = None,
+    incumbent: Optional[_TSolution] = None,
+    best_first: bool = False,
+    max_nodes: Optional[int] = None,
+    max_open: Optional[int] = None,
+    termination: Optional[Termination] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> Optional[_TSolution]:
+    """
+    Solves `problem` with branch-and-bound over the construction neighbourhood, starting from `solution` (or an empty
+    solution).
+
+    Nodes are expanded depth-first, children in increasing order of lower bound, or best-first if `best_first` is
+    true. Children whose lower bound is not smaller than the objective value of the best solution found so far are
+    pruned. Giving a feasible `incumbent`, e.g., one found by `greedy_construction`, allows pruning from the start.
+
+    At most `max_nodes` nodes are expanded. If the open list grows beyond `max_open` nodes, its worse half (by lower
+    bound) is discarded. A search that runs out of nodes stops with `StopReason.CONVERGED`, and the returned solution is
+    then optimal, or with `StopReason.TRIMMED` if the open list was trimmed on the way, in which case it may not be.
+    Returns `None` if no feasible solution was found.
+    """
+    if termination is None:
+        termination = Termination()
+
+    on_iteration, _, on_improvement, _ = hooks(callbacks)
+
+    neigh = problem.construction_neighbourhood()
+
+    if solution is None:
+        solution = problem.empty_solution()
+
+    best = incumbent
+    bestobj: Union[int, float] = inf
+    if incumbent is not None:
+        obj = incumbent.objective_value()
+        assert obj is not None
+        bestobj = obj
+        if bestobj <= termination.target:
+            termination.stop(StopReason.TARGET)
+            return best
+
+    lb = solution.lower_bound()
+    if lb is None or lb >= bestobj:
+        termination.stop(StopReason.CONVERGED)
+        return best
+
+    count = 0
+    open_list: list[_Node[_TSolution]] = [(lb, count, solution)]
+    trimmed = False
+
+    nodes = 0
+    evals = 0
+    start = perf_counter()
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = start + termination.max_time_without_improvement
+    while len(open_list) > 0:
+        if max_nodes is not None and nodes >= max_nodes:
+            termination.stop(StopReason.BUDGET)
+            return best
+
+        if best_first:
+            lb, _, s = heapq.heappop(open_list)
+        else:
+            lb, _, s = open_list.pop()
+        # The incumbent may have improved since the node was generated
+        if lb >= bestobj:
+            continue
+        nodes += 1
+
+        children: list[tuple[Union[int, float], _Move[_TSolution]]] = []
+        for m in neigh.moves(s):
+            incr = m.lower_bound_increment(s)
+            evals += 1
+            if incr is not None and lb + incr < bestobj:
+                children.append((lb + incr, m))
+        children.sort(key=lambda c: c[0], reverse=not best_first)
+        if on_iteration is not None:
+            on_iteration(Progress(s, None, evals))
+
+        for clb, m in children:
+            if clb >= bestobj:
+                continue
+            ns = m.apply_move(s.copy_solution())
+            obj = ns.objective_value()
+            if obj is not None:
+                if obj < bestobj:
+                    log.info("Best solution: %s", obj)
+                    best = ns
+                    bestobj = obj
+                    if on_improvement is not None:
+                        on_improvement(Progress(best, bestobj, evals))
+                    if bestobj <= termination.target:
+                        termination.stop(StopReason.TARGET)
+                        return best
+                    stalled_evals = evals + termination.max_evals_without_improvement
+                    stalled_time = perf_counter() + termination.max_time_without_improvement
+                continue
+            count += 1
+            if best_first:
+                heapq.heappush(open_list, (clb, count, ns))
+            else:
+                open_list.append((clb, count, ns))
+
+        if max_open is not None and len(open_list) > max_open:
+            # Keep the better half, in its current order
+            cut = heapq.nsmallest(max(max_open // 2, 1), open_list)[-1][:2]
+            open_list = [node for node in open_list if node[:2] <= cut]
+            if best_first:
+                heapq.heapify(open_list)
+            if not trimmed:
+                log.info("Open list trimmed, optimality is no longer guaranteed")
+                trimmed = True
+
+        if evals >= stalled_evals:
+            termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+            return best
+        if perf_counter() >= stalled_time:
+            termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+            return best
+
+    if trimmed:
+        termination.stop(StopReason.TRIMMED)
+        return best
+    log.info("Search space exhausted after %d nodes", nodes)
+    termination.stop(StopReason.CONVERGED)
+    return best
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Callable
+from typing import Any, Optional, Union, cast
+
+Hook = Callable[["Progress"], None]
+
+
+class Progress:
+    """
+    State of a running search, as passed to `Callbacks`
+
+    `solution` is the solution the event refers to, which the algorithm may modify in place later, so copy it if it
+    must be kept, and `objective` is its objective value, or `None` if it is a partial solution. `evals` counts the
+    move evaluations of the search so far. `temperature` and `acceptance_rate` are only set by `sa`, the latter
+    being averaged over about the last `rate_window` proposals, and `layer` by `beam_search`.
+    """
+
+    __slots__ = ("acceptance_rate", "evals", "layer", "objective", "solution", "temperature")
+
+    def __init__(
+        self,
+        solution: Any,
+        objective: Optional[Union[int, float]],
+        evals: int,
+        temperature: Optional[float] = None,
+        acceptance_rate: Optional[float] = None,
+        layer: Optional[int] = None,
+    ):
+        self.solution = solution
+        self.objective = objective
+        self.evals = evals
+        self.temperature = temperature
+        self.acceptance_rate = acceptance_rate
+        self.layer = layer
+
+
+class Callbacks:
+    """
+    Hooks into a running search, accepted by all algorithms as `callbacks`
+
+    Subclass it and override the methods of interest:
+
+    - `on_iteration` is called after every iteration of the main loop of the algorithm, i.e., every move evaluation
+      in `first_improvement`, `rls`, `sa` and `vnd`, every move applied in `best_improvement` and `tabu_search`,
+      every construction in `grasp` and `lns`, every node in `branch_and_bound` and every step in
+      `greedy_construction` and `path_relinking`;
+    - `on_accept` is called whenever the current solution changes, e.g., when `sa` accepts a move;
+    - `on_improvement` is called whenever the best solution improves;
+    - `on_layer` is called by `beam_search` after every layer, with the best solution in the layer.
+
+    Algorithms check which methods are overridden once, when they start, and never call the others, so that unused
+    hooks do not slow down their inner loops.
+    """
+
+    def on_iteration(self, progress: Progress) -> None: ...
+
+    def on_accept(self, progress: Progress) -> None: ...
+
+    def on_improvement(self, progress: Progress) -> None: ...
+
+    def on_layer(self, progress: Progress) -> None: ...
+
+
+def hooks(callbacks: Optional[Callbacks]) -> tuple[Optional[Hook], Optional[Hook], Optional[Hook], Optional[Hook]]:
+    """
+    Returns the `on_iteration`, `on_accept`, `on_improvement` and `on_layer` methods of `callbacks`, or `None` for
+    those that are not overridden.
+    """
+
+    def hook(name: str) -> Optional[Hook]:
+        if callbacks is None or getattr(type(callbacks), name, None) is getattr(Callbacks, name):
+            return None
+        return cast(Optional[Hook], getattr(callbacks, name, None))
+
+    return hook("on_iteration"), hook("on_accept"), hook("on_improvement"), hook("on_layer")
@@ -2,16 +2,23 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
 from logging import getLogger
-from typing import Protocol, TypeVar, Union
+from time import perf_counter
+from typing import Optional, Protocol, TypeVar, Union, cast
 
 from ..operations import (
     SupportsApplyMove,
+    SupportsBoundedObjectiveValueIncrement,
     SupportsLocalNeighbourhood,
+    SupportsMoveCount,
+    SupportsMovesRange,
     SupportsObjectiveValueIncrement,
     SupportsRandomMovesWithoutReplacement,
 )
+from ..utils.stepwise import run_steps
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination, objective_value
 
 log = getLogger(__name__)
 
@@ -22,34 +29,156 @@ _TSolution = TypeVar("_TSolution")
 class _Move(SupportsApplyMove[_TSolution], SupportsObjectiveValueIncrement[_TSolution], Protocol): ...
 
 
+class _BoundedMove(SupportsApplyMove[_TSolution], SupportsBoundedObjectiveValueIncrement[_TSolution], Protocol): ...
+
+
 class _Neighbourhood(SupportsRandomMovesWithoutReplacement[_TSolution, _Move[_TSolution]], Protocol): ...
 
 
+class _PartitionedNeighbourhood(
+    _Neighbourhood[_TSolution],
+    SupportsMoveCount[_TSolution],
+    SupportsMovesRange[_TSolution, _Move[_TSolution]],
+    Protocol,
+): ...
+
+
 class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
 
 
-def first_improvement(problem: _Problem[_TSolution], solution: _TSolution) -> _TSolution:
+def first_improvement(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    termination: Optional[Termination] = None,
+    circular: bool = False,
+    callbacks: Optional[Callbacks] = None,
+    bounded: bool = False,
+) -> _TSolution:
+    """
+    Solves `problem` by repeatedly applying the first improving move found in the local neighbourhood of `solution`.
+
+    By default, the neighbourhood is scanned in a new random order after every improvement. If `circular` is true, the
+    local neighbourhood must also support `move_count` and `moves_range`. It is then scanned in order, resuming after
+    the last improving move, and the search stops after a full pass without improvement.
+
+    If `bounded` is true, moves must also support `bounded_objective_value_increment`, which is used with a bound of 0
+    instead of `objective_value_increment`, so that the evaluation of a move can stop once it is known not to improve.
+    """
+    return run_steps(first_improvement_steps(problem, solution, termination, circular, callbacks, bounded))
+
+
+def first_improvement_steps(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    termination: Optional[Termination] = None,
+    circular: bool = False,
+    callbacks: Optional[Callbacks] = None,
+    bounded: bool = False,
+    step: int = 1000,
+) -> Generator[_TSolution, None, _TSolution]:
+    """
+    Step-wise version of `first_improvement`.
+
+    Yields the current solution after every `step` move evaluations and returns it once a local optimum is reached.
+    The yielded solution is modified in place once the search resumes, so copy it if it must be kept. The time without
+    improvement is only checked between steps.
+    """
+    if termination is None:
+        termination = Termination()
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+
     neigh = problem.local_neighbourhood()
 
-    move_iter = iter(_valid_moves_and_increments(neigh, solution))
+    obj = objective_value(solution)
+    if obj is not None and obj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return solution
+
+    evals = 0
+    next_step = step
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = perf_counter() + termination.max_time_without_improvement
+    if circular:
+        pneigh = cast(_PartitionedNeighbourhood[_TSolution], neigh)
+        count = pneigh.move_count(solution)
+        cursor = 0
+        restart = 0
+        move_iter = iter(_circular_moves_and_increments(pneigh, solution, cursor, bounded))
+    else:
+        move_iter = iter(_valid_moves_and_increments(neigh, solution, bounded))
     move_and_incr = next(move_iter, None)
     while move_and_incr is not None:
         move, increment = move_and_incr
+        evals += 1
 
         if increment < 0:
-            log.info(f"Found increment: {increment}")
+            log.info("Found increment: %s", increment)
             solution = move.apply_move(solution)
-            move_iter = iter(_valid_moves_and_increments(neigh, solution))
+            if obj is not None:
+                obj += increment
+            if on_accept is not None:
+                on_accept(Progress(solution, obj, evals))
+            if on_improvement is not None:
+                on_improvement(Progress(solution, obj, evals))
+            if obj is not None and obj <= termination.target:
+                termination.stop(StopReason.TARGET)
+                return solution
+            stalled_evals = evals + termination.max_evals_without_improvement
+            stalled_time = perf_counter() + termination.max_time_without_improvement
+            if circular:
+                # Resume right after the improving move
+                cursor = (cursor + evals - restart) % count
+                restart = evals
+                count = pneigh.move_count(solution)
+                cursor = cursor % count if count > 0 else 0
+                move_iter = iter(_circular_moves_and_increments(pneigh, solution, cursor, bounded))
+            else:
+                move_iter = iter(_valid_moves_and_increments(neigh, solution, bounded))
+
+        if on_iteration is not None:
+            on_iteration(Progress(solution, obj, evals))
+
+        if evals >= next_step:
+            paused = perf_counter()
+            if paused >= stalled_time:
+                termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+                return solution
+            yield solution
+            stalled_time += perf_counter() - paused
+            next_step = evals + step
+
+        if evals >= stalled_evals:
+            termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+            return solution
 
         move_and_incr = next(move_iter, None)
 
+    termination.stop(StopReason.CONVERGED)
     return solution
 
 
 def _valid_moves_and_increments(
-    neigh: _Neighbourhood[_TSolution], solution: _TSolution
+    neigh: _Neighbourhood[_TSolution], solution: _TSolution, bounded: bool
 ) -> Iterable[tuple[_Move[_TSolution], Union[int, float]]]:
     for move in neigh.random_moves_without_replacement(solution):
-        incr = move.objective_value_increment(solution)
+        if bounded:
+            incr = cast(_BoundedMove[_TSolution], move).bounded_objective_value_increment(solution, 0)
+        else:
+            incr = move.objective_value_increment(solution)
         assert incr is not None
         yield (move, incr)
+
+
+def _circular_moves_and_increments(
+    neigh: _PartitionedNeighbourhood[_TSolution], solution: _TSolution, cursor: int, bounded: bool
+) -> Iterable[tuple[_Move[_TSolution], Union[int, float]]]:
+    count = neigh.move_count(solution)
+    for start, stop in ((cursor, count), (0, cursor)):
+        for move in neigh.moves_range(solution, start, stop):
+            if bounded:
+                incr = cast(_BoundedMove[_TSolution], move).bounded_objective_value_increment(solution, 0)
+            else:
+                incr = move.objective_value_increment(solution)
+            assert incr is not None
+            yield (move, incr)
@@ -3,11 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import random
-from collections.abc import Callable
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Generator
 from logging import getLogger
-from operator import itemgetter
 from time import perf_counter
-from typing import Optional, Protocol, TypeVar, Union, cast
+from typing import Any, Generic, Optional, Protocol, TypeVar, Union, cast
 
 from ..operations import (
     SupportsApplyMove,
@@ -16,8 +16,17 @@ from ..operations import (
     SupportsEmptySolution,
     SupportsLowerBoundIncrement,
     SupportsMoves,
+    SupportsMovesDelta,
     SupportsObjectiveValue,
+    SupportsSolutionHash,
 )
+from ..utils.checkpoint import Checkpointer
+from ..utils.elite_pool import ElitePool
+from ..utils.stepwise import run_steps
+from ..utils.transposition_table import TranspositionTable
+from .callbacks import Callbacks, Progress, hooks
+from .path_relinking import path_relinking
+from .termination import StopReason, Termination
 
 log = getLogger(__name__)
 
@@ -34,6 +43,9 @@ class _Move(SupportsLowerBoundIncrement[_TSolution], SupportsApplyMove[_TSolutio
 class _Neighbourhood(SupportsMoves[_TSolution, _Move[_TSolution]], Protocol): ...
 
 
+class _DeltaNeighbourhood(_Neighbourhood[_TSolution], SupportsMovesDelta[_TSolution, _Move[_TSolution]], Protocol): ...
+
+
 class _Problem(
     SupportsConstructionNeighbourhood[_Neighbourhood[_TSolution]], SupportsEmptySolution[_TSolution], Protocol
 ): ...
@@ -41,6 +53,113 @@ class _Problem(
 
 LocalSearchFunc = Callable[[_Problem[_TSolution], _TSolution], _TSolution]
 
+_T = TypeVar("_T")
+
+
+class RestrictedCandidateList(Generic[_T]):
+    """
+    Class to draw moves at random from a restricted candidate list (RCL)
+
+    Moves are kept sorted by increment, so that both kinds of RCL are found with a binary search instead of a scan of
+    all the moves. After a move is applied, `discard` and `add` replace only the moves that it changed, as
+    `update_candidate_list` does for neighbourhoods that support `moves_delta`, and the list need not be built again.
+    Each of them takes O(log n) comparisons, plus a shift of the underlying lists that is done in C.
+    """
+
+    def __init__(self, moves: list[_T], incrs: list[Union[int, float]], rng: Optional[random.Random] = None):
+        order = sorted(range(len(incrs)), key=incrs.__getitem__)
+        self.moves = list(map(moves.__getitem__, order))
+        self.incrs = list(map(incrs.__getitem__, order))
+        self.rng = rng
+        # Move -> increment, only built once moves are discarded
+        self.index: Optional[dict[_T, Union[int, float]]] = None
+
+    def choose_by_value(self, alpha: float) -> _T:
+        """
+        Chooses a move whose increment is within `alpha` of the range of increments from the smallest one.
+        """
+        cmin = self.incrs[0]
+        thresh = cmin + alpha * (self.incrs[-1] - cmin)
+        # Rounding may leave the threshold below a large integer minimum
+        k = max(bisect_right(self.incrs, thresh), 1)
+        randrange = random.randrange if self.rng is None else self.rng.randrange
+        return self.moves[randrange(k)]
+
+    def choose_by_cardinality(self, size: int) -> _T:
+        """
+        Chooses one of the `size` moves with the smallest increments.
+        """
+        randrange = random.randrange if self.rng is None else self.rng.randrange
+        return self.moves[randrange(min(size, len(self.incrs)))]
+
+    def add(self, move: _T, incr: Union[int, float]) -> None:
+        """
+        Adds `move` with increment `incr`.
+        """
+        if self.index is not None:
+            self.index[move] = incr
+        ix = bisect_right(self.incrs, incr)
+        self.incrs.insert(ix, incr)
+        self.moves.insert(ix, move)
+
+    def discard(self, move: _T) -> None:
+        """
+        Removes `move`, if it is in the list.
+        """
+        if self.index is None:
+            self.index = dict(zip(self.moves, self.incrs))
+        incr = self.index.pop(move, None)
+        if incr is None:
+            return
+        ix = bisect_left(self.incrs, incr)
+        # Skip moves with the same increment
+        while self.moves[ix] != move:
+            ix += 1
+        del self.incrs[ix]
+        del self.moves[ix]
+
+    def __len__(self) -> int:
+        return self.moves.__len__()
+
+
+def candidate_list(
+    neigh: _Neighbourhood[_TSolution], solution: _TSolution, rng: Optional[random.Random] = None
+) -> RestrictedCandidateList[_Move[_TSolution]]:
+    """
+    Returns a candidate list of the moves of `neigh` from `solution` that have a lower bound increment, drawing from it
+    with `rng`.
+    """
+    moves: list[_Move[_TSolution]] = []
+    incrs: list[Union[int, float]] = []
+    for m in neigh.moves(solution):
+        incr = m.lower_bound_increment(solution)
+        if incr is not None:
+            moves.append(m)
+            incrs.append(incr)
+    return RestrictedCandidateList(moves, incrs, rng)
+
+
+def update_candidate_list(
+    cl: RestrictedCandidateList[_Move[_TSolution]],
+    neigh: _DeltaNeighbourhood[_TSolution],
+    solution: _TSolution,
+    move: _Move[_TSolution],
+) -> int:
+    """
+    Updates the candidate list `cl` of the moves of `neigh` after `move` has been applied to `solution`, using
+    `moves_delta`, and returns the number of moves evaluated.
+    """
+    removed, added = neigh.moves_delta(solution, move)
+    for m in removed:
+        cl.discard(m)
+    evals = 0
+    for m in added:
+        incr = m.lower_bound_increment(solution)
+        if incr is not None:
+            cl.add(m, incr)
+            evals += 1
+    return evals
+
 
 def grasp(
     problem: _Problem[_TSolution],
@@ -48,54 +167,223 @@ def grasp(
     solution: Optional[_TSolution] = None,
     alpha: float = 0.1,
     local_search: Optional[LocalSearchFunc[_TSolution]] = None,
+    termination: Optional[Termination] = None,
+    rcl_size: Optional[int] = None,
+    transpositions: int = 0,
+    checkpoint: Optional[Checkpointer] = None,
+    elite: Optional[ElitePool[_TSolution]] = None,
+    rng: Optional[random.Random] = None,
+    callbacks: Optional[Callbacks] = None,
 ) -> _TSolution:
+    """
+    Solves `problem` with GRASP for `budget` seconds.
+
+    Every iteration builds a solution by repeatedly applying a random move from a restricted candidate list, which
+    holds the moves whose lower bound increment is within `alpha` of the range of increments from the smallest one, or
+    the `rcl_size` moves with the smallest increments if `rcl_size` is given. The best solution built in each iteration
+    is then improved with `local_search`, if given.
+
+    If `transpositions` is positive, solutions must support `solution_hash`. The hashes of the last `transpositions`
+    distinct solutions built are then kept, and iterations that build one of them again are skipped.
+
+    If `checkpoint` is given, the state of the search, including the state of `rng`, is saved periodically between
+    iterations, and a search started with an existing checkpoint resumes from it.
+
+    If an `elite` pool is given, the problem must also support `local_neighbourhood` as required by `path_relinking`.
+    After local search, every iteration relinks its solution towards a random solution from the pool, improves the
+    result with `local_search` and offers both solutions to the pool. The pool is not part of the checkpoint, and may
+    be shared with other searches.
+
+    If the construction neighbourhood supports `moves_delta`, the candidate list is updated after every move instead
+    of being built again.
+
+    Random choices are made with `rng`, which defaults to a new generator seeded from the functions of `random`, so
+    that `random.seed` still makes runs reproducible.
+    """
+    return run_steps(
+        grasp_steps(
+            problem,
+            budget,
+            solution,
+            alpha,
+            local_search,
+            termination,
+            rcl_size,
+            transpositions,
+            checkpoint,
+            elite,
+            rng,
+            callbacks,
+        )
+    )
+
+
+def grasp_steps(
+    problem: _Problem[_TSolution],
+    budget: float,
+    solution: Optional[_TSolution] = None,
+    alpha: float = 0.1,
+    local_search: Optional[LocalSearchFunc[_TSolution]] = None,
+    termination: Optional[Termination] = None,
+    rcl_size: Optional[int] = None,
+    transpositions: int = 0,
+    checkpoint: Optional[Checkpointer] = None,
+    elite: Optional[ElitePool[_TSolution]] = None,
+    rng: Optional[random.Random] = None,
+    callbacks: Optional[Callbacks] = None,
+    step: int = 10,
+) -> Generator[_TSolution, None, _TSolution]:
+    """
+    Step-wise version of `grasp`.
+
+    Yields the best solution found so far after every `step` construction moves and returns it when the budget is
+    exhausted. Time spent suspended between steps does not count towards `budget`. Note that `local_search` is run to
+    completion within a single step, and that stopping criteria are checked after every iteration.
+    """
+    if termination is None:
+        termination = Termination()
+
+    if rng is None:
+        rng = random.Random(random.getrandbits(64))
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+
     start = perf_counter()
 
     neigh = problem.construction_neighbourhood()
+    delta = cast(_DeltaNeighbourhood[_TSolution], neigh) if hasattr(neigh, "moves_delta") else None
 
     if solution is None:
         solution = problem.empty_solution()
 
     best = solution
-    bestobj = solution.objective_value()
 
+    table = TranspositionTable[bool](transpositions) if transpositions > 0 else None
+
+    steps = 0
+    evals = 0
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = start + termination.max_time_without_improvement
+    if checkpoint is not None:
+        state = checkpoint.load(problem)
+        if state is not None:
+            if state["algorithm"] != "grasp":
+                raise ValueError(f"Checkpoint {checkpoint.path} was not saved by grasp")
+            best = state["best"]
+            table = state["table"]
+            steps = state["steps"]
+            evals = state["evals"]
+            start -= state["elapsed"]
+            stalled_evals = state["stalled_evals"]
+            stalled_time = start + state["stalled_time"]
+            rng.setstate(state["random"])
+    bestobj = best.objective_value()
+    next_step = steps + step
     while perf_counter() - start < budget:
         s = solution.copy_solution()
         b = None
         bobj = None
 
-        cl = _valid_moves_and_increments(neigh, s)
+        cl = candidate_list(neigh, s, rng)
+        evals += len(cl)
         while len(cl) != 0:
-            cmin = min(cl, key=itemgetter(1))[1]
-            cmax = max(cl, key=itemgetter(1))[1]
-            thresh = cmin + alpha * (cmax - cmin)
-            rcl = [m for m, decr in cl if decr <= thresh]
-            m = random.choice(rcl)
+            if rcl_size is None:
+                m = cl.choose_by_value(alpha)
+            else:
+                m = cl.choose_by_cardinality(rcl_size)
             s = m.apply_move(s)
             obj = s.objective_value()
             if obj is not None and (bobj is None or obj < bobj):
                 b = s.copy_solution()
                 bobj = b.objective_value()
-            cl = _valid_moves_and_increments(neigh, s)
+            steps += 1
+            if steps >= next_step:
+                paused = perf_counter()
+                yield best
+                paused = perf_counter() - paused
+                start += paused
+                stalled_time += paused
+                next_step = steps + step
+            if delta is not None:
+                evals += update_candidate_list(cl, delta, s, m)
+            else:
+                cl = candidate_list(neigh, s, rng)
+                evals += len(cl)
+        if b is not None and table is not None:
+            h = cast(SupportsSolutionHash, b).solution_hash()
+            if h in table:
+                b = None
+            else:
+                table.put(h, True)
         if b is not None:
             if local_search is not None:
                 b = local_search(problem, b)
                 # The following assumes that local_search returns a better or equal objective value
                 bobj = cast(Union[int, float], b.objective_value())
             bobj = cast(Union[int, float], bobj)
+            if elite is not None:
+                b, bobj = _relink(problem, b, bobj, elite, local_search, rng)
+            if on_accept is not None:
+                on_accept(Progress(b, bobj, evals))
             if bestobj is None or bobj < bestobj:
-                log.info(f"Best solution: {bobj}")
+                log.info("Best solution: %s", bobj)
                 best = b
                 bestobj = bobj
+                if on_improvement is not None:
+                    on_improvement(Progress(best, bestobj, evals))
+                stalled_evals = evals + termination.max_evals_without_improvement
+                stalled_time = perf_counter() + termination.max_time_without_improvement
+        if on_iteration is not None:
+            on_iteration(Progress(s, s.objective_value(), evals))
+        if bestobj is not None and bestobj <= termination.target:
+            termination.stop(StopReason.TARGET)
+            return best
+        if evals >= stalled_evals:
+            termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+            return best
+        now = perf_counter()
+        if now >= stalled_time:
+            termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+            return best
+        if checkpoint is not None and checkpoint.due(now):
+            state = {
+                "algorithm": "grasp",
+                "best": best,
+                "table": table,
+                "steps": steps,
+                "evals": evals,
+                "elapsed": now - start,
+                "stalled_evals": stalled_evals,
+                "stalled_time": stalled_time - start,
+                "random": rng.getstate(),
+            }
+            checkpoint.save(problem, state)
+    termination.stop(StopReason.BUDGET)
     return best
 
 
-def _valid_moves_and_increments(
-    neigh: _Neighbourhood[_TSolution], solution: _TSolution
-) -> list[tuple[_Move[_TSolution], Union[int, float]]]:
-    res: list[tuple[_Move[_TSolution], Union[int, float]]] = []
-    for m in neigh.moves(solution):
-        incr = m.lower_bound_increment(solution)
-        if incr is not None:
-            res.append((m, incr))
-    return res
+def _relink(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    obj: Union[int, float],
+    elite: ElitePool[_TSolution],
+    local_search: Optional[LocalSearchFunc[_TSolution]],
+    rng: random.Random,
+) -> tuple[_TSolution, Union[int, float]]:
+    target = elite.sample(rng)
+    elite.add(solution)
+    if target is None:
+        return solution, obj
+
+    r = path_relinking(cast(Any, problem), solution, target)
+    if r is None:
+        return solution, obj
+    if local_search is not None:
+        r = local_search(problem, r)
+    robj = r.objective_value()
+    assert robj is not None
+    elite.add(r)
+
+    if robj < obj:
+        return r, robj
+    return solution, obj
@@ -14,6 +14,8 @@ from ..operations import (
     SupportsLowerBoundIncrement,
     SupportsMoves,
 )
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination
 
 log = getLogger(__name__)
 
@@ -32,12 +34,24 @@ class _Problem(
 ): ...
 
 
-def greedy_construction(problem: _Problem[_TSolution], solution: Optional[_TSolution] = None) -> _TSolution:
+def greedy_construction(
+    problem: _Problem[_TSolution],
+    solution: Optional[_TSolution] = None,
+    termination: Optional[Termination] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> _TSolution:
     """
     Solves `problem` using a greedy construction approach.
 
-    Note: if `solution` is given it must be a solution to `problem`. Otherwise, an empty solution is generated.
+    Note: if `solution` is given it must be a solution to `problem`. Otherwise, an empty solution is generated. The
+    construction always runs to completion, so `termination` only records the stopping reason. The solutions passed
+    to `callbacks` are partial, so their objective value is `None`.
     """
+    if termination is None:
+        termination = Termination()
+
+    on_iteration, on_accept, _, _ = hooks(callbacks)
+
     neigh = problem.construction_neighbourhood()
 
     if solution is None:
@@ -45,10 +59,13 @@ def greedy_construction(problem: _Problem[_TSolution], solution: Optional[_TSolu
 
     move_iter = iter(_valid_moves_and_increments(neigh, solution))
     move_and_incr = next(move_iter, None)
+    evals = 0
     while move_and_incr is not None:
         best_move, best_incr = move_and_incr
+        evals += 1
 
         for move, incr in move_iter:
+            evals += 1
             if incr < best_incr:
                 best_move = move
                 best_incr = incr
@@ -56,17 +73,25 @@ def greedy_construction(problem: _Problem[_TSolution], solution: Optional[_TSolu
                     break
 
         solution = best_move.apply_move(solution)
+        if on_accept is not None:
+            on_accept(Progress(solution, None, evals))
+        if on_iteration is not None:
+            on_iteration(Progress(solution, None, evals))
 
         move_iter = iter(_valid_moves_and_increments(neigh, solution))
         move_and_incr = next(move_iter, None)
 
+    termination.stop(StopReason.CONVERGED)
     return solution
 
 
 # IMPROVE: this reuses a lot of the code from the above. Maybe we should make random tie breaking a parameter?
 def greedy_construction_with_random_tie_breaking(
-    problem: _Problem[_TSolution], solution: Optional[_TSolution] = None
+    problem: _Problem[_TSolution], solution: Optional[_TSolution] = None, rng: Optional[random.Random] = None
 ) -> _TSolution:
+    if rng is None:
+        rng = random.Random(random.getrandbits(64))
+
     neigh = problem.construction_neighbourhood()
 
     if solution is None:
@@ -85,8 +110,8 @@ def greedy_construction_with_random_tie_breaking(
             elif incr < best_incr + 1e-6:
                 best_moves.append(move)
 
-        log.info(f"Best increment: {best_incr}")
-        solution = random.choice(best_moves).apply_move(solution)
+        log.info("Best increment: %s", best_incr)
+        solution = rng.choice(best_moves).apply_move(solution)
 
         move_iter = iter(_valid_moves_and_increments(neigh, solution))
         move_and_incr = next(move_iter, None)
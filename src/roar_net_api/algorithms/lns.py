@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from concurrent.futures import Executor
+from logging import getLogger
+from time import perf_counter
+from typing import Optional, Protocol, TypeVar, Union, cast
+
+from ..operations import (
+    SupportsApplyMove,
+    SupportsConstructionNeighbourhood,
+    SupportsCopySolution,
+    SupportsDestructionNeighbourhood,
+    SupportsLowerBound,
+    SupportsLowerBoundIncrement,
+    SupportsMoves,
+    SupportsMovesDelta,
+    SupportsObjectiveValue,
+    SupportsRandomMove,
+)
+from ..utils.process_pool import submit
+from .callbacks import Callbacks, Progress, hooks
+from .grasp import candidate_list, update_candidate_list
+from .termination import StopReason, Termination
+
+log = getLogger(__name__)
+
+
+class _Solution(SupportsLowerBound, SupportsObjectiveValue, SupportsCopySolution, Protocol): ...
+
+
+_TSolution = TypeVar("_TSolution", bound=_Solution)
+
+
+class _ConstructionMove(SupportsLowerBoundIncrement[_TSolution], SupportsApplyMove[_TSolution], Protocol): ...
+
+
+class _ConstructionNeighbourhood(SupportsMoves[_TSolution, _ConstructionMove[_TSolution]], Protocol): ...
+
+
+class _DeltaNeighbourhood(
+    _ConstructionNeighbourhood[_TSolution], SupportsMovesDelta[_TSolution, _ConstructionMove[_TSolution]], Protocol
+): ...
+
+
+class _DestructionNeighbourhood(SupportsRandomMove[_TSolution, SupportsApplyMove[_TSolution]], Protocol): ...
+
+
+class _Problem(
+    SupportsConstructionNeighbourhood[_ConstructionNeighbourhood[_TSolution]],
+    SupportsDestructionNeighbourhood[_DestructionNeighbourhood[_TSolution]],
+    Protocol,
+): ...
+
+
+def lns(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    budget: float,
+    ruin: int = 10,
+    alpha: float = 0.0,
+    attempts: int = 1,
+    executor: Optional[Executor] = None,
+    termination: Optional[Termination] = None,
+    rng: Optional[random.Random] = None,
+    callbacks: Optional[Callbacks] = None,
+    repair: Optional[_ConstructionNeighbourhood[_TSolution]] = None,
+) -> _TSolution:
+    """
+    Solves `problem` with a ruin-and-recreate large neighbourhood search starting from the feasible `solution`.
+
+    Every iteration makes `attempts` independent attempts, each applying `ruin` random moves from the destruction
+    neighbourhood to a copy of the current solution and completing it again with the `repair` neighbourhood, which
+    defaults to the construction neighbourhood. Reconstruction picks moves at random from a restricted candidate list
+    as in `grasp`, which is greedy (up to ties) when `alpha` is 0. A reconstruction is abandoned as soon as its lower
+    bound exceeds the objective value of the current solution. The best attempt replaces the current solution if it is
+    not worse.
+
+    The repair neighbourhood must be able to undo destruction moves. Construction neighbourhoods that only extend a
+    solution at one end, such as appending cities to a tour, cannot put back what was removed elsewhere, so models like
+    these should provide a repair neighbourhood, such as one inserting cities anywhere in a tour. If it supports
+    `moves_delta`, the candidate list is updated after every move instead of being built again.
+
+    If `executor` is given, the attempts of each iteration are submitted to it. A process pool must be created with
+    `roar_net_api.utils.process_pool.init_worker`, so that the problem is sent to each worker once, and only the
+    current solution and the reconstructions are pickled per attempt.
+
+    Every attempt makes its choices of construction moves with a generator seeded from `rng`, which defaults to a new
+    generator seeded from the functions of `random`, so that attempts run in other processes do not repeat each other.
+    """
+    if termination is None:
+        termination = Termination()
+
+    if rng is None:
+        rng = random.Random(random.getrandbits(64))
+
+    if repair is None:
+        repair = problem.construction_neighbourhood()
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+
+    start = perf_counter()
+
+    curobj = solution.objective_value()
+    assert curobj is not None
+
+    best = solution.copy_solution()
+    bestobj = curobj
+    if bestobj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return best
+
+    evals = 0
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = start + termination.max_time_without_improvement
+    while perf_counter() - start < budget:
+        seeds = [rng.getrandbits(64) for _ in range(attempts)]
+        if executor is None:
+            results = [_ruin_and_recreate(problem, repair, solution, ruin, alpha, curobj, seed) for seed in seeds]
+        else:
+            futures = [
+                submit(executor, problem, _ruin_and_recreate, problem, repair, solution, ruin, alpha, curobj, seed)
+                for seed in seeds
+            ]
+            results = [f.result() for f in futures]
+
+        cand = None
+        candobj: Optional[Union[int, float]] = None
+        for s, n in results:
+            evals += n
+            if s is not None:
+                obj = s.objective_value()
+                if obj is not None and (candobj is None or obj < candobj):
+                    cand = s
+                    candobj = obj
+
+        if cand is not None and candobj is not None and candobj <= curobj:
+            solution = cand
+            curobj = candobj
+            if on_accept is not None:
+                on_accept(Progress(solution, curobj, evals))
+            if curobj < bestobj:
+                log.info("Best solution: %s", curobj)
+                best = solution.copy_solution()
+                bestobj = curobj
+                if on_improvement is not None:
+                    on_improvement(Progress(best, bestobj, evals))
+                if bestobj <= termination.target:
+                    termination.stop(StopReason.TARGET)
+                    return best
+                stalled_evals = evals + termination.max_evals_without_improvement
+                stalled_time = perf_counter() + termination.max_time_without_improvement
+
+        if on_iteration is not None:
+            on_iteration(Progress(solution, curobj, evals))
+
+        if evals >= stalled_evals:
+            termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+            return best
+        if perf_counter() >= stalled_time:
+            termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+            return best
+
+    termination.stop(StopReason.BUDGET)
+    return best
+
+
+def _ruin_and_recreate(
+    problem: _Problem[_TSolution],
+    repair: _ConstructionNeighbourhood[_TSolution],
+    solution: _TSolution,
+    ruin: int,
+    alpha: float,
+    bound: Union[int, float],
+    seed: int,
+) -> tuple[Optional[_TSolution], int]:
+    """
+    Ruins and recreates a copy of `solution`, returning it together with the number of evaluated construction moves,
+    or `None` instead of the solution if the reconstruction was abandoned.
+    """
+    rng = random.Random(seed)
+    s = solution.copy_solution()
+
+    dneigh = problem.destruction_neighbourhood()
+    for _ in range(ruin):
+        dm = dneigh.random_move(s)
+        if dm is None:
+            break
+        s = dm.apply_move(s)
+
+    delta = cast(_DeltaNeighbourhood[_TSolution], repair) if hasattr(repair, "moves_delta") else None
+    cl = None
+    evals = 0
+    while True:
+        lb = s.lower_bound()
+        if lb is None or lb > bound:
+            return None, evals
+
+        if cl is None or delta is None:
+            cl = candidate_list(repair, s, rng)
+            evals += len(cl)
+        if len(cl) == 0:
+            return s, evals
+
+        m = cl.choose_by_value(alpha)
+        s = m.apply_move(s)
+        if delta is not None:
+            evals += update_candidate_list(cl, delta, s, m)
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from logging import getLogger
+from typing import Optional, Protocol, TypeVar, Union
+
+from ..operations import (
+    SupportsApplyMove,
+    SupportsCopySolution,
+    SupportsDistanceIncrement,
+    SupportsLocalNeighbourhood,
+    SupportsMoves,
+    SupportsObjectiveValue,
+    SupportsObjectiveValueIncrement,
+    SupportsSolutionDistance,
+)
+from .callbacks import Callbacks, Progress, hooks
+
+log = getLogger(__name__)
+
+
+class _Solution(SupportsCopySolution, SupportsObjectiveValue, SupportsSolutionDistance["_Solution"], Protocol): ...
+
+
+_TSolution = TypeVar("_TSolution", bound=_Solution)
+
+
+class _Move(
+    SupportsApplyMove[_TSolution],
+    SupportsObjectiveValueIncrement[_TSolution],
+    SupportsDistanceIncrement[_TSolution],
+    Protocol,
+): ...
+
+
+class _Neighbourhood(SupportsMoves[_TSolution, _Move[_TSolution]], Protocol): ...
+
+
+class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
+
+
+def path_relinking(
+    problem: _Problem[_TSolution], solution: _TSolution, target: _TSolution, callbacks: Optional[Callbacks] = None
+) -> Optional[_TSolution]:
+    """
+    Walks from the feasible `solution` towards the feasible `target` in the local neighbourhood of `problem`, and
+    returns the best solution strictly between them, or `None` if there is none.
+
+    Every step applies the move with the smallest objective value increment among those that bring the solution
+    closer to `target`, and the walk stops once no move does. `solution` is not modified.
+    """
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+
+    neigh = problem.local_neighbourhood()
+
+    s = solution.copy_solution()
+    obj = s.objective_value()
+    assert obj is not None
+    dist = s.solution_distance(target)
+
+    best = None
+    bestobj: Optional[Union[int, float]] = None
+    evals = 0
+    while True:
+        chosen = None
+        chosen_incr: Union[int, float] = 0
+        chosen_dincr: Union[int, float] = 0
+        for move in neigh.moves(s):
+            dincr = move.distance_increment(s, target)
+            if dincr >= 0:
+                continue
+            incr = move.objective_value_increment(s)
+            assert incr is not None
+            evals += 1
+            if chosen is None or incr < chosen_incr:
+                chosen = move
+                chosen_incr = incr
+                chosen_dincr = dincr
+
+        if chosen is None:
+            break
+
+        s = chosen.apply_move(s)
+        obj += chosen_incr
+        dist += chosen_dincr
+        if on_iteration is not None:
+            on_iteration(Progress(s, obj, evals))
+        if dist <= 0:
+            break
+        if on_accept is not None:
+            on_accept(Progress(s, obj, evals))
+
+        if bestobj is None or obj < bestobj:
+            best = s.copy_solution()
+            bestobj = obj
+            if on_improvement is not None:
+                on_improvement(Progress(best, bestobj, evals))
+
+    if bestobj is not None:
+        log.info("Best relinked solution: %s", bestobj)
+    return best
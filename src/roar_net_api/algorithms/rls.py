@@ -4,14 +4,21 @@
 
 from logging import getLogger
 from time import perf_counter
-from typing import Protocol, TypeVar
+from typing import Generator, Optional, Protocol, TypeVar, cast
 
 from ..operations import (
     SupportsApplyMove,
+    SupportsBoundedObjectiveValueIncrement,
+    SupportsHashIncrement,
     SupportsLocalNeighbourhood,
     SupportsObjectiveValueIncrement,
     SupportsRandomMovesWithoutReplacement,
+    SupportsSolutionHash,
 )
+from ..utils.stepwise import run_steps
+from ..utils.transposition_table import TranspositionTable
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination, objective_value
 
 log = getLogger(__name__)
 
@@ -22,28 +29,143 @@ _TSolution = TypeVar("_TSolution")
 class _Move(SupportsApplyMove[_TSolution], SupportsObjectiveValueIncrement[_TSolution], Protocol): ...
 
 
+class _BoundedMove(SupportsApplyMove[_TSolution], SupportsBoundedObjectiveValueIncrement[_TSolution], Protocol): ...
+
+
 class _Neighbourhood(SupportsRandomMovesWithoutReplacement[_TSolution, _Move[_TSolution]], Protocol): ...
 
 
 class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
 
 
-def rls(problem: _Problem[_TSolution], solution: _TSolution, budget: float) -> _TSolution:
-    start = perf_counter()
+def rls(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    budget: float,
+    termination: Optional[Termination] = None,
+    transpositions: int = 0,
+    neighbourhood: Optional[_Neighbourhood[_TSolution]] = None,
+    callbacks: Optional[Callbacks] = None,
+    bounded: bool = False,
+) -> _TSolution:
+    """
+    Solves `problem` by applying random non-worsening moves to `solution` for `budget` seconds.
+
+    If `transpositions` is positive, solutions must support `solution_hash` and moves `hash_increment`. The hashes of
+    the last `transpositions` solutions visited are then kept, and moves that do not change the objective value but
+    lead back to one of them are rejected.
+
+    Moves are drawn from `neighbourhood`, or from `problem.local_neighbourhood()` if it is not given. If `bounded` is
+    true, moves must also support `bounded_objective_value_increment`, which is used with a bound of 0 instead of
+    `objective_value_increment`, so that the evaluation of a move can stop once it is known to be worsening.
+    """
+    return run_steps(
+        rls_steps(problem, solution, budget, termination, transpositions, neighbourhood, callbacks, bounded)
+    )
+
+
+def rls_steps(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    budget: float,
+    termination: Optional[Termination] = None,
+    transpositions: int = 0,
+    neighbourhood: Optional[_Neighbourhood[_TSolution]] = None,
+    callbacks: Optional[Callbacks] = None,
+    bounded: bool = False,
+    step: int = 1000,
+) -> Generator[_TSolution, None, _TSolution]:
+    """
+    Step-wise version of `rls`.
+
+    Yields the current solution after every `step` move evaluations and returns it when the budget is exhausted or a
+    local optimum is reached. Time spent suspended between steps does not count towards `budget`. The yielded solution
+    is modified in place once the search resumes, so copy it if it must be kept.
+    """
+    if termination is None:
+        termination = Termination()
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
 
-    neigh = problem.local_neighbourhood()
+    start = perf_counter()
 
+    neigh = problem.local_neighbourhood() if neighbourhood is None else neighbourhood
+
+    obj = objective_value(solution)
+    if obj is not None and obj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return solution
+
+    if transpositions > 0:
+        table = TranspositionTable[bool](transpositions)
+        h = cast(SupportsSolutionHash, solution).solution_hash()
+        table.put(h, True)
+    else:
+        table = None
+        h = 0
+
+    evals = 0
+    next_step = step
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = start + termination.max_time_without_improvement
     while perf_counter() - start < budget:
         for move in neigh.random_moves_without_replacement(solution):
-            incr = move.objective_value_increment(solution)
+            if evals >= next_step:
+                paused = perf_counter()
+                yield solution
+                paused = perf_counter() - paused
+                start += paused
+                stalled_time += paused
+                next_step = evals + step
+            if evals >= stalled_evals:
+                termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+                return solution
+            if bounded:
+                incr = cast(_BoundedMove[_TSolution], move).bounded_objective_value_increment(solution, 0)
+            else:
+                incr = move.objective_value_increment(solution)
             assert incr is not None
-            if incr <= 0:
-                log.info(f"Found increment: {incr}")
+            evals += 1
+            if on_iteration is not None:
+                on_iteration(Progress(solution, obj, evals))
+            revisit = False
+            nh = h
+            if incr <= 0 and table is not None:
+                nh = h ^ cast(SupportsHashIncrement[_TSolution], move).hash_increment(solution)
+                revisit = incr == 0 and nh in table
+            if incr <= 0 and not revisit:
+                log.info("Found increment: %s", incr)
                 solution = move.apply_move(solution)
+                if table is not None:
+                    h = nh
+                    table.put(h, True)
+                if obj is not None:
+                    obj += incr
+                if on_accept is not None:
+                    on_accept(Progress(solution, obj, evals))
+                if incr < 0:
+                    if on_improvement is not None:
+                        on_improvement(Progress(solution, obj, evals))
+                    if obj is not None and obj <= termination.target:
+                        termination.stop(StopReason.TARGET)
+                        return solution
+                    stalled_evals = evals + termination.max_evals_without_improvement
+                    stalled_time = perf_counter() + termination.max_time_without_improvement
+                elif perf_counter() >= stalled_time:
+                    # Sideways moves do not reach the checks below, and the budget is checked by the outer loop
+                    termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+                    return solution
                 break
-            if perf_counter() - start >= budget:
+            now = perf_counter()
+            if now - start >= budget:
+                termination.stop(StopReason.BUDGET)
+                return solution
+            if now >= stalled_time:
+                termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
                 return solution
         else:
-            break
+            termination.stop(StopReason.CONVERGED)
+            return solution
 
+    termination.stop(StopReason.BUDGET)
     return solution
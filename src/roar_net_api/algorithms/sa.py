@@ -2,20 +2,31 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import math
 import random
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import accumulate
 from logging import getLogger
 from math import exp
 from time import perf_counter
-from typing import Callable, Optional, Protocol, TypeVar
+from typing import Callable, Generator, Optional, Protocol, TypeVar, cast
 
 from ..operations import (
     SupportsApplyMove,
+    SupportsBoundedObjectiveValueIncrement,
     SupportsCopySolution,
     SupportsLocalNeighbourhood,
+    SupportsMovesRange,
     SupportsObjectiveValue,
     SupportsObjectiveValueIncrement,
+    SupportsObjectiveValueIncrements,
     SupportsRandomMovesWithoutReplacement,
 )
+from ..utils.checkpoint import Checkpointer
+from ..utils.stepwise import run_steps
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination
 
 log = getLogger(__name__)
 
@@ -29,9 +40,17 @@ _TSolution = TypeVar("_TSolution", bound=_Solution)
 class _Move(SupportsApplyMove[_TSolution], SupportsObjectiveValueIncrement[_TSolution], Protocol): ...
 
 
+class _BoundedMove(SupportsApplyMove[_TSolution], SupportsBoundedObjectiveValueIncrement[_TSolution], Protocol): ...
+
+
 class _Neighbourhood(SupportsRandomMovesWithoutReplacement[_TSolution, _Move[_TSolution]], Protocol): ...
 
 
+class _BatchNeighbourhood(
+    SupportsObjectiveValueIncrements[_TSolution], SupportsMovesRange[_TSolution, _Move[_TSolution]], Protocol
+): ...
+
+
 class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
 
 
@@ -52,41 +71,309 @@ class ExponentialAcceptance:
         else:
             return exp(-incr / t)
 
+    def threshold(self, u: float, t: float) -> float:
+        """
+        Returns the largest increment accepted at temperature `t` when the uniform random number drawn is `u`.
+        """
+        return -t * math.log(u) if u > 0 else math.inf
+
+
+def calibrate_temperature(
+    neighbourhood: _Neighbourhood[_TSolution],
+    solution: _TSolution,
+    acceptance_rate: float,
+    samples: int,
+    acceptance: Optional[Callable[[float, float], float]] = None,
+) -> Optional[float]:
+    """
+    Returns a temperature at which worsening moves from `solution` are accepted with probability `acceptance_rate` on
+    average, estimated from up to `samples` random moves of `neighbourhood`, or `None` if none of them is worsening.
+    """
+    return _calibrate_temperature(neighbourhood, solution, acceptance_rate, samples, acceptance)[0]
+
+
+def _calibrate_temperature(
+    neighbourhood: _Neighbourhood[_TSolution],
+    solution: _TSolution,
+    acceptance_rate: float,
+    samples: int,
+    acceptance: Optional[Callable[[float, float], float]] = None,
+) -> tuple[Optional[float], int]:
+    # Also returns the number of moves evaluated
+    if acceptance is None:
+        acceptance = ExponentialAcceptance()
+
+    incrs = []
+    evals = 0
+    for move in neighbourhood.random_moves_without_replacement(solution):
+        if evals >= samples:
+            break
+        evals += 1
+        incr = move.objective_value_increment(solution)
+        if incr is not None and incr > 0:
+            incrs.append(incr)
+    if len(incrs) == 0:
+        return None, evals
+
+    # The mean acceptance probability increases with the temperature, so bisect on its logarithm
+    lo, hi = math.log(min(incrs)) - 10.0, math.log(max(incrs)) + 10.0
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        t = exp(mid)
+        if sum(acceptance(incr, t) for incr in incrs) < acceptance_rate * len(incrs):
+            lo = mid
+        else:
+            hi = mid
+    return exp(hi), evals
+
 
 def sa(
     problem: _Problem[_TSolution],
     solution: _TSolution,
     budget: float,
-    init_temp: float,
+    init_temp: Optional[float],
     temperature: Optional[Callable[[float], float]] = None,
     acceptance: Optional[Callable[[float, float], float]] = None,
+    termination: Optional[Termination] = None,
+    checkpoint: Optional[Checkpointer] = None,
+    neighbourhood: Optional[_Neighbourhood[_TSolution]] = None,
+    init_acceptance: float = 0.5,
+    calibration_samples: int = 1000,
+    rejection_free: float = 0.0,
+    rate_window: int = 1000,
+    rng: Optional[random.Random] = None,
+    callbacks: Optional[Callbacks] = None,
+    bounded: bool = False,
 ) -> _TSolution:
-    if temperature is None:
-        temperature = LinearDecay(init_temp)
+    """
+    Solves `problem` with simulated annealing starting from the feasible `solution` for `budget` seconds.
+
+    If `checkpoint` is given, the state of the search, including the state of `rng`, is saved periodically, and a
+    search started with an existing checkpoint resumes from it instead of `solution`. The temperature only depends on
+    the elapsed budget, which is saved as well.
+
+    Moves are drawn from `neighbourhood`, or from `problem.local_neighbourhood()` if it is not given, such as a
+    `roar_net_api.utils.composite_neighbourhood.CompositeNeighbourhood` combining several neighbourhoods.
+
+    If `init_temp` is `None`, it is calibrated before the search with `calibrate_temperature` so that worsening moves
+    from `solution` are initially accepted with probability `init_acceptance` on average, by sampling up to
+    `calibration_samples` moves. These evaluations count against `budget` and the evaluation limits of `termination`,
+    and calibration requires the default `temperature` schedule.
+
+    If `rejection_free` is positive, the neighbourhood must also support `objective_value_increments` and
+    `moves_range`. Once the acceptance rate, averaged over about the last `rate_window` proposals, drops below
+    `rejection_free`, each step evaluates the whole neighbourhood at once and applies a move chosen with probability
+    proportional to its acceptance probability, as the next accepted move would be. The evaluation count then advances
+    by a random number of proposals with the same distribution as the number the search would have needed to accept
+    a move, so that evaluation limits keep their meaning.
+
+    If `bounded` is true, moves must also support `bounded_objective_value_increment`, and `acceptance` must have a
+    `threshold(u, t)` method returning the largest increment it accepts at temperature `t` when the random number
+    drawn is `u`, as `ExponentialAcceptance` does. The random number is then drawn before evaluating a move, which is
+    evaluated with the resulting threshold as its bound, so that it can stop once the move is known to be rejected.
+
+    Random choices are made with `rng`, which defaults to a new generator seeded from the functions of `random`, so
+    that `random.seed` still makes runs reproducible.
+    """
+    return run_steps(
+        sa_steps(
+            problem,
+            solution,
+            budget,
+            init_temp,
+            temperature,
+            acceptance,
+            termination,
+            checkpoint,
+            neighbourhood,
+            init_acceptance,
+            calibration_samples,
+            rejection_free,
+            rate_window,
+            rng,
+            callbacks,
+            bounded,
+        )
+    )
+
+
+def sa_steps(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    budget: float,
+    init_temp: Optional[float],
+    temperature: Optional[Callable[[float], float]] = None,
+    acceptance: Optional[Callable[[float, float], float]] = None,
+    termination: Optional[Termination] = None,
+    checkpoint: Optional[Checkpointer] = None,
+    neighbourhood: Optional[_Neighbourhood[_TSolution]] = None,
+    init_acceptance: float = 0.5,
+    calibration_samples: int = 1000,
+    rejection_free: float = 0.0,
+    rate_window: int = 1000,
+    rng: Optional[random.Random] = None,
+    callbacks: Optional[Callbacks] = None,
+    bounded: bool = False,
+    step: int = 1000,
+) -> Generator[_TSolution, None, _TSolution]:
+    """
+    Step-wise version of `sa`.
+
+    Yields the best solution found so far after every `step` move evaluations and returns it when the budget is
+    exhausted. Time spent suspended between steps does not count towards `budget`.
+    """
+    if init_temp is None and temperature is not None:
+        raise ValueError("init_temp can only be calibrated with the default temperature schedule")
 
     if acceptance is None:
         acceptance = ExponentialAcceptance()
 
+    threshold: Optional[Callable[[float, float], float]] = getattr(acceptance, "threshold", None)
+    if bounded and threshold is None:
+        raise ValueError("Bounded evaluation requires an acceptance function with a threshold method")
+
+    if termination is None:
+        termination = Termination()
+
+    if rng is None:
+        rng = random.Random(random.getrandbits(64))
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+    # The acceptance rate is only tracked if it is used
+    track_rate = rejection_free > 0 or on_iteration is not None or on_accept is not None or on_improvement is not None
+
     start = perf_counter()
-    neigh = problem.local_neighbourhood()
+    neigh = problem.local_neighbourhood() if neighbourhood is None else neighbourhood
     best = solution.copy_solution()
+    evals = 0
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = start + termination.max_time_without_improvement
+    rate = 1.0
+    if checkpoint is not None:
+        state = checkpoint.load(problem)
+        if state is not None:
+            if state["algorithm"] != "sa":
+                raise ValueError(f"Checkpoint {checkpoint.path} was not saved by sa")
+            solution = state["solution"]
+            best = state["best"]
+            evals = state["evals"]
+            start -= state["elapsed"]
+            stalled_evals = state["stalled_evals"]
+            stalled_time = start + state["stalled_time"]
+            init_temp = state["init_temp"]
+            rate = state["rate"]
+            rng.setstate(state["random"])
+    if init_temp is None:
+        init_temp, samples = _calibrate_temperature(neigh, solution, init_acceptance, calibration_samples, acceptance)
+        evals += samples
+        if init_temp is None:
+            # No worsening move was found, so any positive temperature behaves the same
+            init_temp = 1.0
+        log.info("Calibrated initial temperature: %s", init_temp)
+    if temperature is None:
+        temperature = LinearDecay(init_temp)
     bestobj = best.objective_value()
+    if bestobj is not None and bestobj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return best
+    next_step = evals + step
+    obj = solution.objective_value()
     while perf_counter() - start < budget:
-        for move in neigh.random_moves_without_replacement(solution):
-            t = temperature(1 - (perf_counter() - start) / budget)
+        # In rejection-free mode, a single proposal stands for the whole neighbourhood
+        batch = rate < rejection_free
+        proposals: Iterable[Optional[_Move[_TSolution]]]
+        proposals = [None] if batch else neigh.random_moves_without_replacement(solution)
+        for move in proposals:
+            if evals >= next_step:
+                paused = perf_counter()
+                yield best
+                paused = perf_counter() - paused
+                start += paused
+                stalled_time += paused
+                next_step = evals + step
+            if evals >= stalled_evals:
+                termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+                return best
+            now = perf_counter()
+            if now >= stalled_time:
+                termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+                return best
+            if checkpoint is not None and checkpoint.due(now):
+                state = {
+                    "algorithm": "sa",
+                    "solution": solution,
+                    "best": best,
+                    "evals": evals,
+                    "elapsed": now - start,
+                    "stalled_evals": stalled_evals,
+                    "stalled_time": stalled_time - start,
+                    "init_temp": init_temp,
+                    "rate": rate,
+                    "random": rng.getstate(),
+                }
+                checkpoint.save(problem, state)
+            t = temperature(1 - (now - start) / budget)
             if t <= 0:
                 break
-            incr = move.objective_value_increment(solution)
-            assert incr is not None
-
-            if acceptance(incr, t) >= random.random():
-                solution = move.apply_move(solution)
-                obj = solution.objective_value()
-                assert obj is not None
-
-                if bestobj is None or obj < bestobj:
-                    # log.info(f"Best solution: {obj}")
-                    best = solution.copy_solution()
-                    bestobj = obj
-                break
+            if move is None:
+                bneigh = cast(_BatchNeighbourhood[_TSolution], neigh)
+                incrs = bneigh.objective_value_increments(solution)
+                probs = list(accumulate(0.0 if incr is None else acceptance(incr, t) for incr in incrs))
+                if len(probs) == 0 or probs[-1] <= 0:
+                    termination.stop(StopReason.CONVERGED)
+                    return best
+                rate = probs[-1] / len(probs)
+                # Count the proposals that would have been rejected before this one was accepted, as the number of
+                # proposals until the first acceptance is geometrically distributed
+                if rate < 1:
+                    evals += int(min(math.log(1.0 - rng.random()) / math.log1p(-rate), 1e18))
+                evals += 1
+                ix = bisect_right(probs, rng.random() * probs[-1])
+                move = next(iter(bneigh.moves_range(solution, ix, ix + 1)))
+                if on_iteration is not None:
+                    on_iteration(Progress(solution, obj, evals, t, rate))
+            elif bounded:
+                assert threshold is not None
+                bound = threshold(rng.random(), t)
+                incr = cast(_BoundedMove[_TSolution], move).bounded_objective_value_increment(solution, bound)
+                assert incr is not None
+                evals += 1
+                accepted = incr <= bound
+                if track_rate:
+                    rate += (accepted - rate) / rate_window
+                if on_iteration is not None:
+                    on_iteration(Progress(solution, obj, evals, t, rate))
+                if not accepted:
+                    continue
+            else:
+                incr = move.objective_value_increment(solution)
+                assert incr is not None
+                evals += 1
+                accepted = acceptance(incr, t) >= rng.random()
+                if track_rate:
+                    rate += (accepted - rate) / rate_window
+                if on_iteration is not None:
+                    on_iteration(Progress(solution, obj, evals, t, rate))
+                if not accepted:
+                    continue
+
+            solution = move.apply_move(solution)
+            obj = solution.objective_value()
+            assert obj is not None
+            if on_accept is not None:
+                on_accept(Progress(solution, obj, evals, t, rate))
+
+            if bestobj is None or obj < bestobj:
+                log.info("Best solution: %s", obj)
+                best = solution.copy_solution()
+                bestobj = obj
+                if on_improvement is not None:
+                    on_improvement(Progress(best, bestobj, evals, t, rate))
+                if obj <= termination.target:
+                    termination.stop(StopReason.TARGET)
+                    return best
+                stalled_evals = evals + termination.max_evals_without_improvement
+                stalled_time = now + termination.max_time_without_improvement
+            break
+    termination.stop(StopReason.BUDGET)
     return best
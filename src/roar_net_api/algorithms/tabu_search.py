@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Hashable
+from logging import getLogger
+from time import perf_counter
+from typing import Optional, Protocol, TypeVar
+
+from ..operations import (
+    SupportsApplyMove,
+    SupportsCopySolution,
+    SupportsLocalNeighbourhood,
+    SupportsMoves,
+    SupportsObjectiveValue,
+    SupportsObjectiveValueIncrement,
+    SupportsTabuAttribute,
+)
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination
+
+log = getLogger(__name__)
+
+
+class _Solution(SupportsCopySolution, SupportsObjectiveValue, Protocol): ...
+
+
+_TSolution = TypeVar("_TSolution", bound=_Solution)
+
+
+class _Move(
+    SupportsApplyMove[_TSolution],
+    SupportsObjectiveValueIncrement[_TSolution],
+    SupportsTabuAttribute[_TSolution],
+    Protocol,
+): ...
+
+
+class _Neighbourhood(SupportsMoves[_TSolution, _Move[_TSolution]], Protocol): ...
+
+
+class _Problem(SupportsLocalNeighbourhood[_Neighbourhood[_TSolution]], Protocol): ...
+
+
+_EMPTY = object()
+
+
+class TabuList:
+    """
+    Class to keep the attributes of the last `tenure` moves
+
+    Attributes are kept in a ring buffer, and counted in a dictionary so that membership tests take constant time.
+    """
+
+    def __init__(self, tenure: int):
+        self.tenure = tenure
+        self.ring: list[object] = [_EMPTY] * tenure
+        self.head = 0
+        self.counts: dict[Hashable, int] = {}
+
+    def add(self, attr: Hashable) -> None:
+        if self.tenure == 0:
+            return
+        old = self.ring[self.head]
+        if old is not _EMPTY:
+            assert isinstance(old, Hashable)
+            if self.counts[old] == 1:
+                del self.counts[old]
+            else:
+                self.counts[old] -= 1
+        self.ring[self.head] = attr
+        self.counts[attr] = self.counts.get(attr, 0) + 1
+        self.head = (self.head + 1) % self.tenure
+
+    def __contains__(self, attr: Hashable) -> bool:
+        return attr in self.counts
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+def tabu_search(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    budget: float,
+    tenure: int = 10,
+    termination: Optional[Termination] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> _TSolution:
+    """
+    Solves `problem` with tabu search starting from the feasible `solution`.
+
+    Every iteration applies the best move in the local neighbourhood whose tabu attribute was not used by any of the
+    last `tenure` applied moves, even if it does not improve the solution. Tabu moves are still allowed if they lead to
+    a new best solution (aspiration).
+    """
+    if termination is None:
+        termination = Termination()
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+
+    start = perf_counter()
+
+    neigh = problem.local_neighbourhood()
+
+    obj = solution.objective_value()
+    assert obj is not None
+
+    best = solution.copy_solution()
+    bestobj = obj
+    if bestobj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return best
+
+    tabu = TabuList(tenure)
+
+    evals = 0
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = start + termination.max_time_without_improvement
+    while perf_counter() - start < budget:
+        chosen = None
+        chosen_incr = 0.0
+        chosen_attr: Hashable = None
+        for move in neigh.moves(solution):
+            incr = move.objective_value_increment(solution)
+            assert incr is not None
+            evals += 1
+            if chosen is not None and incr >= chosen_incr:
+                continue
+            attr = move.tabu_attribute(solution)
+            if attr in tabu and obj + incr >= bestobj:
+                continue
+            chosen = move
+            chosen_incr = incr
+            chosen_attr = attr
+
+        if chosen is None:
+            termination.stop(StopReason.CONVERGED)
+            return best
+
+        solution = chosen.apply_move(solution)
+        obj += chosen_incr
+        tabu.add(chosen_attr)
+        if on_accept is not None:
+            on_accept(Progress(solution, obj, evals))
+
+        if obj < bestobj:
+            log.info("Best solution: %s", obj)
+            best = solution.copy_solution()
+            bestobj = obj
+            if on_improvement is not None:
+                on_improvement(Progress(best, bestobj, evals))
+            if bestobj <= termination.target:
+                termination.stop(StopReason.TARGET)
+                return best
+            stalled_evals = evals + termination.max_evals_without_improvement
+            stalled_time = perf_counter() + termination.max_time_without_improvement
+
+        if on_iteration is not None:
+            on_iteration(Progress(solution, obj, evals))
+
+        if evals >= stalled_evals:
+            termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+            return best
+        if perf_counter() >= stalled_time:
+            termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+            return best
+
+    termination.stop(StopReason.BUDGET)
+    return best
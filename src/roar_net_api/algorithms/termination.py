@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from enum import Enum
+from logging import getLogger
+from math import inf
+from typing import Optional, Union, cast
+
+log = getLogger(__name__)
+
+
+class StopReason(Enum):
+    BUDGET = "budget"
+    TARGET = "target"
+    EVALUATIONS_WITHOUT_IMPROVEMENT = "evaluations without improvement"
+    TIME_WITHOUT_IMPROVEMENT = "time without improvement"
+    CONVERGED = "converged"
+    TRIMMED = "converged after trimming"
+
+
+class Termination:
+    """
+    Stopping criteria accepted by all algorithms
+
+    A search stops as soon as its best objective value is less than or equal to `target`, or once
+    `max_evals_without_improvement` evaluations or `max_time_without_improvement` seconds have passed since the best
+    solution last improved (or since the start, if it never did). Algorithms check these criteria at their natural
+    granularity, e.g., after every move evaluation in `sa` and after every layer in `beam_search`.
+
+    The reason why the most recent search using this object stopped is stored in `reason`.
+    """
+
+    def __init__(
+        self,
+        target: Optional[Union[int, float]] = None,
+        max_evals_without_improvement: Optional[int] = None,
+        max_time_without_improvement: Optional[float] = None,
+    ) -> None:
+        self.target: Union[int, float] = -inf if target is None else target
+        self.max_evals_without_improvement: Union[int, float] = (
+            inf if max_evals_without_improvement is None else max_evals_without_improvement
+        )
+        self.max_time_without_improvement: float = (
+            inf if max_time_without_improvement is None else max_time_without_improvement
+        )
+        self.reason: Optional[StopReason] = None
+
+    def stop(self, reason: StopReason) -> None:
+        log.info("Stopping: %s", reason.value)
+        self.reason = reason
+
+
+def objective_value(solution: object) -> Optional[Union[int, float]]:
+    """
+    Returns the objective value of `solution`, or `None` if it does not support `objective_value`, as in algorithms
+    that only need increments. The `target` of a `Termination` is then never reached.
+    """
+    method = getattr(solution, "objective_value", None)
+    return None if method is None else cast(Optional[Union[int, float]], method())
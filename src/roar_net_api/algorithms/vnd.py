@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Sequence
+from logging import getLogger
+from time import perf_counter
+from typing import Optional, Protocol, TypeVar
+
+from ..operations import (
+    SupportsApplyMove,
+    SupportsLocalNeighbourhoods,
+    SupportsMoves,
+    SupportsObjectiveValueIncrement,
+)
+from .callbacks import Callbacks, Progress, hooks
+from .termination import StopReason, Termination, objective_value
+
+log = getLogger(__name__)
+
+
+_TSolution = TypeVar("_TSolution")
+
+
+class _Move(SupportsApplyMove[_TSolution], SupportsObjectiveValueIncrement[_TSolution], Protocol): ...
+
+
+class _Neighbourhood(SupportsMoves[_TSolution, _Move[_TSolution]], Protocol): ...
+
+
+class _Problem(SupportsLocalNeighbourhoods[_Neighbourhood[_TSolution]], Protocol): ...
+
+
+def vnd(
+    problem: _Problem[_TSolution],
+    solution: _TSolution,
+    neighbourhoods: Optional[Sequence[_Neighbourhood[_TSolution]]] = None,
+    termination: Optional[Termination] = None,
+    callbacks: Optional[Callbacks] = None,
+) -> _TSolution:
+    """
+    Solves `problem` with variable neighbourhood descent starting from `solution`.
+
+    The `neighbourhoods`, by default those returned by `problem.local_neighbourhoods()`, are searched in order for an
+    improving move, which is applied as soon as it is found. The search then goes back to the first neighbourhood,
+    and only moves on to the next one when the current one has no improving move. The returned solution is a local
+    optimum with respect to all neighbourhoods, so cheaper neighbourhoods should come first.
+    """
+    if termination is None:
+        termination = Termination()
+
+    on_iteration, on_accept, on_improvement, _ = hooks(callbacks)
+
+    if neighbourhoods is None:
+        neighbourhoods = problem.local_neighbourhoods()
+
+    obj = objective_value(solution)
+    if obj is not None and obj <= termination.target:
+        termination.stop(StopReason.TARGET)
+        return solution
+
+    evals = 0
+    stalled_evals = termination.max_evals_without_improvement
+    stalled_time = perf_counter() + termination.max_time_without_improvement
+    k = 0
+    while k < len(neighbourhoods):
+        for move in neighbourhoods[k].moves(solution):
+            incr = move.objective_value_increment(solution)
+            assert incr is not None
+            evals += 1
+            if on_iteration is not None:
+                on_iteration(Progress(solution, obj, evals))
+            if incr < 0:
+                log.info("Found increment in neighbourhood %d: %s", k, incr)
+                solution = move.apply_move(solution)
+                if obj is not None:
+                    obj += incr
+                if on_accept is not None:
+                    on_accept(Progress(solution, obj, evals))
+                if on_improvement is not None:
+                    on_improvement(Progress(solution, obj, evals))
+                if obj is not None and obj <= termination.target:
+                    termination.stop(StopReason.TARGET)
+                    return solution
+                stalled_evals = evals + termination.max_evals_without_improvement
+                stalled_time = perf_counter() + termination.max_time_without_improvement
+                k = 0
+                break
+            if evals >= stalled_evals:
+                termination.stop(StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT)
+                return solution
+        else:
+            k += 1
+
+        if perf_counter() >= stalled_time:
+            termination.stop(StopReason.TIME_WITHOUT_IMPROVEMENT)
+            return solution
+
+    termination.stop(StopReason.CONVERGED)
+    return solution
@@ -3,37 +3,59 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from .apply_move import SupportsApplyMove
+from .bounded_objective_value_increment import SupportsBoundedObjectiveValueIncrement
 from .construction_neighbourhood import SupportsConstructionNeighbourhood
 from .copy_solution import SupportsCopySolution
 from .destruction_neighbourhood import SupportsDestructionNeighbourhood
+from .distance_increment import SupportsDistanceIncrement
 from .empty_solution import SupportsEmptySolution
+from .hash_increment import SupportsHashIncrement
 from .heuristic_solution import SupportsHeuristicSolution
 from .invert_move import SupportsInvertMove
 from .local_neighbourhood import SupportsLocalNeighbourhood
-from .lower_bound_increment import SupportsLowerBoundIncrement
+from .local_neighbourhoods import SupportsLocalNeighbourhoods
 from .lower_bound import SupportsLowerBound
+from .lower_bound_increment import SupportsLowerBoundIncrement
+from .move_count import SupportsMoveCount
 from .moves import SupportsMoves
-from .objective_value_increment import SupportsObjectiveValueIncrement
+from .moves_delta import SupportsMovesDelta
+from .moves_range import SupportsMovesRange
 from .objective_value import SupportsObjectiveValue
+from .objective_value_increment import SupportsObjectiveValueIncrement
+from .objective_value_increments import SupportsObjectiveValueIncrements
 from .random_move import SupportsRandomMove
 from .random_moves_without_replacement import SupportsRandomMovesWithoutReplacement
 from .random_solution import SupportsRandomSolution
+from .solution_distance import SupportsSolutionDistance
+from .solution_hash import SupportsSolutionHash
+from .tabu_attribute import SupportsTabuAttribute
 
 __all__ = [
     "SupportsApplyMove",
+    "SupportsBoundedObjectiveValueIncrement",
     "SupportsConstructionNeighbourhood",
     "SupportsCopySolution",
     "SupportsDestructionNeighbourhood",
+    "SupportsDistanceIncrement",
     "SupportsEmptySolution",
+    "SupportsHashIncrement",
     "SupportsHeuristicSolution",
     "SupportsInvertMove",
     "SupportsLocalNeighbourhood",
+    "SupportsLocalNeighbourhoods",
     "SupportsLowerBoundIncrement",
     "SupportsLowerBound",
+    "SupportsMoveCount",
     "SupportsMoves",
+    "SupportsMovesDelta",
+    "SupportsMovesRange",
     "SupportsObjectiveValueIncrement",
+    "SupportsObjectiveValueIncrements",
     "SupportsObjectiveValue",
     "SupportsRandomMove",
     "SupportsRandomMovesWithoutReplacement",
     "SupportsRandomSolution",
+    "SupportsSolutionDistance",
+    "SupportsSolutionHash",
+    "SupportsTabuAttribute",
 ]
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Optional, Protocol, TypeVar, Union
+
+Solution = TypeVar("Solution", contravariant=True)
+
+
+class SupportsBoundedObjectiveValueIncrement(Protocol[Solution]):
+    """
+    Moves whose objective value increment only needs to be exact if it is not greater than `bound`. Otherwise, any
+    value greater than `bound` may be returned, so that the evaluation can stop as soon as it is known to exceed it.
+    """
+
+    def bounded_objective_value_increment(
+        self, solution: Solution, bound: Union[int, float]
+    ) -> Optional[Union[int, float]]: ...
@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Protocol, TypeVar, Union
+
+Solution = TypeVar("Solution", contravariant=True)
+
+
+class SupportsDistanceIncrement(Protocol[Solution]):
+    """
+    Moves whose effect on the distance from a solution to a `target` solution can be computed without applying them.
+    """
+
+    def distance_increment(self, solution: Solution, target: Solution) -> Union[int, float]: ...
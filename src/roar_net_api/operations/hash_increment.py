@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Protocol, TypeVar
+
+Solution = TypeVar("Solution", contravariant=True)
+
+
+class SupportsHashIncrement(Protocol[Solution]):
+    """
+    Moves whose effect on the hash of a solution can be computed without applying them, such that the hash of the
+    solution after applying the move is `solution.solution_hash() ^ move.hash_increment(solution)`.
+    """
+
+    def hash_increment(self, solution: Solution) -> int: ...
@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Sequence
+from typing import Protocol, TypeVar
+
+Neighbourhood = TypeVar("Neighbourhood", covariant=True)
+
+
+class SupportsLocalNeighbourhoods(Protocol[Neighbourhood]):
+    """
+    Problems that provide several local neighbourhoods, ordered from the cheapest to the most expensive to search.
+    """
+
+    def local_neighbourhoods(self) -> Sequence[Neighbourhood]: ...
@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Iterable
+from typing import Protocol, TypeVar
+
+Solution = TypeVar("Solution", contravariant=True)
+Move = TypeVar("Move")
+
+
+class SupportsMovesDelta(Protocol[Solution, Move]):
+    """
+    Neighbourhoods that can tell which of their moves change when one of them is applied. After `move` has been applied
+    to `solution`, `moves_delta(solution, move)` returns the moves that were removed or whose increments may have
+    changed, and the moves that were added or changed, such that the moves of `solution` are those of the solution
+    before the move, without the former, and with the latter. Moves must be hashable, and moves making the same change
+    must compare equal.
+    """
+
+    def moves_delta(self, solution: Solution, move: Move) -> tuple[Iterable[Move], Iterable[Move]]: ...
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Iterable
+from typing import Protocol, TypeVar
+
+Solution = TypeVar("Solution", contravariant=True)
+Move = TypeVar("Move", covariant=True)
+
+
+class SupportsMovesRange(Protocol[Solution, Move]):
+    """
+    Neighbourhoods whose moves for a given solution can be numbered from 0 to `move_count(solution) - 1`, such that
+    `moves_range(solution, start, stop)` generates the moves numbered from `start` to `stop - 1`, in order.
+    """
+
+    def moves_range(self, solution: Solution, start: int, stop: int) -> Iterable[Move]: ...
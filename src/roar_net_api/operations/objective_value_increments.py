@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Sequence
+from typing import Optional, Protocol, TypeVar, Union
+
+Solution = TypeVar("Solution", contravariant=True)
+
+
+class SupportsObjectiveValueIncrements(Protocol[Solution]):
+    """
+    Neighbourhoods that can evaluate all their moves for a given solution at once, returning the objective value
+    increments of the moves in the order in which `moves_range` numbers them.
+    """
+
+    def objective_value_increments(self, solution: Solution) -> Sequence[Optional[Union[int, float]]]: ...
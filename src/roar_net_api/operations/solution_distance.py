@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Protocol, TypeVar, Union
+
+Solution = TypeVar("Solution", contravariant=True)
+
+
+class SupportsSolutionDistance(Protocol[Solution]):
+    """
+    Solutions that can measure how far they are from another solution, where a distance of zero means that both
+    solutions are equivalent.
+    """
+
+    def solution_distance(self, other: Solution) -> Union[int, float]: ...
@@ -0,0 +1,12 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Hashable
+from typing import Protocol, TypeVar
+
+Solution = TypeVar("Solution", contravariant=True)
+
+
+class SupportsTabuAttribute(Protocol[Solution]):
+    def tabu_attribute(self, solution: Solution) -> Hashable: ...
@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Check and profile a model from the command line.
+
+Usage: python -m roar_net_api.profile [options] MODEL INSTANCE [INSTANCE ...]
+
+MODEL is either a path to a Python file or the name of a module defining a problem class (`Problem` by default) with
+a `from_textio` class method, which is used to load each INSTANCE. Random solutions and moves are then sampled, and
+the operations the model supports are checked and timed:
+
+- `lower_bound_increment` of construction moves must match the change of `lower_bound` after `apply_move`;
+- `objective_value_increment` of local moves must match the change of `objective_value` after `apply_move`.
+
+Timings are reported per instance, so that instances of different sizes show how each operation scales, and for
+construction operations also per quarter of the construction. The exit status is 1 if any check failed.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import math
+import os
+import random
+import sys
+from collections import defaultdict
+from collections.abc import Callable
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+_MAX_REPORTED = 5
+
+
+class _Profile:
+    def __init__(self) -> None:
+        self.time: defaultdict[str, float] = defaultdict(float)
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        self.progress: defaultdict[str, list[list[float]]] = defaultdict(lambda: [[], [], [], []])
+        self.errors: list[str] = []
+        self.checks = 0
+
+    def timed(self, op: str, f: Callable[..., _T], *args: Any) -> _T:
+        start = perf_counter()
+        result = f(*args)
+        self.time[op] += perf_counter() - start
+        self.calls[op] += 1
+        return result
+
+    def check(self, what: str, expected: Any, actual: Any) -> None:
+        self.checks += 1
+        if expected is None or actual is None:
+            ok = expected is None and actual is None
+        else:
+            ok = math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+        if not ok:
+            self.errors.append(f"{what}: expected {expected}, got {actual}")
+
+
+def _load_model(model: str) -> ModuleType:
+    if os.path.isfile(model):
+        name = os.path.splitext(os.path.basename(model))[0]
+        spec = importlib.util.spec_from_file_location(name, model)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load model from {model}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+    return importlib.import_module(model)
+
+
+def _random_construction(problem: Any, prof: _Profile, check: int) -> Optional[Any]:
+    """
+    Builds a solution by applying random construction moves to an empty solution, checking the lower bound increments
+    of up to `check` random moves at every step.
+    """
+    neigh = prof.timed("construction_neighbourhood", problem.construction_neighbourhood)
+    s = prof.timed("empty_solution", problem.empty_solution)
+    trace: list[tuple[str, float]] = []
+    while True:
+        start = perf_counter()
+        moves = list(neigh.moves(s))
+        elapsed = perf_counter() - start
+        if len(moves) == 0:
+            break
+        prof.time["moves"] += elapsed
+        prof.calls["moves"] += len(moves)
+        trace.append(("moves", elapsed / len(moves)))
+        if check > 0 and hasattr(s, "lower_bound"):
+            lb = s.lower_bound()
+            for m in moves if len(moves) <= check else random.sample(moves, check):
+                start = perf_counter()
+                incr = m.lower_bound_increment(s)
+                elapsed = perf_counter() - start
+                prof.time["lower_bound_increment"] += elapsed
+                prof.calls["lower_bound_increment"] += 1
+                trace.append(("lower_bound_increment", elapsed))
+                if incr is None:
+                    continue
+                ns = prof.timed("copy_solution", s.copy_solution)
+                ns = prof.timed("apply_move", m.apply_move, ns)
+                nlb = prof.timed("lower_bound", ns.lower_bound)
+                prof.check("lower_bound_increment", None if nlb is None or lb is None else nlb - lb, incr)
+        s = random.choice(moves).apply_move(s)
+
+    # Attribute the cost of every operation to the quarter of the construction in which it was measured
+    for ix, (op, elapsed) in enumerate(trace):
+        prof.progress[op][4 * ix // len(trace)].append(elapsed)
+    return s
+
+
+def _random_solution(problem: Any, prof: _Profile) -> Optional[Any]:
+    if hasattr(problem, "random_solution"):
+        return prof.timed("random_solution", problem.random_solution)
+    if hasattr(problem, "construction_neighbourhood") and hasattr(problem, "empty_solution"):
+        return _random_construction(problem, prof, 0)
+    return None
+
+
+def _check_local(problem: Any, s: Any, moves: int, prof: _Profile) -> None:
+    """
+    Checks the objective value increments of `moves` random local moves, applying each of them in turn.
+    """
+    neigh = prof.timed("local_neighbourhood", problem.local_neighbourhood)
+    obj = prof.timed("objective_value", s.objective_value)
+    for _ in range(moves):
+        if hasattr(neigh, "random_move"):
+            m = prof.timed("random_move", neigh.random_move, s)
+        else:
+            moves_iter = prof.timed("random_moves_without_replacement", neigh.random_moves_without_replacement, s)
+            m = next(iter(moves_iter), None)
+        if m is None:
+            return
+        incr = prof.timed("objective_value_increment", m.objective_value_increment, s)
+        ns = prof.timed("copy_solution", s.copy_solution)
+        ns = prof.timed("apply_move", m.apply_move, ns)
+        nobj = prof.timed("objective_value", ns.objective_value)
+        prof.check("objective_value_increment", None if nobj is None or obj is None else nobj - obj, incr)
+        # Keep walking from the new solution, so that bugs that corrupt its state are caught by later checks
+        s = ns
+        obj = nobj
+
+
+def profile_instance(problem: Any, samples: int, moves: int) -> _Profile:
+    prof = _Profile()
+    has_construction = hasattr(problem, "construction_neighbourhood") and hasattr(problem, "empty_solution")
+    for _ in range(samples):
+        if has_construction:
+            _random_construction(problem, prof, moves)
+        if hasattr(problem, "local_neighbourhood"):
+            s = _random_solution(problem, prof)
+            if s is not None:
+                _check_local(problem, s, moves, prof)
+    return prof
+
+
+def _report(prof: _Profile) -> None:
+    print(f"  {'operation':<36} {'calls':>10} {'mean (us)':>12}")
+    for op in sorted(prof.calls):
+        print(f"  {op:<36} {prof.calls[op]:>10} {1e6 * prof.time[op] / prof.calls[op]:>12.2f}")
+    if len(prof.progress) > 0:
+        print()
+        print(f"  {'construction progress (us)':<36} {'0-25%':>10} {'25-50%':>10} {'50-75%':>10} {'75-100%':>10}")
+        for op in sorted(prof.progress):
+            means = [f"{1e6 * sum(q) / len(q):>10.2f}" if len(q) > 0 else f"{'-':>10}" for q in prof.progress[op]]
+            print(f"  {op:<36} {' '.join(means)}")
+    print()
+    print(f"  {prof.checks} checks, {len(prof.errors)} failed")
+    for e in prof.errors[:_MAX_REPORTED]:
+        print(f"    {e}")
+    if len(prof.errors) > _MAX_REPORTED:
+        print(f"    ... and {len(prof.errors) - _MAX_REPORTED} more")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m roar_net_api.profile", description="Check and profile the operations of a model."
+    )
+    parser.add_argument("model", help="path to a Python file or name of a module")
+    parser.add_argument("instances", nargs="+", help="instance files")
+    parser.add_argument("--problem", default="Problem", help="name of the problem class (default: %(default)s)")
+    parser.add_argument("--samples", type=int, default=10, help="random solutions per instance (default: %(default)s)")
+    parser.add_argument(
+        "--moves", type=int, default=100, help="moves checked per solution or construction step (default: %(default)s)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    model = _load_model(args.model)
+    cls = getattr(model, args.problem)
+
+    failed = False
+    for path in args.instances:
+        random.seed(args.seed)
+        start = perf_counter()
+        with open(path) as f:
+            problem = cls.from_textio(f)
+        print(f"{path} (loaded in {perf_counter() - start:.3f}s)")
+        prof = profile_instance(problem, args.samples, args.moves)
+        _report(prof)
+        failed = failed or len(prof.errors) > 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
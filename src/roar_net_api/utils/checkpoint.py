@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+from logging import getLogger
+from time import perf_counter
+from typing import Any, Optional, Union
+
+from .pickling import ProblemPickler, ProblemUnpickler
+
+log = getLogger(__name__)
+
+
+class Checkpointer:
+    """
+    Class to periodically save the state of a search to `path`, so that it can be resumed after an interruption
+
+    States are pickled with references to the problem instead of the problem itself, and are written to a temporary
+    file that atomically replaces `path`, so an interruption while saving leaves the previous checkpoint intact.
+    Checkpoints are taken at most every `interval` seconds, and further apart if needed to keep the time spent saving
+    below a fraction `max_overhead` of the running time.
+
+    Algorithms that accept a checkpointer resume from `path` if it exists. The file is left in place once the search
+    finishes, so remove it to start afresh.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], interval: float = 60.0, max_overhead: float = 0.01):
+        self.path = os.fspath(path)
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.next_save = perf_counter() + interval
+        self.overhead = 0.0
+
+    def due(self, now: float) -> bool:
+        return now >= self.next_save
+
+    def save(self, problem: object, state: dict[str, Any]) -> None:
+        start = perf_counter()
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                ProblemPickler(f, problem).dump(state)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        now = perf_counter()
+        spent = now - start
+        self.overhead += spent
+        self.next_save = now + max(self.interval, spent / self.max_overhead)
+        log.info("Checkpoint saved in %.3fs", spent)
+
+    def load(self, problem: object) -> Optional[dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as f:
+                state: dict[str, Any] = ProblemUnpickler(f, problem).load()
+        except FileNotFoundError:
+            return None
+        log.info("Resuming from checkpoint %s", self.path)
+        return state
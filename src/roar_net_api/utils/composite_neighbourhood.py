@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from collections.abc import Iterable, Iterator, Sequence
+from time import perf_counter
+from typing import Any, Generic, Optional, Protocol, TypeVar, Union, cast
+
+from ..operations import (
+    SupportsApplyMove,
+    SupportsBoundedObjectiveValueIncrement,
+    SupportsObjectiveValueIncrement,
+    SupportsRandomMovesWithoutReplacement,
+)
+
+_TSolution = TypeVar("_TSolution")
+
+
+class _Move(SupportsApplyMove[_TSolution], SupportsObjectiveValueIncrement[_TSolution], Protocol): ...
+
+
+class _BoundedMove(SupportsApplyMove[_TSolution], SupportsBoundedObjectiveValueIncrement[_TSolution], Protocol): ...
+
+
+class _Neighbourhood(SupportsRandomMovesWithoutReplacement[_TSolution, _Move[_TSolution]], Protocol): ...
+
+
+class CompositeMove(Generic[_TSolution]):
+    """
+    Move of a `CompositeNeighbourhood`, which wraps a move of one of its neighbourhoods
+
+    Evaluating the move charges the time taken to generate and evaluate it to its neighbourhood, and applying an
+    improving move credits the improvement to it. Other operations are forwarded to the wrapped move.
+    """
+
+    def __init__(self, composite: "CompositeNeighbourhood[_TSolution]", op: int, move: _Move[_TSolution], cost: float):
+        self.composite = composite
+        self.op = op
+        self.move = move
+        self.cost = cost
+        self.incr: Optional[Union[int, float]] = None
+
+    def objective_value_increment(self, solution: _TSolution) -> Optional[Union[int, float]]:
+        start = perf_counter()
+        self.incr = self.move.objective_value_increment(solution)
+        self._charge(start)
+        return self.incr
+
+    def bounded_objective_value_increment(
+        self, solution: _TSolution, bound: Union[int, float]
+    ) -> Optional[Union[int, float]]:
+        start = perf_counter()
+        self.incr = cast(_BoundedMove[_TSolution], self.move).bounded_objective_value_increment(solution, bound)
+        self._charge(start)
+        return self.incr
+
+    def _charge(self, start: float) -> None:
+        self.composite._charge(self.op, self.cost + perf_counter() - start)
+        # Only the first evaluation is charged for generating the move
+        self.cost = 0.0
+
+    def apply_move(self, solution: _TSolution) -> _TSolution:
+        if self.incr is not None and self.incr < 0:
+            self.composite._credit(self.op, -self.incr)
+        return self.move.apply_move(solution)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.move, name)
+
+
+class CompositeNeighbourhood(Generic[_TSolution]):
+    """
+    Class to draw random moves from several neighbourhoods, with adaptive operator selection
+
+    Every move is drawn from one of the `neighbourhoods`, chosen with probability proportional to the improvement it
+    achieved per second spent generating and evaluating its moves (probability matching). Both quantities decay by
+    `decay` every time the neighbourhood is used, so that the choice tracks the current phase of the search, and every
+    neighbourhood is chosen with probability at least `min_probability` so that its rate remains up to date.
+
+    Moves are drawn without replacement from each neighbourhood until all of them are exhausted. The composite can be
+    passed as the `neighbourhood` of `sa` and `rls`, and only improvements of moves that are applied are credited.
+    Neighbourhoods are chosen with `rng`, which defaults to a new generator seeded from the functions of `random`.
+    """
+
+    def __init__(
+        self,
+        neighbourhoods: Sequence[_Neighbourhood[_TSolution]],
+        decay: float = 0.99,
+        min_probability: float = 0.05,
+        rng: Optional[random.Random] = None,
+    ):
+        if len(neighbourhoods) == 0:
+            raise ValueError("At least one neighbourhood is required")
+        if min_probability * len(neighbourhoods) > 1:
+            raise ValueError(f"min_probability must be at most {1 / len(neighbourhoods)}")
+        self.neighbourhoods = neighbourhoods
+        self.decay = decay
+        self.min_probability = min_probability
+        self.gain = [0.0] * len(neighbourhoods)
+        self.time = [0.0] * len(neighbourhoods)
+        self.rng = random.Random(random.getrandbits(64)) if rng is None else rng
+
+    def _charge(self, op: int, elapsed: float) -> None:
+        self.gain[op] *= self.decay
+        self.time[op] = self.decay * self.time[op] + elapsed
+
+    def _credit(self, op: int, improvement: Union[int, float]) -> None:
+        self.gain[op] += improvement
+
+    def probabilities(self) -> list[float]:
+        """
+        Returns the probability of choosing each neighbourhood.
+        """
+        rates = [g / t if t > 0 else 0.0 for g, t in zip(self.gain, self.time)]
+        total = sum(rates)
+        k = len(rates)
+        if total <= 0:
+            return [1 / k] * k
+        return [self.min_probability + (1 - k * self.min_probability) * r / total for r in rates]
+
+    def random_moves_without_replacement(self, solution: _TSolution) -> Iterable[CompositeMove[_TSolution]]:
+        iters: list[Optional[Iterator[_Move[_TSolution]]]] = [None] * len(self.neighbourhoods)
+        ops = list(range(len(self.neighbourhoods)))
+        while len(ops) > 0:
+            probs = self.probabilities()
+            op = ops[0] if len(ops) == 1 else self.rng.choices(ops, [probs[i] for i in ops])[0]
+            start = perf_counter()
+            it = iters[op]
+            if it is None:
+                it = iters[op] = iter(self.neighbourhoods[op].random_moves_without_replacement(solution))
+            move = next(it, None)
+            if move is None:
+                ops.remove(op)
+                continue
+            yield CompositeMove(self, op, move, perf_counter() - start)
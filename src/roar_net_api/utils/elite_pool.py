@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import threading
+from collections.abc import Callable
+from typing import Any, Generic, Optional, TypeVar, Union, cast
+
+from ..operations import SupportsObjectiveValue, SupportsSolutionDistance
+
+_TSolution = TypeVar("_TSolution", bound=SupportsObjectiveValue)
+
+DistanceFunc = Callable[[_TSolution, _TSolution], Union[int, float]]
+
+
+def solution_distance(a: Any, b: Any) -> Union[int, float]:
+    """
+    Default distance function, which requires solutions to support `solution_distance`.
+    """
+    return cast(SupportsSolutionDistance[Any], a).solution_distance(b)
+
+
+class ElitePool(Generic[_TSolution]):
+    """
+    Class to keep a set of at most `capacity` good and diverse feasible solutions
+
+    A solution within `min_distance` of a solution already in the pool is only added if it is better than all of
+    them. Otherwise, it is added if the pool is not full or if it is better than the worst solution in the pool, and
+    it replaces the most similar solution among those worse than it. `distance` defaults to `solution_distance`.
+
+    Operations are thread-safe, and a pool can be shared between processes by serving it from a
+    `multiprocessing.managers.BaseManager`, in which case `distance` must be picklable.
+    """
+
+    def __init__(
+        self, capacity: int, distance: Optional[DistanceFunc[_TSolution]] = None, min_distance: Union[int, float] = 1
+    ):
+        self.capacity = capacity
+        self.distance: DistanceFunc[_TSolution] = solution_distance if distance is None else distance
+        self.min_distance = min_distance
+        self.elite: list[tuple[Union[int, float], _TSolution]] = []
+        self.lock = threading.Lock()
+
+    def add(self, solution: _TSolution) -> bool:
+        """
+        Tries to add `solution` to the pool and returns whether it was added.
+        """
+        obj = solution.objective_value()
+        assert obj is not None
+        with self.lock:
+            if self.capacity <= 0:
+                return False
+            dists = [self.distance(solution, s) for _, s in self.elite]
+            close = [i for i, d in enumerate(dists) if d < self.min_distance]
+            if len(close) > 0:
+                if any(self.elite[i][0] <= obj for i in close):
+                    return False
+                victims = close
+            elif len(self.elite) < self.capacity:
+                self.elite.append((obj, solution))
+                return True
+            else:
+                victims = [i for i, (o, _) in enumerate(self.elite) if o > obj]
+                if len(victims) == 0:
+                    return False
+            # Replace the most similar solution, removing any other close one
+            i = min(victims, key=dists.__getitem__)
+            self.elite[i] = (obj, solution)
+            self.elite = [e for j, e in enumerate(self.elite) if j == i or j not in close]
+            return True
+
+    def sample(self, rng: Optional[random.Random] = None) -> Optional[_TSolution]:
+        """
+        Returns a solution chosen uniformly at random with `rng`, or `random` by default, from the pool, or `None` if
+        the pool is empty.
+        """
+        with self.lock:
+            if len(self.elite) == 0:
+                return None
+            choice = random.choice if rng is None else rng.choice
+            return choice(self.elite)[1]
+
+    def best(self) -> Optional[_TSolution]:
+        with self.lock:
+            if len(self.elite) == 0:
+                return None
+            return min(self.elite, key=lambda e: e[0])[1]
+
+    def solutions(self) -> list[_TSolution]:
+        with self.lock:
+            return [s for _, s in self.elite]
+
+    def __len__(self) -> int:
+        return self.elite.__len__()
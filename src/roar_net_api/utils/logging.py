@@ -2,9 +2,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import logging
-from typing import Any, Optional, Union, Type
 import csv
+import functools
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional, Type, Union
 
 from roar_net_api.types import (
     Problem,
@@ -14,6 +21,106 @@ from roar_net_api.types import (
 perflog = logging.getLogger("PerformanceLogger")
 
 
+class AnytimeCurve:
+    """
+    Class to store the (time, value) entries of a run, starting with `value`, infinite by default, at time `start`
+
+    By default, every value is kept. If `best_only` is true, only values that improve on the best so far are kept. If
+    `grid` is "time" or "evals", only improvements are kept as well, and at most one per cell of a grid with
+    `points_per_decade` cells per decade of the time since `start` in microseconds or of the number of values added,
+    respectively. The last improvement in each cell is kept, so the curve is exact at the cell boundaries, and its
+    length only grows with the logarithm of the duration of the run.
+    """
+
+    def __init__(
+        self,
+        start: float,
+        best_only: bool = False,
+        grid: Optional[str] = None,
+        points_per_decade: int = 10,
+        value: float = math.inf,
+    ):
+        if grid not in (None, "time", "evals"):
+            raise ValueError(f"Unknown grid {grid}")
+        self.entries: list[tuple[float, float]] = [(start, value)]
+        self.best_only = best_only or grid is not None
+        self.grid = grid
+        self.points_per_decade = points_per_decade
+        self.evals = 0
+        self.cell = -1
+
+    def add(self, t: float, value: float) -> None:
+        self.evals += 1
+        if not self.best_only:
+            self.entries.append((t, value))
+            return
+        if value >= self.entries[-1][1]:
+            return
+        if self.grid is None:
+            self.entries.append((t, value))
+            return
+        x = (t - self.entries[0][0]) * 1e6 + 1 if self.grid == "time" else self.evals
+        cell = math.floor(math.log10(max(x, 1)) * self.points_per_decade)
+        if cell == self.cell:
+            self.entries[-1] = (t, value)
+        else:
+            self.entries.append((t, value))
+            self.cell = cell
+
+    def __len__(self) -> int:
+        return self.entries.__len__()
+
+
+class RunLog:
+    """
+    Class to record the objective values evaluated during a single run in an `AnytimeCurve` with the given options
+
+    While a run log is active in a context (see `PerformanceLogger.run`), values are recorded in it instead of being
+    sent to `perflog`, so that concurrent runs in different threads or tasks do not mix their records.
+    """
+
+    def __init__(self, best_only: bool = False, grid: Optional[str] = None, points_per_decade: int = 10) -> None:
+        self.curve = AnytimeCurve(time.time(), best_only, grid, points_per_decade)
+
+    def log(self, value: float) -> None:
+        self.curve.add(time.time(), value)
+
+
+class _Discard(RunLog):
+    def __init__(self) -> None:
+        pass
+
+    def log(self, value: float) -> None:
+        pass
+
+
+_run_log: ContextVar[Optional[RunLog]] = ContextVar("run_log", default=None)
+
+
+def log_value(value: float) -> None:
+    """
+    Records `value` in the run log active in the current context, or sends it to `perflog` if there is none.
+    """
+    run = _run_log.get()
+    if run is not None:
+        run.log(value)
+    else:
+        perflog.log(level=5, msg=f"{value}")
+
+
+@contextmanager
+def unlogged() -> Iterator[None]:
+    """
+    Discards the objective values evaluated in the current context, e.g., to read the objective value of a solution
+    without adding it to a run.
+    """
+    token = _run_log.set(_Discard())
+    try:
+        yield
+    finally:
+        _run_log.reset(token)
+
+
 class ListLogger(logging.Handler):
     def __init__(self, level: int = 5):
         super().__init__(level=level)
@@ -25,22 +132,60 @@ class ListLogger(logging.Handler):
             self.records.append(self.format(record))
 
 
+class CurveLogger(logging.Handler):
+    """
+    Handler that stores the values logged at `level` in an `AnytimeCurve` with the given options, which starts with
+    the value of the first record after `curve` is set to `None`
+    """
+
+    def __init__(
+        self, level: int = 5, best_only: bool = False, grid: Optional[str] = None, points_per_decade: int = 10
+    ):
+        super().__init__(level=level)
+        self.curve: Optional[AnytimeCurve] = None
+        self.level = level
+        self.options = (best_only, grid, points_per_decade)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno == self.level:
+            value = float(record.getMessage())
+            if self.curve is None:
+                self.curve = AnytimeCurve(record.created, *self.options, value=value)
+            else:
+                self.curve.add(record.created, value)
+
+
 def get_logged_problem(
     problem_cls: Type[Problem[Any, Any, Solution]], sol_cls: Type[Solution]
 ) -> Type[Problem[Any, Any, Solution]]:
+    return _logged_classes(problem_cls, sol_cls)[0]
+
+
+def _new_logged_solution(problem_cls: Type[Problem[Any, Any, Solution]], sol_cls: Type[Solution]) -> Any:
+    return object.__new__(_logged_classes(problem_cls, sol_cls)[1])
+
+
+# Classes are created once per pair, so that logged solutions can be pickled and unpickled as such
+@functools.cache
+def _logged_classes(
+    problem_cls: Type[Problem[Any, Any, Solution]], sol_cls: Type[Solution]
+) -> tuple[Type[Problem[Any, Any, Solution]], Type[Solution]]:
     def objective_value(self: Any) -> Optional[int]:
         val = sol_cls.objective_value(self)
         if val is not None:
-            global perflog
-            perflog.log(level=5, msg=f"{val}")
+            log_value(val)
             return int(val)
         return None
 
+    def __reduce__(self: Any) -> tuple[Any, ...]:
+        return _new_logged_solution, (problem_cls, sol_cls), self.__dict__
+
     LoggedSolution = type(
         "LoggedSolution",
         (sol_cls,),
         {
             "objective_value": objective_value,
+            "__reduce__": __reduce__,
         },
     )
 
@@ -62,46 +207,99 @@ def get_logged_problem(
         },
     )
 
-    return LoggedProblem
+    return LoggedProblem, LoggedSolution
 
 
 class PerformanceLogger:
-    def __init__(self, filename: Optional[str] = None, algname: Optional[str] = None):
+    """
+    Class to collect the anytime curves of runs and save them to a CSV file with columns `index`, `time` and `fval`,
+    followed by one column per attribute
+
+    Every value logged is kept by default. To bound the memory used by long runs, `best_only` keeps only improvements,
+    and `grid` downsamples them onto a log-spaced grid of `points_per_decade` points per decade of time ("time") or
+    of evaluations ("evals"), as described in `AnytimeCurve`.
+    """
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        algname: Optional[str] = None,
+        best_only: bool = False,
+        grid: Optional[str] = None,
+        points_per_decade: int = 10,
+    ):
+        if grid not in (None, "time", "evals"):
+            raise ValueError(f"Unknown grid {grid}")
         self.run_id: int = 0
         self.finished_runs: list[tuple[Union[int, float, str]]] = []
         self.filename = filename if filename is not None else "performance_log.csv"
         self.algname = algname
-        self.logger = ListLogger()
-        self.logger.setFormatter(logging.Formatter("%(created)f %(message)s"))
+        self.options = (best_only, grid, points_per_decade)
+        self.logger = CurveLogger(5, *self.options)
+        self.attributes: dict[str, Union[int, float, str]] = {}
+        self.lock = threading.Lock()
         global perflog
         perflog.addHandler(self.logger)
         perflog.setLevel(5)
 
     def reset(self) -> None:
-        if self.logger.records is not None and len(self.logger.records) > 1:
+        if self.logger.curve is not None and len(self.logger.curve) > 1:
             self.finished_runs += self.process_run()
-            self.logger.records.clear()
+        self.logger.curve = None
         perflog.log(level=5, msg="inf")
         self.run_id += 1
         return
 
     def add_attribute(self, key: str, value: str) -> None:
-        if self.logger.records is not None and len(self.logger.records) > 1:
+        if self.logger.curve is not None and len(self.logger.curve) > 1:
             self.reset()
         if not hasattr(self, "attributes"):
             self.attributes = {}
         self.attributes[key] = value
 
     def process_run(self) -> list[tuple[Union[int, float, str]]]:
-        times_tuple, fvals = zip(*[entry.split(" ", 1) for entry in self.logger.records])
-        times = [float(t) - float(times_tuple[0]) for t in times_tuple]
-        attributes = getattr(self, "attributes", {})
-        records = []
-        for t, f in zip(times, fvals):
-            record = tuple([int(self.run_id), int(t * 1e6) + 1, float(f), *attributes.values()])
+        assert self.logger.curve is not None
+        return self._records(self.run_id, self.logger.curve.entries, list(getattr(self, "attributes", {}).values()))
+
+    def _records(
+        self, run_id: int, entries: list[tuple[float, float]], values: list[Union[int, float, str]]
+    ) -> list[tuple[Union[int, float, str]]]:
+        records: list[Any] = []
+        for t, f in entries:
+            record = tuple([int(run_id), int((t - entries[0][0]) * 1e6) + 1, f, *values])
             records.append(record)
         return records
 
+    @contextmanager
+    def run(self, **attributes: Union[int, float, str]) -> Iterator[RunLog]:
+        """
+        Records the objective values evaluated in the current context as a separate run, with the given attributes in
+        addition to those added with `add_attribute`.
+
+        Runs are thread-safe, and each thread or task can have its own run active at the same time, since the active
+        run log is kept in a context variable. The run gets its index when it finishes.
+        """
+        run = RunLog(*self.options)
+        token = _run_log.set(run)
+        try:
+            yield run
+        finally:
+            _run_log.reset(token)
+            self.add_run(run.curve.entries, **attributes)
+
+    def add_run(self, entries: list[tuple[float, float]], **attributes: Union[int, float, str]) -> None:
+        """
+        Records the (time, value) `entries` of a finished run, e.g., one recorded in another process, with the given
+        attributes in addition to those added with `add_attribute`.
+        """
+        with self.lock:
+            # New attributes become columns, which are left empty for other runs
+            for key in attributes:
+                self.attributes.setdefault(key, "")
+            values = [attributes.get(key, value) for key, value in self.attributes.items()]
+            self.finished_runs += self._records(self.run_id, entries, values)
+            self.run_id += 1
+
     def save_runs(self) -> list[tuple[Union[int, float, str]]]:
         fieldnames = ["index", "time", "fval", *(getattr(self, "attributes", {}).keys())]
         with open(self.filename, "w", newline="") as csvfile:
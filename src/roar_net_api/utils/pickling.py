@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import pickle
+from typing import IO, Any, Optional
+
+_PROBLEM = "problem"
+
+
+class ProblemPickler(pickle.Pickler):
+    """
+    Pickler that writes a reference to `problem` instead of the problem itself, wherever it appears in the pickled
+    objects, so that solutions and search states can be stored or sent without copying the problem data
+    """
+
+    def __init__(self, file: IO[bytes], problem: object):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.problem = problem
+
+    def persistent_id(self, obj: object) -> Optional[str]:
+        if obj is self.problem:
+            return _PROBLEM
+        return None
+
+
+class ProblemUnpickler(pickle.Unpickler):
+    """
+    Unpickler that resolves the references written by `ProblemPickler` to `problem`
+    """
+
+    def __init__(self, file: IO[bytes], problem: object):
+        super().__init__(file)
+        self.problem = problem
+
+    def persistent_load(self, pid: object) -> object:
+        if pid != _PROBLEM:
+            raise pickle.UnpicklingError(f"Unknown persistent id: {pid}")
+        return self.problem
+
+
+def dumps(problem: object, obj: object) -> bytes:
+    """
+    Returns `obj` pickled with `ProblemPickler`.
+    """
+    f = io.BytesIO()
+    ProblemPickler(f, problem).dump(obj)
+    return f.getvalue()
+
+
+def loads(problem: object, data: bytes) -> Any:
+    """
+    Returns the object pickled in `data` by `dumps`, with references resolved to `problem`.
+    """
+    return ProblemUnpickler(io.BytesIO(data), problem).load()
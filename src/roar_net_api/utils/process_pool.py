@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Optional
+
+from .pickling import dumps, loads
+
+_problem: Optional[object] = None
+
+
+def init_worker(problem: object) -> None:
+    """
+    Initializer of the process pools passed as `executor` to algorithms, which sends `problem` to every worker once:
+
+        ProcessPoolExecutor(initializer=init_worker, initargs=(problem,))
+
+    Tasks then refer to the problem of the worker instead of carrying a copy of it.
+    """
+    global _problem
+    _problem = problem
+
+
+def _call(fn: Callable[..., Any], data: bytes) -> bytes:
+    if _problem is None:
+        raise RuntimeError("Process pools used by algorithms must be created with initializer=init_worker")
+    return dumps(_problem, fn(*loads(_problem, data)))
+
+
+def submit(executor: Executor, problem: object, fn: Callable[..., Any], *args: Any) -> "Future[Any]":
+    """
+    Submits `fn(*args)` to `executor`. With a process pool initialized with `init_worker`, references to `problem` in
+    the arguments and the result are pickled as references to the copy of the problem held by the worker and by the
+    caller, respectively.
+    """
+    if not isinstance(executor, ProcessPoolExecutor):
+        return executor.submit(fn, *args)
+
+    inner = executor.submit(_call, fn, dumps(problem, args))
+    outer: Future[Any] = Future()
+
+    def done(f: "Future[bytes]") -> None:
+        try:
+            outer.set_result(loads(problem, f.result()))
+        except BaseException as e:
+            outer.set_exception(e)
+
+    inner.add_done_callback(done)
+    return outer
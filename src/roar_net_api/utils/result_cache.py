@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Mapping
+from logging import getLogger
+from typing import Any, Optional, TypeVar, Union
+
+from .logging import unlogged
+from .pickling import ProblemPickler, ProblemUnpickler
+
+log = getLogger(__name__)
+
+_TSolution = TypeVar("_TSolution")
+
+
+def file_digest(path: Union[str, "os.PathLike[str]"]) -> str:
+    """
+    Returns the SHA-256 digest of the contents of the file at `path`, to identify an instance in cache keys.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class ResultCache:
+    """
+    Class to memoise the solutions returned by algorithms in `directory`, so that repeated runs cost nothing
+
+    Entries are addressed by a `key` hashing the instance, the name of the algorithm, its parameters and the seed, and
+    hold the solution together with its objective value. Solutions are pickled with references to the problem instead
+    of the problem itself, as in `Checkpointer`, and are written atomically, so the directory can be shared by several
+    processes. Once the entries take more than `max_bytes`, the least recently used ones are removed until they take
+    at most 90% of it.
+
+    The size of the entries is computed once, by the first `put`, and then kept up to date with the entries written
+    by this object, so that the directory is only scanned again when entries must be removed. Entries written by
+    other processes are counted at that point.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], max_bytes: int = 1 << 30):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.size: Optional[int] = None
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        instance: str, algorithm: str, params: Optional[Mapping[str, Any]] = None, seed: Optional[int] = None
+    ) -> str:
+        """
+        Returns the key of a run of `algorithm` with `params` and `seed` on the instance identified by `instance`,
+        e.g., the `file_digest` of its file. Parameter values must have a deterministic `repr`, such as numbers and
+        strings, and algorithms that make random choices must draw them from a generator seeded with `seed`.
+        """
+        text = repr((instance, algorithm, sorted((params or {}).items()), seed))
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def get(self, problem: object, key: str) -> Optional[Any]:
+        """
+        Returns the solution of `problem` stored under `key`, or `None` if there is none.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry: dict[str, Any] = ProblemUnpickler(f, problem).load()
+            # Mark the entry as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        log.info("Cache hit for %s with objective value %s", key, entry["objective"])
+        return entry["solution"]
+
+    def put(self, problem: object, key: str, solution: Any) -> None:
+        """
+        Stores `solution`, a solution of `problem`, under `key`, and evicts old entries if needed.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Reading the objective value of a logged solution must not add it to the performance log
+        with unlogged():
+            objective = solution.objective_value()
+        try:
+            # An existing entry is replaced
+            replaced = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                ProblemPickler(f, problem).dump({"objective": objective, "solution": solution})
+                written = f.tell()
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        with self.lock:
+            if self.size is None:
+                self.size = self._scan()[1]
+            else:
+                self.size += written - replaced
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def memoize(self, problem: object, key: str, compute: Callable[[], _TSolution]) -> _TSolution:
+        """
+        Returns the solution stored under `key` if there is one, and otherwise calls `compute()` and stores the
+        solution it returns.
+        """
+        solution: Optional[_TSolution] = self.get(problem, key)
+        if solution is None:
+            solution = compute()
+            self.put(problem, key, solution)
+        return solution
+
+    def _scan(self) -> tuple[list[tuple[float, int, str]], int]:
+        # Returns the modification time, size and path of every entry, and their total size
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".pkl"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        return entries, total
+
+    def _evict(self) -> None:
+        entries, total = self._scan()
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            log.info("Evicted %s from the cache", os.path.basename(path))
+        self.size = total
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import threading
+import weakref
+from collections.abc import Sized
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Optional, Self
+
+# Held while the resource tracker registration is replaced by `attach`, and by creators, whose registration must not
+# be skipped
+_tracker_lock = threading.Lock()
+
+
+class _Segment(SharedMemory):
+    def close(self) -> None:
+        try:
+            super().close()
+        except BufferError:
+            # Views of the segment are still in use, such as the rows of a problem, so it stays mapped until they are
+            # released instead
+            pass
+
+
+def _release(segments: list[SharedMemory]) -> None:
+    for shm in segments:
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+
+
+class SharedSegments:
+    """
+    Class to own shared memory segments holding problem data published for worker processes
+
+    Segments are unlinked by `close`, on leaving a `with` block, or at interpreter exit, whichever comes first. If the
+    process is killed instead, the resource tracker of `multiprocessing` unlinks them once it and its workers are gone.
+    Unlinking only removes the name of a segment, so processes that are attached to it can keep using it.
+    """
+
+    def __init__(self) -> None:
+        self.segments: list[SharedMemory] = []
+        self._finalizer = weakref.finalize(self, _release, self.segments)
+
+    def create(self, size: int) -> SharedMemory:
+        """
+        Creates a segment of at least `size` bytes, to be unlinked with the others.
+        """
+        with _tracker_lock:
+            shm = _Segment(create=True, size=max(size, 1))
+        self.segments.append(shm)
+        return shm
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+
+def attach(name: str) -> SharedMemory:
+    """
+    Attaches to the shared memory segment `name` created by another process, without taking ownership of it.
+
+    Closing the returned object while views of its buffer are in use leaves it mapped until they are released.
+    """
+    if sys.version_info >= (3, 13):
+        return _Segment(name, track=False)
+    # Before Python 3.13, attaching registers the segment with the resource tracker, which would then unlink it when
+    # this process exits if the tracker is its own, or forget the registration of the creator if the tracker is shared
+    # with it, as it is with workers started by multiprocessing. Registration is therefore skipped.
+    with _tracker_lock:
+        register = resource_tracker.register
+
+        def skip(name: Sized, rtype: str) -> None:
+            if rtype != "shared_memory":
+                register(name, rtype)
+
+        resource_tracker.register = skip
+        try:
+            return _Segment(name)
+        finally:
+            resource_tracker.register = register
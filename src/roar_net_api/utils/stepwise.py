@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import Callable, Generator
+from time import perf_counter
+from typing import Optional, TypeVar
+
+_T = TypeVar("_T")
+
+Steps = Generator[_T, None, _T]
+
+
+def run_steps(steps: Steps[_T]) -> _T:
+    """
+    Run a step-wise algorithm until it finishes and return its result.
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as e:
+            result: _T = e.value
+            return result
+
+
+async def run_steps_async(
+    steps: Steps[_T], time_slice: float = 0.005, on_step: Optional[Callable[[_T], None]] = None
+) -> _T:
+    """
+    Run a step-wise algorithm as an asyncio coroutine.
+
+    Steps are taken until `time_slice` seconds have elapsed, after which control is given back to the event loop. Since
+    the event loop resumes ready tasks in order, many concurrent calls share the loop in a round-robin fashion. If
+    given, `on_step` is called with the current best solution at the end of every time slice.
+    """
+    while True:
+        deadline = perf_counter() + time_slice
+        try:
+            best = next(steps)
+            while perf_counter() < deadline:
+                best = next(steps)
+        except StopIteration as e:
+            result: _T = e.value
+            return result
+        if on_step is not None:
+            on_step(best)
+        await asyncio.sleep(0)
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import random
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from typing import Any, Optional, TypeVar, cast
+
+from .logging import PerformanceLogger
+from .result_cache import ResultCache
+
+log = getLogger(__name__)
+
+_TProblem = TypeVar("_TProblem")
+_TSolution = TypeVar("_TSolution")
+
+
+def solve_in_threads(
+    problem: _TProblem,
+    solve: Callable[[_TProblem, random.Random], _TSolution],
+    seeds: Iterable[int],
+    max_workers: Optional[int] = None,
+    perflogger: Optional[PerformanceLogger] = None,
+    cache: Optional[ResultCache] = None,
+    key: Optional[Callable[[int], str]] = None,
+) -> list[_TSolution]:
+    """
+    Calls `solve(problem, rng)` once per seed in a pool of `max_workers` threads, by default one per CPU, where `rng`
+    is a `random.Random` seeded with it, and returns the solutions in the order of `seeds`.
+
+    All runs share `problem` without copying it, so it must not be modified while they run, and `solve` should pass
+    `rng` to the algorithms it calls. Randomness within the model, such as that of its random moves, is not covered by
+    `rng`. If `perflogger` is given, each run is recorded as a separate run with a `seed` attribute.
+
+    If `cache` is given, the run of each seed is looked up in it under `key(seed)`, as returned by `ResultCache.key`,
+    and only computed if it is not there. The run of a cached solution is logged with its objective value only.
+
+    Threads only run Python code in parallel on a free-threaded build of CPython (3.13t or later). Otherwise, the runs
+    are interleaved by the GIL, which still gives correct results.
+    """
+    is_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    if is_gil_enabled():
+        log.info("The GIL is enabled, so runs will not execute in parallel")
+    if cache is not None and key is None:
+        raise ValueError("A key is required to use a cache")
+
+    def compute(seed: int) -> _TSolution:
+        if cache is None:
+            return solve(problem, random.Random(seed))
+        assert key is not None
+        solution: Optional[_TSolution] = cache.get(problem, key(seed))
+        if solution is not None:
+            # The cached objective value becomes the only record of the run
+            cast(Any, solution).objective_value()
+            return solution
+        solution = solve(problem, random.Random(seed))
+        cache.put(problem, key(seed), solution)
+        return solution
+
+    def run(seed: int) -> _TSolution:
+        if perflogger is None:
+            return compute(seed)
+        with perflogger.run(seed=seed):
+            return compute(seed)
+
+    with ThreadPoolExecutor(os.cpu_count() if max_workers is None else max_workers) as executor:
+        return list(executor.map(run, seeds))
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+_V = TypeVar("_V")
+
+
+class TranspositionTable(Generic[_V]):
+    """
+    Class to map solution hashes to values, keeping at most `capacity` entries
+
+    When full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.entries: OrderedDict[int, _V] = OrderedDict()
+
+    def get(self, key: int) -> Optional[_V]:
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: int, value: _V) -> None:
+        if self.capacity <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def __contains__(self, key: int) -> bool:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return self.entries.__len__()
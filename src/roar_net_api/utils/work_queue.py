@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import random
+import socket
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from logging import getLogger
+from multiprocessing.managers import BaseManager
+from time import monotonic
+from typing import Any, Optional, cast
+
+from .logging import PerformanceLogger, RunLog, _run_log
+
+log = getLogger(__name__)
+
+# Instance, algorithm and seed
+Job = tuple[str, str, int]
+
+Address = tuple[str, int]
+
+
+class _JobQueue:
+    # Lives in the server process of the coordinator's manager, which calls its methods from one thread per connection
+
+    def __init__(
+        self, jobs: list[Job], lease: float, max_attempts: int, options: Optional[tuple[bool, Optional[str], int]]
+    ) -> None:
+        self.jobs = jobs
+        self.lease_time = lease
+        self.max_attempts = max_attempts
+        self.perf_options = options
+        self.pending = deque(range(len(jobs)))
+        # Job index -> worker and deadline
+        self.running: dict[int, tuple[str, float]] = {}
+        self.attempts = [0] * len(jobs)
+        # Job index, result and performance log entries, in the order in which jobs finished
+        self.finished: list[tuple[int, Any, list[tuple[float, float]]]] = []
+        self.finished_jobs: set[int] = set()
+        self.failed_jobs: dict[int, str] = {}
+        self.cond = threading.Condition()
+
+    def lease(self) -> float:
+        return self.lease_time
+
+    def options(self) -> Optional[tuple[bool, Optional[str], int]]:
+        return self.perf_options
+
+    def take(self, worker: str) -> Optional[tuple[int, Job]]:
+        with self.cond:
+            while True:
+                self._expire()
+                if len(self.pending) > 0:
+                    index = self.pending.popleft()
+                    self.attempts[index] += 1
+                    self.running[index] = (worker, monotonic() + self.lease_time)
+                    return index, self.jobs[index]
+                if self._done():
+                    return None
+                # Wait for a running job to finish, or to be retried
+                self.cond.wait(self.lease_time)
+
+    def heartbeat(self, worker: str) -> None:
+        with self.cond:
+            deadline = monotonic() + self.lease_time
+            for index, (w, _) in self.running.items():
+                if w == worker:
+                    self.running[index] = (worker, deadline)
+
+    def finish(self, worker: str, index: int, result: Any, entries: list[tuple[float, float]]) -> None:
+        with self.cond:
+            # A job retried after its worker was presumed lost may be finished twice
+            if index in self.finished_jobs or index in self.failed_jobs:
+                return
+            self.running.pop(index, None)
+            if index in self.pending:
+                self.pending.remove(index)
+            self.finished.append((index, result, entries))
+            self.finished_jobs.add(index)
+            self.cond.notify_all()
+
+    def fail(self, worker: str, index: int, error: str) -> None:
+        with self.cond:
+            if self.running.get(index, ("",))[0] != worker:
+                return
+            del self.running[index]
+            self._retry(index, f"{error} on {worker}")
+
+    def poll(self, start: int, timeout: float) -> tuple[list[tuple[int, Any, list[tuple[float, float]]]], bool]:
+        # Returns the jobs finished after the first `start`, waiting up to `timeout` seconds for one, and whether all
+        # jobs are done
+        with self.cond:
+            self._expire()
+            if len(self.finished) == start and not self._done():
+                self.cond.wait(timeout)
+                self._expire()
+            return self.finished[start:], self._done()
+
+    def failed(self) -> dict[int, str]:
+        return self.failed_jobs
+
+    def _retry(self, index: int, error: str) -> None:
+        if self.attempts[index] >= self.max_attempts:
+            self.failed_jobs[index] = error
+        else:
+            self.pending.append(index)
+        self.cond.notify_all()
+
+    def _expire(self) -> None:
+        now = monotonic()
+        for index, (worker, deadline) in list(self.running.items()):
+            if deadline < now:
+                del self.running[index]
+                self._retry(index, f"worker {worker} lost")
+
+    def _done(self) -> bool:
+        return len(self.finished_jobs) + len(self.failed_jobs) == len(self.jobs)
+
+
+_queue: Optional[_JobQueue] = None
+
+
+def _init_queue(*args: Any) -> None:
+    global _queue
+    _queue = _JobQueue(*args)
+
+
+def _get_queue() -> _JobQueue:
+    assert _queue is not None
+    return _queue
+
+
+class _CoordinatorManager(BaseManager):
+    pass
+
+
+_CoordinatorManager.register("queue", callable=_get_queue)
+
+
+class _WorkerManager(BaseManager):
+    pass
+
+
+_WorkerManager.register("queue")
+
+
+class Coordinator:
+    """
+    Class to hand out (instance, algorithm, seed) `jobs` to workers in other processes, possibly on other machines,
+    which call `work` with the address of the coordinator and the same `authkey`
+
+    The jobs are queued in a `multiprocessing` manager process listening on `address`, by default on all interfaces on
+    a port chosen by the system, which `start` returns. Workers report every `lease / 3` seconds that they are alive,
+    and the jobs of a worker that has not done so for `lease` seconds are handed out again, as are jobs that raise an
+    exception. A job is given up after `max_attempts` attempts.
+
+    If `perflogger` is given, the run of each job is recorded by the worker with the options of the logger, and added
+    to it with `instance`, `algorithm` and `seed` attributes as soon as the job finishes. Note that the manager
+    authenticates workers but does not encrypt the connection, and unpickles what they send, so it should only be
+    reachable from trusted machines.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[Job],
+        authkey: bytes,
+        address: Address = ("", 0),
+        lease: float = 60.0,
+        max_attempts: int = 3,
+        perflogger: Optional[PerformanceLogger] = None,
+    ):
+        self.jobs = list(jobs)
+        self.authkey = authkey
+        self.address = address
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.perflogger = perflogger
+        self.results: dict[Job, Any] = {}
+        self.failed: dict[Job, str] = {}
+        self.manager: Optional[_CoordinatorManager] = None
+
+    def start(self) -> Address:
+        """
+        Starts the manager process and returns the address that workers should connect to.
+        """
+        options = None if self.perflogger is None else self.perflogger.options
+        self.manager = _CoordinatorManager(self.address, self.authkey)
+        self.manager.start(_init_queue, (self.jobs, self.lease, self.max_attempts, options))
+        self.address = cast(Address, self.manager.address)
+        log.info("Coordinator listening on %s:%d", *self.address)
+        return self.address
+
+    def wait(self) -> dict[Job, Any]:
+        """
+        Waits for all jobs to finish or fail, stops the manager, and returns the results of the jobs that finished.
+        Failed jobs are left in `failed`, with their last error.
+        """
+        assert self.manager is not None
+        queue: Any = self.manager.queue()  # type: ignore[attr-defined]
+        seen = 0
+        done = False
+        while not done:
+            finished, done = queue.poll(seen, min(self.lease, 1.0))
+            seen += len(finished)
+            for index, result, entries in finished:
+                instance, algorithm, seed = job = self.jobs[index]
+                log.info("Job %s finished", job)
+                self.results[job] = result
+                if self.perflogger is not None:
+                    self.perflogger.add_run(entries, instance=instance, algorithm=algorithm, seed=seed)
+        for index, error in queue.failed().items():
+            log.warning("Job %s failed: %s", self.jobs[index], error)
+            self.failed[self.jobs[index]] = error
+        self.close()
+        return self.results
+
+    def run(self) -> dict[Job, Any]:
+        """
+        Starts the manager, and then waits for all jobs as `wait` does.
+        """
+        self.start()
+        return self.wait()
+
+    def close(self) -> None:
+        if self.manager is not None:
+            self.manager.shutdown()
+            self.manager = None
+
+
+def work(
+    address: Address,
+    authkey: bytes,
+    solve: Callable[[str, str, random.Random], Any],
+    name: Optional[str] = None,
+) -> int:
+    """
+    Runs jobs from the `Coordinator` at `address` until there are none left, and returns how many were finished.
+
+    Each job calls `solve(instance, algorithm, rng)`, where `rng` is a `random.Random` seeded with the seed of the job,
+    and sends back its result, which should be small, such as an objective value or a tour, as it is pickled. Objective
+    values logged during the job are recorded as in `PerformanceLogger.run` if the coordinator has a performance logger.
+    `name` identifies the worker in the logs of the coordinator, and defaults to the host name and process id.
+    """
+    worker = f"{socket.gethostname()}:{os.getpid()}" if name is None else name
+    manager = _WorkerManager(address, authkey)
+    manager.connect()
+    queue: Any = manager.queue()  # type: ignore[attr-defined]
+    options = queue.options()
+    interval = queue.lease() / 3
+
+    stop = threading.Event()
+
+    def heartbeat() -> None:
+        while not stop.wait(interval):
+            try:
+                queue.heartbeat(worker)
+            except (OSError, EOFError):
+                return
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+    count = 0
+    try:
+        while True:
+            try:
+                job = queue.take(worker)
+            except (OSError, EOFError):
+                # The coordinator has stopped
+                break
+            if job is None:
+                break
+            index, (instance, algorithm, seed) = job
+            run = RunLog(*options) if options is not None else None
+            token = _run_log.set(run)
+            try:
+                result = solve(instance, algorithm, random.Random(seed))
+            except Exception as e:
+                log.exception("Job %s failed", job[1])
+                queue.fail(worker, index, repr(e))
+                continue
+            finally:
+                _run_log.reset(token)
+            queue.finish(worker, index, result, [] if run is None else run.curve.entries)
+            count += 1
+    finally:
+        stop.set()
+    return count
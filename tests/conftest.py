@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+
+import pytest
+import tsp
+
+INSTANCES = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "tsp", "instances")
+
+
+def instance_path(k: int = 1) -> str:
+    return os.path.join(INSTANCES, f"euclideantsp_{k}.tsp")
+
+
+def small_instance(k: int = 3, n: int = 9) -> str:
+    """
+    Returns a TSPLIB instance made of the first `n` cities of an example instance, which is small enough to be solved
+    exactly by enumeration. On the default one, greedy construction is not optimal.
+    """
+    with open(instance_path(k)) as f:
+        lines = f.read().splitlines()
+    start = lines.index("NODE_COORD_SECTION") + 1
+    coords = lines[start : start + n]
+    header = ["NAME : small", "TYPE : TSP", f"DIMENSION : {n}", "EDGE_WEIGHT_TYPE : EUC_2D", "NODE_COORD_SECTION"]
+    return "\n".join(header + coords + ["EOF"]) + "\n"
+
+
+@pytest.fixture
+def problem() -> tsp.Problem:
+    return tsp.Problem.from_file(instance_path())
+
+
+@pytest.fixture
+def small_problem() -> tsp.Problem:
+    return tsp.Problem.from_textio(io.StringIO(small_instance()))
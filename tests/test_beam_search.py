@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms.beam_search import KMin
+from roar_net_api.utils.process_pool import init_worker
+
+
+def test_kmin_keeps_smallest():
+    kmin = KMin[int, int](3, key=lambda x: x)
+    for x in [5, 1, 4, 2, 3]:
+        kmin.insert(x)
+    assert list(kmin) == [1, 2, 3]
+
+
+def test_kmin_drops_duplicates():
+    kmin = KMin[int, tuple[str, int]](3, key=lambda x: x[1], ident=lambda x: x[0])
+    for x in [("a", 5), ("b", 4), ("a", 2), ("c", 6), ("b", 7), ("d", 1)]:
+        kmin.insert(x)
+    assert list(kmin) == [("d", 1), ("a", 2), ("b", 4)]
+
+
+def test_parallel_layers_match_sequential(problem):
+    expected = alg.beam_search(problem, bw=5)
+
+    with ThreadPoolExecutor(3) as executor:
+        result = alg.beam_search(problem, bw=5, executor=executor, partitions=4)
+    assert result.tour == expected.tour
+
+    with ProcessPoolExecutor(2, initializer=init_worker, initargs=(problem,)) as executor:
+        result = alg.beam_search(problem, bw=5, executor=executor, partitions=3)
+    assert result.problem is problem
+    assert result.tour == expected.tour
+
+
+def test_parallel_layers_with_dedup(problem):
+    expected = alg.beam_search(problem, bw=5, dedup=True)
+    with ThreadPoolExecutor(3) as executor:
+        result = alg.beam_search(problem, bw=5, dedup=True, executor=executor, partitions=4)
+    assert result.tour == expected.tour
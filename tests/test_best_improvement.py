@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.process_pool import init_worker
+
+
+def test_partitioned_scan_matches_sequential(problem):
+    start = alg.greedy_construction(problem)
+    expected = alg.best_improvement(problem, start.copy_solution())
+
+    with ThreadPoolExecutor(3) as executor:
+        result = alg.best_improvement(problem, start.copy_solution(), executor=executor, partitions=7)
+    assert result.tour == expected.tour
+
+    with ProcessPoolExecutor(2, initializer=init_worker, initargs=(problem,)) as executor:
+        result = alg.best_improvement(problem, start.copy_solution(), executor=executor, partitions=3)
+    assert result.problem is problem
+    assert result.tour == expected.tour
+
+
+def test_process_pool_requires_init_worker(problem):
+    start = alg.greedy_construction(problem)
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(RuntimeError):
+            alg.best_improvement(problem, start, executor=executor)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms.sa import ExponentialAcceptance
+
+
+@pytest.mark.parametrize("k", [0, 1])
+def test_bounded_increments(problem, k):
+    random.seed(0)
+    neigh = problem.local_neighbourhoods()[k]
+    solution = problem.random_solution()
+    for _ in range(200):
+        move = neigh.random_move(solution)
+        exact = move.objective_value_increment(solution)
+        for bound in [exact - 1, exact, exact + 1, 0, -1000, 1000]:
+            bounded = move.bounded_objective_value_increment(solution, bound)
+            # Exact within the bound, and anything above it otherwise
+            if exact <= bound:
+                assert bounded == exact
+            else:
+                assert bounded > bound
+        solution = move.apply_move(solution)
+
+
+def test_acceptance_threshold():
+    acceptance = ExponentialAcceptance()
+    rng = random.Random(0)
+    for _ in range(1000):
+        u = rng.random()
+        t = rng.uniform(0.1, 100.0)
+        incr = rng.uniform(-10.0, 500.0)
+        assert (incr <= acceptance.threshold(u, t)) == (u < acceptance(incr, t))
+
+
+@pytest.mark.parametrize("circular", [False, True])
+def test_bounded_first_improvement(problem, circular):
+    start = alg.greedy_construction(problem)
+    random.seed(1)
+    expected = alg.first_improvement(problem, start.copy_solution(), circular=circular)
+    random.seed(1)
+    result = alg.first_improvement(problem, start.copy_solution(), circular=circular, bounded=True)
+    assert result.tour == expected.tour
+
+
+def test_bounded_rls_and_sa(problem):
+    start = alg.greedy_construction(problem)
+    result = alg.rls(problem, start.copy_solution(), 0.1, bounded=True)
+    assert result.objective_value() < start.objective_value()
+    result = alg.sa(problem, start.copy_solution(), 0.1, 30.0, bounded=True)
+    assert result.objective_value() < start.objective_value()
+
+
+def test_bounded_sa_requires_threshold(problem):
+    with pytest.raises(ValueError):
+        alg.sa(problem, alg.greedy_construction(problem), 0.1, 30.0, acceptance=lambda incr, t: 1.0, bounded=True)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from itertools import permutations
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms import StopReason, Termination
+
+
+def brute_force(problem):
+    d = problem.dist
+    return min(sum(d[i][j] for i, j in zip((0,) + perm, perm + (0,))) for perm in permutations(range(1, problem.n)))
+
+
+@pytest.mark.parametrize("best_first", [False, True])
+def test_branch_and_bound_is_optimal(small_problem, best_first):
+    termination = Termination()
+    result = alg.branch_and_bound(small_problem, best_first=best_first, termination=termination)
+    assert termination.reason is StopReason.CONVERGED
+    assert result.objective_value() == brute_force(small_problem)
+
+
+def test_branch_and_bound_with_incumbent(small_problem):
+    # Depth-first search finds the greedy solution first, so a better incumbent is needed to prune more
+    incumbent = alg.best_improvement(small_problem, alg.greedy_construction(small_problem))
+
+    class Count(alg.Callbacks):
+        nodes = 0
+
+        def on_iteration(self, progress):
+            self.nodes += 1
+
+    plain, pruned = Count(), Count()
+    result = alg.branch_and_bound(small_problem, callbacks=plain)
+    result_pruned = alg.branch_and_bound(small_problem, incumbent=incumbent.copy_solution(), callbacks=pruned)
+    assert result_pruned.objective_value() == result.objective_value() <= incumbent.objective_value()
+    assert pruned.nodes < plain.nodes
+
+
+def test_branch_and_bound_limits(small_problem):
+    optimum = brute_force(small_problem)
+
+    termination = Termination()
+    result = alg.branch_and_bound(small_problem, max_open=4, termination=termination)
+    assert termination.reason is StopReason.TRIMMED
+    assert result.objective_value() >= optimum
+
+    termination = Termination()
+    alg.branch_and_bound(small_problem, max_nodes=10, termination=termination)
+    assert termination.reason is StopReason.BUDGET
+
+
+def test_beam_search_with_incumbent(small_problem):
+    incumbent = alg.greedy_construction(small_problem)
+    result = alg.beam_search(small_problem, bw=1, incumbent=incumbent.copy_solution())
+    # No solution worse than the incumbent is returned
+    assert result.objective_value() <= incumbent.objective_value()
+    assert alg.beam_search(small_problem, bw=50, incumbent=incumbent).objective_value() < incumbent.objective_value()
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms.callbacks import hooks
+
+
+class Record(alg.Callbacks):
+    def __init__(self):
+        self.events = []
+
+    def on_iteration(self, progress):
+        self.events.append(("iteration", progress.objective, progress.evals))
+
+    def on_accept(self, progress):
+        # The solution may be modified later, so its objective value is checked now
+        assert progress.objective == progress.solution.objective_value()
+        self.events.append(("accept", progress.objective, progress.evals))
+
+    def on_improvement(self, progress):
+        assert progress.objective == progress.solution.objective_value()
+        self.events.append(("improvement", progress.objective, progress.evals))
+
+    def of(self, kind):
+        return [(obj, evals) for k, obj, evals in self.events if k == kind]
+
+
+def test_only_overridden_hooks_are_returned():
+    class Improvement(alg.Callbacks):
+        def on_improvement(self, progress):
+            pass
+
+    callbacks = Improvement()
+    assert hooks(None) == (None, None, None, None)
+    on_iteration, on_accept, on_improvement, on_layer = hooks(callbacks)
+    assert on_iteration is None and on_accept is None and on_layer is None
+    assert on_improvement == callbacks.on_improvement
+
+
+@pytest.mark.parametrize(
+    "solve",
+    [
+        lambda p, s, c: alg.first_improvement(p, s, callbacks=c),
+        lambda p, s, c: alg.best_improvement(p, s, callbacks=c),
+        lambda p, s, c: alg.rls(p, s, 0.1, callbacks=c),
+        lambda p, s, c: alg.sa(p, s, 0.1, 30.0, rng=random.Random(0), callbacks=c),
+        lambda p, s, c: alg.tabu_search(p, s, 0.1, callbacks=c),
+        lambda p, s, c: alg.vnd(p, s, callbacks=c),
+    ],
+)
+def test_local_search_events(problem, solve):
+    start = alg.greedy_construction(problem)
+    callbacks = Record()
+    result = solve(problem, start.copy_solution(), callbacks)
+
+    improvements = callbacks.of("improvement")
+    assert len(improvements) > 0
+    assert all(a[0] > b[0] and a[1] <= b[1] for a, b in zip(improvements, improvements[1:]))
+    assert improvements[-1][0] == result.objective_value()
+    assert len(callbacks.of("accept")) >= len(improvements)
+    evals = [evals for _, evals in callbacks.of("iteration")]
+    assert len(evals) > 0 and evals == sorted(evals)
+
+
+def test_sa_progress(problem):
+    temperatures = []
+    rates = []
+
+    class Anneal(alg.Callbacks):
+        def on_iteration(self, progress):
+            temperatures.append(progress.temperature)
+            rates.append(progress.acceptance_rate)
+
+    alg.sa(problem, alg.greedy_construction(problem), 0.1, 30.0, rate_window=100, callbacks=Anneal())
+    assert temperatures[0] <= 30.0
+    assert temperatures == sorted(temperatures, reverse=True)
+    assert all(0 <= r <= 1 for r in rates)
+
+
+def test_beam_search_layers(problem):
+    layers = []
+
+    class Layers(alg.Callbacks):
+        def on_layer(self, progress):
+            layers.append((progress.layer, progress.objective, len(progress.solution.tour)))
+
+    result = alg.beam_search(problem, bw=3, callbacks=Layers())
+    assert [layer for layer, _, _ in layers] == list(range(1, problem.n))
+    # Only the last layer holds feasible solutions
+    assert all(obj is None for _, obj, _ in layers[:-1])
+    assert layers[-1][1] == result.objective_value()
+
+
+def test_construction_events(problem):
+    steps = []
+
+    class Steps(alg.Callbacks):
+        def on_iteration(self, progress):
+            steps.append((progress.objective, len(progress.solution.tour), progress.evals))
+
+    alg.greedy_construction(problem, callbacks=Steps())
+    # One step per city added, whose solutions are treated as partial
+    assert [length for _, length, _ in steps] == list(range(2, problem.n + 1))
+    assert all(obj is None for obj, _, _ in steps)
+    assert steps[-1][2] == problem.n * (problem.n - 1) // 2
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from time import perf_counter
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.checkpoint import Checkpointer
+
+
+def test_save_and_load(problem, tmp_path):
+    path = tmp_path / "state.ckpt"
+    checkpoint = Checkpointer(path)
+    assert checkpoint.load(problem) is None
+
+    solution = alg.greedy_construction(problem)
+    checkpoint.save(problem, {"solution": solution, "evals": 3})
+    state = Checkpointer(path).load(problem)
+    assert state["evals"] == 3
+    assert state["solution"].tour == solution.tour
+    # The problem is not pickled with the state
+    assert state["solution"].problem is problem
+    assert path.stat().st_size < 4 * problem.n**2
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_sa_resumes_from_checkpoint(problem, tmp_path):
+    path = tmp_path / "sa.ckpt"
+    start = alg.greedy_construction(problem)
+    budget = 1.0
+
+    # Checkpoints are taken every 0.05s, however long they take to save
+    checkpoint = Checkpointer(path, 0.05, max_overhead=1.0)
+    alg.sa(problem, start.copy_solution(), budget, 30.0, checkpoint=checkpoint, rng=random.Random(0))
+    state = Checkpointer(path).load(problem)
+    assert state["algorithm"] == "sa"
+    # Checkpoints are taken until the temperature reaches zero, which may be just past the budget
+    assert state["elapsed"] > budget / 2
+
+    # Only the rest of the budget is used, and the best solution is kept
+    elapsed = perf_counter()
+    result = alg.sa(problem, start.copy_solution(), budget, 30.0, checkpoint=Checkpointer(path), rng=random.Random(0))
+    elapsed = perf_counter() - elapsed
+    assert elapsed < budget / 2
+    assert result.objective_value() <= state["best"].objective_value()
+
+
+def test_grasp_resumes_from_checkpoint(problem, tmp_path):
+    path = tmp_path / "grasp.ckpt"
+    budget = 0.5
+
+    alg.grasp(problem, budget, checkpoint=Checkpointer(path, 0.05, max_overhead=1.0), rng=random.Random(0))
+    state = Checkpointer(path).load(problem)
+    assert state["algorithm"] == "grasp"
+
+    result = alg.grasp(problem, budget, checkpoint=Checkpointer(path), rng=random.Random(0))
+    assert result.objective_value() <= state["best"].objective_value()
+
+    # A checkpoint cannot be resumed by another algorithm
+    with pytest.raises(ValueError):
+        alg.sa(problem, result, budget, 30.0, checkpoint=Checkpointer(path))
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from collections import Counter
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.composite_neighbourhood import CompositeNeighbourhood
+
+
+class Move:
+    def __init__(self, name, incr):
+        self.name = name
+        self.incr = incr
+
+    def objective_value_increment(self, solution):
+        return self.incr
+
+    def apply_move(self, solution):
+        return solution
+
+
+class Neighbourhood:
+    def __init__(self, name, incr, size):
+        self.name = name
+        self.incr = incr
+        self.size = size
+
+    def random_moves_without_replacement(self, solution):
+        return (Move((self.name, i), self.incr) for i in range(self.size))
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        CompositeNeighbourhood([])
+    with pytest.raises(ValueError):
+        CompositeNeighbourhood([Neighbourhood("a", 0, 1)] * 3, min_probability=0.5)
+
+
+def test_every_move_is_drawn_once():
+    composite = CompositeNeighbourhood([Neighbourhood("a", 0, 10), Neighbourhood("b", 0, 20)], rng=random.Random(0))
+    assert composite.probabilities() == [0.5, 0.5]
+    drawn = Counter(move.name for move in composite.random_moves_without_replacement(None))
+    assert len(drawn) == 30
+    assert set(drawn.values()) == {1}
+
+
+def test_improving_neighbourhood_is_preferred():
+    composite = CompositeNeighbourhood(
+        [Neighbourhood("good", -1, 10**6), Neighbourhood("bad", 0, 10**6)], min_probability=0.1, rng=random.Random(0)
+    )
+    chosen = []
+    for move in composite.random_moves_without_replacement(None):
+        if move.objective_value_increment(None) < 0:
+            move.apply_move(None)
+        chosen.append(move.name[0])
+        if len(chosen) == 1000:
+            break
+    probs = composite.probabilities()
+    assert probs == pytest.approx([0.9, 0.1])
+    # Only the minimum probability is left to the neighbourhood that never improves
+    assert chosen[-500:].count("bad") < 100
+
+
+def test_rls_with_composite_neighbourhood(problem):
+    start = alg.greedy_construction(problem)
+    composite = CompositeNeighbourhood(problem.local_neighbourhoods(), rng=random.Random(0))
+    result = alg.rls(problem, start.copy_solution(), 0.3, neighbourhood=composite)
+    assert result.objective_value() == sum(problem.dist[result.tour[i - 1]][result.tour[i]] for i in range(problem.n))
+    assert result.objective_value() < start.objective_value()
+    assert sum(composite.probabilities()) == pytest.approx(1.0)
+    assert all(g > 0 for g in composite.gain)
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.elite_pool import ElitePool
+
+
+class Point:
+    def __init__(self, x, obj):
+        self.x = x
+        self.obj = obj
+
+    def objective_value(self):
+        return self.obj
+
+
+def distance(a, b):
+    return abs(a.x - b.x)
+
+
+def contents(pool):
+    return sorted((s.x, s.obj) for s in pool.solutions())
+
+
+def test_elite_pool_keeps_good_and_diverse_solutions():
+    pool = ElitePool(3, distance, min_distance=2)
+    assert pool.best() is None and pool.sample() is None
+    assert pool.add(Point(0, 10))
+    assert pool.add(Point(10, 20))
+    assert pool.add(Point(20, 30))
+
+    # Full, and not better than the worst
+    assert not pool.add(Point(30, 30))
+    # Replaces the most similar of the worse solutions
+    assert pool.add(Point(12, 15))
+    assert contents(pool) == [(0, 10), (12, 15), (20, 30)]
+    # Close to a solution, and only added if better than it
+    assert not pool.add(Point(1, 11))
+    assert pool.add(Point(1, 5))
+    assert contents(pool) == [(1, 5), (12, 15), (20, 30)]
+    assert pool.best().obj == 5
+    assert pool.sample(random.Random(0)) in pool.solutions()
+
+
+def test_elite_pool_removes_all_close_solutions():
+    pool = ElitePool(3, distance, min_distance=3)
+    pool.add(Point(0, 10))
+    pool.add(Point(4, 20))
+    pool.add(Point(10, 30))
+    assert pool.add(Point(2, 5))
+    assert contents(pool) == [(2, 5), (10, 30)]
+
+
+def test_distance_increments(problem):
+    random.seed(0)
+    neigh = problem.local_neighbourhood()
+    target = problem.random_solution()
+    solution = problem.random_solution()
+    for _ in range(50):
+        move = neigh.random_move(solution)
+        expected = solution.solution_distance(target) + move.distance_increment(solution, target)
+        solution = move.apply_move(solution)
+        assert solution.solution_distance(target) == expected
+
+
+def test_path_relinking(problem):
+    random.seed(0)
+    a = alg.first_improvement(problem, problem.random_solution())
+    b = alg.first_improvement(problem, problem.random_solution())
+    tour = a.tour.copy()
+    result = alg.path_relinking(problem, a, b)
+    assert a.tour == tour
+    assert result is not None
+    assert 0 < result.solution_distance(b) < a.solution_distance(b)
+    assert result.objective_value() == sum(problem.dist[result.tour[i - 1]][result.tour[i]] for i in range(problem.n))
+
+
+def test_grasp_with_elite_pool(problem):
+    pool = ElitePool(5)
+    result = alg.grasp(problem, 0.5, local_search=alg.best_improvement, elite=pool, rng=random.Random(0))
+    assert 1 < len(pool) <= 5
+    assert pool.best().objective_value() == result.objective_value()
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms import StopReason, Termination
+
+
+def is_local_optimum(problem, solution):
+    neigh = problem.local_neighbourhood()
+    return all(move.objective_value_increment(solution) >= 0 for move in neigh.moves(solution))
+
+
+def test_moves_range_numbers_every_move_once(problem):
+    neigh = problem.local_neighbourhood()
+    solution = problem.random_solution()
+    count = neigh.move_count(solution)
+    numbered = [(m.ix, m.jx) for m in neigh.moves_range(solution, 0, count)]
+    assert len(set(numbered)) == count
+    assert set(numbered) == {(m.ix, m.jx) for m in neigh.moves(solution)}
+    # Ranges can start anywhere
+    assert [(m.ix, m.jx) for m in neigh.moves_range(solution, 123, 456)] == numbered[123:456]
+
+
+def test_circular_scan_reaches_local_optimum(problem):
+    start = alg.greedy_construction(problem)
+    termination = Termination()
+    result = alg.first_improvement(problem, start.copy_solution(), termination=termination, circular=True)
+    assert termination.reason is StopReason.CONVERGED
+    assert result.objective_value() < start.objective_value()
+    assert is_local_optimum(problem, result)
+
+    # The scan makes no random choices
+    again = alg.first_improvement(problem, start.copy_solution(), circular=True)
+    assert again.tour == result.tour
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms.grasp import RestrictedCandidateList, candidate_list, update_candidate_list
+
+
+def test_choose_by_value():
+    rng = random.Random(0)
+    cl = RestrictedCandidateList(["c", "a", "d", "b"], [5, 1, 10, 1], rng)
+    assert {cl.choose_by_value(0.0) for _ in range(100)} == {"a", "b"}
+    assert {cl.choose_by_value(0.5) for _ in range(100)} == {"a", "b", "c"}
+    assert {cl.choose_by_value(1.0) for _ in range(100)} == {"a", "b", "c", "d"}
+
+
+def test_choose_by_value_with_large_integers():
+    # The threshold is computed in floating point, which rounds it below the minimum
+    big = 2**60 + 1
+    cl = RestrictedCandidateList(["a", "b"], [big, big + 2], random.Random(0))
+    assert cl.choose_by_value(0.0) == "a"
+
+
+def test_choose_by_cardinality():
+    rng = random.Random(0)
+    cl = RestrictedCandidateList(["c", "a", "d", "b"], [5, 1, 10, 2], rng)
+    assert {cl.choose_by_cardinality(2) for _ in range(100)} == {"a", "b"}
+    assert {cl.choose_by_cardinality(10) for _ in range(100)} == {"a", "b", "c", "d"}
+
+
+def test_add_and_discard_keep_moves_sorted():
+    cl = RestrictedCandidateList(["c", "a", "b"], [5, 1, 5])
+    cl.add("d", 3)
+    cl.discard("b")
+    cl.discard("x")
+    cl.add("e", 5)
+    assert cl.incrs == [1, 3, 5, 5]
+    assert cl.moves == ["a", "d", "c", "e"]
+    assert len(cl) == 4
+
+
+def test_incremental_update_matches_rebuild(problem):
+    def contents(cl):
+        return sorted(((m.i, m.j, m.k), incr) for m, incr in zip(cl.moves, cl.incrs))
+
+    rng = random.Random(0)
+    random.seed(0)
+    dneigh = problem.destruction_neighbourhood()
+    rneigh = problem.repair_neighbourhood()
+    solution = problem.random_solution()
+    for _ in range(5):
+        for _ in range(rng.randrange(1, 20)):
+            solution = dneigh.random_move(solution).apply_move(solution)
+        cl = candidate_list(rneigh, solution, rng)
+        while len(cl) > 0:
+            move = cl.choose_by_value(rng.choice([0.0, 0.2, 1.0]))
+            solution = move.apply_move(solution)
+            update_candidate_list(cl, rneigh, solution, move)
+            assert contents(cl) == contents(candidate_list(rneigh, solution))
+            assert cl.incrs == sorted(cl.incrs)
+        assert solution.is_feasible
+
+
+def test_grasp(problem):
+    greedy = alg.greedy_construction(problem)
+    result = alg.grasp(problem, 0.5, alpha=0.1, local_search=alg.best_improvement, rng=random.Random(0))
+    assert sorted(result.tour) == list(range(problem.n))
+    assert result.objective_value() < greedy.objective_value()
+
+
+def test_grasp_updates_candidate_list(problem, monkeypatch):
+    # Insertion supports moves_delta, so constructions only evaluate the moves changed by each move
+    monkeypatch.setattr(problem, "construction_neighbourhood", problem.repair_neighbourhood)
+    evals = []
+
+    class Count(alg.Callbacks):
+        def on_iteration(self, progress):
+            evals.append(progress.evals)
+
+    result = alg.grasp(problem, 0.2, rng=random.Random(0), callbacks=Count())
+    assert sorted(result.tour) == list(range(problem.n))
+    # Building the list again after every move would take about n**3/6 evaluations
+    assert evals[0] < problem.n**2 * 2
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import tsp
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.transposition_table import TranspositionTable
+
+
+def test_transposition_table_evicts_least_recently_used():
+    table = TranspositionTable[str](2)
+    table.put(1, "a")
+    table.put(2, "b")
+    assert table.get(1) == "a"
+    table.put(3, "c")
+    assert 2 not in table
+    assert 1 in table and 3 in table
+    assert len(table) == 2
+
+
+def test_transposition_table_with_zero_capacity():
+    table = TranspositionTable[str](0)
+    table.put(1, "a")
+    assert 1 not in table
+
+
+def test_hash_increments(problem):
+    random.seed(0)
+    solution = problem.empty_solution()
+    while not solution.is_feasible:
+        move = random.choice(list(problem.construction_neighbourhood().moves(solution)))
+        h = solution.solution_hash() ^ move.hash_increment(solution)
+        solution = move.apply_move(solution)
+        assert solution.solution_hash() == h
+
+    neigh = problem.local_neighbourhood()
+    for _ in range(100):
+        move = neigh.random_move(solution)
+        h = solution.solution_hash() ^ move.hash_increment(solution)
+        solution = move.apply_move(solution)
+        assert solution.solution_hash() == h
+
+
+def test_equal_tours_have_equal_hashes(problem):
+    tour = list(range(problem.n))
+    rotated = tour[1:] + tour[:1]
+    reversed_ = tour[::-1]
+    hashes = {tsp.Solution(problem, t, set(), 0, *problem.tour_hashes(t)).solution_hash() for t in (tour, rotated)}
+    hashes.add(tsp.Solution(problem, reversed_, set(), 0, *problem.tour_hashes(reversed_)).solution_hash())
+    assert len(hashes) == 1
+
+
+def test_beam_search_dedup(problem):
+    result = alg.beam_search(problem, bw=5, dedup=True)
+    assert sorted(result.tour) == list(range(problem.n))
+
+
+def test_rls_with_transpositions(problem):
+    start = alg.greedy_construction(problem)
+    result = alg.rls(problem, start.copy_solution(), 0.2, transpositions=1000)
+    assert result.objective_value() < start.objective_value()
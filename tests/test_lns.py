@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.process_pool import init_worker
+
+
+def tour_length(problem, tour):
+    return sum(problem.dist[tour[ix - 1]][tour[ix]] for ix in range(len(tour)))
+
+
+def test_insert_moves_keep_solution_consistent(problem):
+    rng = random.Random(0)
+    random.seed(0)
+    neigh = problem.repair_neighbourhood()
+    solution = alg.greedy_construction(problem)
+    dneigh = problem.destruction_neighbourhood()
+    for _ in range(20):
+        solution = dneigh.random_move(solution).apply_move(solution)
+    while solution.not_visited:
+        move = rng.choice(list(neigh.moves(solution)))
+        expected = solution.lower_bound() + move.lower_bound_increment(solution)
+        solution = move.apply_move(solution)
+        assert solution.lower_bound() == expected
+        assert (solution.vhash, solution.ehash) == problem.tour_hashes(solution.tour)
+    assert sorted(solution.tour) == list(range(problem.n))
+    assert solution.objective_value() == tour_length(problem, solution.tour)
+
+
+def test_lns_improves_greedy(problem):
+    random.seed(0)
+    start = alg.greedy_construction(problem)
+    result = alg.lns(problem, start.copy_solution(), 1.0, rng=random.Random(0), repair=problem.repair_neighbourhood())
+    assert sorted(result.tour) == list(range(problem.n))
+    assert result.objective_value() == tour_length(problem, result.tour)
+    assert result.objective_value() < 0.9 * start.objective_value()
+
+
+def test_lns_in_process_pool(problem):
+    start = alg.greedy_construction(problem)
+    with ProcessPoolExecutor(2, initializer=init_worker, initargs=(problem,)) as executor:
+        result = alg.lns(
+            problem, start.copy_solution(), 0.5, attempts=2, executor=executor, repair=problem.repair_neighbourhood()
+        )
+    # Solutions sent back by the workers refer to the problem of the caller
+    assert result.problem is problem
+    assert result.objective_value() < start.objective_value()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import pytest
+
+from roar_net_api.utils.logging import AnytimeCurve, CurveLogger, PerformanceLogger, log_value, perflog
+
+
+def test_curve_keeps_every_value():
+    curve = AnytimeCurve(0.0)
+    for t, value in enumerate([3, 5, 2], 1):
+        curve.add(t, value)
+    assert curve.entries == [(0.0, math.inf), (1, 3), (2, 5), (3, 2)]
+
+
+def test_curve_keeps_improvements():
+    curve = AnytimeCurve(0.0, best_only=True, value=4)
+    for t, value in enumerate([3, 5, 3, 2], 1):
+        curve.add(t, value)
+    assert curve.entries == [(0.0, 4), (1, 3), (4, 2)]
+
+
+def test_curve_on_evaluation_grid():
+    curve = AnytimeCurve(0.0, grid="evals", points_per_decade=4)
+    n = 10**5
+    for k in range(1, n + 1):
+        curve.add(k, n - k)
+    # At most one entry per cell, plus the initial one
+    assert len(curve) <= 4 * 5 + 2
+    assert curve.entries[-1] == (n, 0)
+    times = [t for t, _ in curve.entries[1:]]
+    assert times == sorted(times)
+    # Each kept entry is the last improvement in its cell, i.e., just before a power of 10**(1/4)
+    assert 10**4 - 1 in times
+
+
+def test_curve_on_time_grid():
+    curve = AnytimeCurve(0.0, grid="time", points_per_decade=1)
+    for k in range(1, 1001):
+        curve.add(k * 1e-3, -k)
+    # One cell per decade of microseconds, from 1ms to 1s
+    assert [value for _, value in curve.entries] == [math.inf, -9, -99, -999, -1000]
+
+
+def test_invalid_grid():
+    with pytest.raises(ValueError):
+        AnytimeCurve(0.0, grid="iterations")
+    with pytest.raises(ValueError):
+        PerformanceLogger(grid="iterations")
+
+
+def test_curve_logger_keeps_first_value():
+    handler = CurveLogger()
+    perflog.addHandler(handler)
+    old_level = perflog.level
+    perflog.setLevel(5)
+    try:
+        for value in [10, 9, 8]:
+            log_value(value)
+    finally:
+        perflog.removeHandler(handler)
+        perflog.setLevel(old_level)
+    assert [v for _, v in handler.curve.entries] == [10.0, 9.0, 8.0]
+
+
+def test_performance_logger_runs(tmp_path):
+    perflogger = PerformanceLogger(str(tmp_path / "log.csv"))
+    try:
+        for value in [10, 9, 8]:
+            log_value(value)
+        perflogger.reset()
+        for value in [7, 6]:
+            log_value(value)
+    finally:
+        records = perflogger.close()
+    assert [(index, value) for index, _, value in records] == [
+        (0, 10.0),
+        (0, 9.0),
+        (0, 8.0),
+        (1, math.inf),
+        (1, 7.0),
+        (1, 6.0),
+    ]
+    # Times are in microseconds since the start of each run
+    assert records[0][1] == records[3][1] == 1
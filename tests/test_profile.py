@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import tsp
+from conftest import instance_path
+
+from roar_net_api.profile import main, profile_instance
+
+
+def test_profile_correct_model(problem):
+    prof = profile_instance(problem, 2, 20)
+    assert prof.checks > 0
+    assert prof.errors == []
+    for op in ["apply_move", "lower_bound_increment", "objective_value_increment", "moves"]:
+        assert prof.calls[op] > 0
+
+
+def test_profile_reports_wrong_increments(problem, monkeypatch):
+    increment = tsp.TwoOptMove.objective_value_increment
+    monkeypatch.setattr(tsp.TwoOptMove, "objective_value_increment", lambda self, s: increment(self, s) + 1)
+    prof = profile_instance(problem, 1, 20)
+    assert len(prof.errors) == 20
+    assert all(e.startswith("objective_value_increment") for e in prof.errors)
+
+
+def test_main(capsys, monkeypatch):
+    # The model is given by module name, since the test suite already imported it
+    assert main(["tsp", instance_path(), "--samples", "1", "--moves", "10"]) == 0
+    out = capsys.readouterr().out
+    assert "0 failed" in out
+
+    monkeypatch.setattr(tsp.AddMove, "lower_bound_increment", lambda self, s: 0)
+    assert main(["tsp", instance_path(), "--samples", "1", "--moves", "10"]) == 1
+    out = capsys.readouterr().out
+    assert "lower_bound_increment: expected" in out
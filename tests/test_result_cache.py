@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import os
+
+import pytest
+from conftest import instance_path
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.result_cache import ResultCache, file_digest
+from roar_net_api.utils.threads import solve_in_threads
+
+
+def entry_sizes(directory):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.endswith(".pkl")
+    )
+
+
+def test_keys():
+    digest = file_digest(instance_path())
+    with open(instance_path(), "rb") as f:
+        assert digest == hashlib.sha256(f.read()).hexdigest()
+    key = ResultCache.key(digest, "sa", {"budget": 1.0, "init_temp": 30.0}, 1)
+    assert key == ResultCache.key(digest, "sa", {"init_temp": 30.0, "budget": 1.0}, 1)
+    assert key != ResultCache.key(digest, "sa", {"budget": 1.0, "init_temp": 30.0}, 2)
+    assert key != ResultCache.key(digest, "rls", {"budget": 1.0, "init_temp": 30.0}, 1)
+
+
+def test_put_and_get(problem, tmp_path):
+    cache = ResultCache(tmp_path)
+    key = ResultCache.key("instance", "greedy")
+    assert cache.get(problem, key) is None
+
+    solution = alg.greedy_construction(problem)
+    cache.put(problem, key, solution)
+    cached = ResultCache(tmp_path).get(problem, key)
+    assert cached.tour == solution.tour
+    assert cached.problem is problem
+    # The problem is not stored with the solution
+    assert entry_sizes(tmp_path) < 4 * problem.n**2
+
+
+def test_memoize(problem, tmp_path):
+    cache = ResultCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return alg.greedy_construction(problem)
+
+    key = ResultCache.key("instance", "greedy")
+    first = cache.memoize(problem, key, compute)
+    second = cache.memoize(problem, key, compute)
+    assert len(calls) == 1
+    assert second.tour == first.tour
+
+
+def test_least_recently_used_entries_are_evicted(problem, tmp_path):
+    solution = alg.greedy_construction(problem)
+    probe = ResultCache(tmp_path / "probe")
+    probe.put(problem, "0" * 64, solution)
+    size = entry_sizes(tmp_path / "probe")
+
+    cache = ResultCache(tmp_path / "cache", max_bytes=10 * size)
+    keys = [ResultCache.key("instance", "greedy", seed=seed) for seed in range(10)]
+    for t, key in enumerate(keys):
+        cache.put(problem, key, solution)
+        os.utime(cache._path(key), (t, t))
+    assert entry_sizes(tmp_path / "cache") == cache.size == 10 * size
+
+    # Reading an entry makes it the most recently used one
+    assert cache.get(problem, keys[0]) is not None
+    cache.put(problem, ResultCache.key("instance", "greedy", seed=10), solution)
+    assert cache.size == entry_sizes(tmp_path / "cache") <= 0.9 * cache.max_bytes
+    assert cache.get(problem, keys[0]) is not None
+    assert cache.get(problem, keys[1]) is None
+    assert cache.get(problem, keys[-1]) is not None
+
+
+def test_solve_in_threads_with_cache(problem, tmp_path):
+    cache = ResultCache(tmp_path)
+    calls = []
+
+    def solve(p, rng):
+        calls.append(None)
+        return alg.greedy_construction(p)
+
+    def key(seed):
+        return ResultCache.key("instance", "greedy", seed=seed)
+
+    first = solve_in_threads(problem, solve, [1, 2], max_workers=2, cache=cache, key=key)
+    second = solve_in_threads(problem, solve, [2, 1, 3], max_workers=2, cache=cache, key=key)
+    assert len(calls) == 3
+    assert [s.tour for s in second[:2]] == [s.tour for s in first[::-1]]
+
+    with pytest.raises(ValueError):
+        solve_in_threads(problem, solve, [1], cache=cache)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import random
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms import StopReason, Termination
+from roar_net_api.algorithms.sa import LinearDecay, calibrate_temperature
+
+
+class Move:
+    def __init__(self, incr):
+        self.incr = incr
+
+    def objective_value_increment(self, solution):
+        return self.incr
+
+
+class Neighbourhood:
+    def __init__(self, incrs):
+        self.incrs = incrs
+
+    def random_moves_without_replacement(self, solution):
+        return map(Move, self.incrs)
+
+
+def test_calibrate_temperature():
+    t = calibrate_temperature(Neighbourhood([-5, 10, 0, 10]), None, 0.5, 100)
+    assert t == pytest.approx(10 / math.log(2))
+
+    # The mean acceptance probability of the worsening moves is matched
+    incrs = [1, 10, 100]
+    t = calibrate_temperature(Neighbourhood(incrs), None, 0.2, 100)
+    assert sum(math.exp(-incr / t) for incr in incrs) / len(incrs) == pytest.approx(0.2)
+
+    # Only the first samples are used
+    assert calibrate_temperature(Neighbourhood([10, 1000]), None, 0.5, 1) == pytest.approx(10 / math.log(2))
+    assert calibrate_temperature(Neighbourhood([-1, 0]), None, 0.5, 100) is None
+
+
+def test_sa_calibrates_initial_temperature(problem):
+    start = alg.best_improvement(problem, alg.greedy_construction(problem))
+    # With enough samples, the whole neighbourhood is used and the calibration is exact
+    samples = 10**6
+    expected = calibrate_temperature(problem.local_neighbourhood(), start, 0.3, samples)
+    temperatures = []
+
+    class Stop(Exception):
+        pass
+
+    class Record(alg.Callbacks):
+        def on_iteration(self, progress):
+            temperatures.append(progress.temperature)
+            raise Stop
+
+    with pytest.raises(Stop):
+        alg.sa(
+            problem,
+            start,
+            100.0,
+            None,
+            init_acceptance=0.3,
+            calibration_samples=samples,
+            rng=random.Random(0),
+            callbacks=Record(),
+        )
+    assert temperatures[0] == pytest.approx(expected, rel=0.01)
+
+
+def test_calibration_requires_default_schedule(problem):
+    with pytest.raises(ValueError):
+        alg.sa(problem, alg.greedy_construction(problem), 0.1, None, temperature=LinearDecay(1.0))
+
+
+def test_objective_value_increments(problem):
+    random.seed(0)
+    neigh = problem.local_neighbourhood()
+    solution = problem.random_solution()
+    count = neigh.move_count(solution)
+    expected = [move.objective_value_increment(solution) for move in neigh.moves_range(solution, 0, count)]
+    assert neigh.objective_value_increments(solution) == expected
+
+
+def test_rejection_free_sa(problem):
+    start = alg.best_improvement(problem, alg.greedy_construction(problem))
+    steps = []
+
+    class Record(alg.Callbacks):
+        def on_iteration(self, progress):
+            steps.append(progress.evals)
+
+    result = alg.sa(problem, start.copy_solution(), 0.3, 500.0, rejection_free=0.1, rate_window=100, callbacks=Record())
+    assert result.objective_value() <= start.objective_value()
+    # Batches skip the proposals that would have been rejected
+    assert max(b - a for a, b in zip(steps, steps[1:])) > 1
+
+
+def test_rejection_free_sa_converges(problem):
+    # At a local optimum and a temperature close to zero, no move can be accepted
+    start = alg.best_improvement(problem, alg.greedy_construction(problem))
+    termination = Termination()
+    result = alg.sa(
+        problem, start.copy_solution(), 10.0, 1e-9, termination=termination, rejection_free=0.5, rate_window=10
+    )
+    assert termination.reason is StopReason.CONVERGED
+    assert result.tour == start.tour
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.process_pool import init_worker
+from roar_net_api.utils.shared_memory import SharedSegments, attach
+
+
+def row_sums(problem):
+    return problem.shm is not None, [sum(row) for row in problem.dist]
+
+
+def test_segments_are_unlinked_on_close():
+    with SharedSegments() as segments:
+        shm = segments.create(100)
+        name = shm.name
+        other = attach(name)
+        assert other.size >= 100
+        other.close()
+    with pytest.raises(FileNotFoundError):
+        attach(name)
+
+
+def test_problem_in_shared_memory(problem):
+    with SharedSegments() as segments:
+        shared = problem.to_shared_memory(segments)
+        assert [list(row) for row in shared.dist] == [list(row) for row in problem.dist]
+        # Pickles refer to the segment instead of holding the distances
+        assert len(pickle.dumps(shared)) < 4 * problem.n
+
+        # Spawned workers have no copy of the problem, so they attach to the segment
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            attached, sums = executor.submit(row_sums, shared).result()
+        assert attached
+        assert sums == [sum(row) for row in problem.dist]
+
+
+def test_shared_problem_in_process_pool(problem):
+    start = alg.greedy_construction(problem)
+    expected = alg.best_improvement(problem, start.copy_solution())
+    with SharedSegments() as segments:
+        shared = problem.to_shared_memory(segments)
+        start = alg.greedy_construction(shared)
+        with ProcessPoolExecutor(2, initializer=init_worker, initargs=(shared,)) as executor:
+            result = alg.best_improvement(shared, start, executor=executor, partitions=2)
+        assert result.problem is shared
+        assert result.tour == expected.tour
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import random
+from time import perf_counter
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.stepwise import run_steps, run_steps_async
+
+
+def test_steps_match_blocking_version(problem):
+    start = alg.greedy_construction(problem)
+
+    random.seed(1)
+    expected = alg.first_improvement(problem, start.copy_solution())
+
+    random.seed(1)
+    steps = alg.first_improvement_steps(problem, start.copy_solution(), step=100)
+    yields = 0
+    while True:
+        try:
+            next(steps)
+            yields += 1
+        except StopIteration as e:
+            result = e.value
+            break
+
+    assert yields > 1
+    assert result.tour == expected.tour
+
+
+def test_run_steps_returns_result(problem):
+    start = alg.greedy_construction(problem)
+    result = run_steps(alg.rls_steps(problem, start.copy_solution(), 0.1))
+    assert result.is_feasible
+    assert result.objective_value() <= start.objective_value()
+
+
+def test_async_driver_interleaves_solves(problem):
+    start = alg.greedy_construction(problem)
+    budget = 0.2
+    order = []
+
+    async def solve_both():
+        return await asyncio.gather(
+            *(
+                run_steps_async(
+                    alg.sa_steps(problem, start.copy_solution(), budget, 30.0, rng=random.Random(seed)),
+                    on_step=lambda best, seed=seed: order.append(seed),
+                )
+                for seed in (0, 1)
+            )
+        )
+
+    elapsed = perf_counter()
+    results = asyncio.run(solve_both())
+    elapsed = perf_counter() - elapsed
+
+    # Time spent suspended does not count towards the budget of each solve
+    assert elapsed >= 2 * budget * 0.9
+    assert order.index(1) < len(order) - 1 - order[::-1].index(0)
+    for result in results:
+        assert result.is_feasible
+        assert result.objective_value() < start.objective_value()
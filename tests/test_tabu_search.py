@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms.tabu_search import TabuList
+
+
+def test_tabu_list_forgets_oldest_attributes():
+    tabu = TabuList(3)
+    for attr in ["a", "b", "a"]:
+        tabu.add(attr)
+    assert "a" in tabu and "b" in tabu
+    assert len(tabu) == 2
+
+    # The first "a" expires, but the second one is still in the list
+    tabu.add("c")
+    assert "a" in tabu and "b" in tabu and "c" in tabu
+    tabu.add("d")
+    assert "b" not in tabu
+    tabu.add("e")
+    assert "a" not in tabu
+    assert len(tabu) == 3
+
+
+def test_tabu_list_with_zero_tenure():
+    tabu = TabuList(0)
+    tabu.add("a")
+    assert "a" not in tabu
+    assert len(tabu) == 0
+
+
+def test_tabu_search_escapes_local_optimum(problem):
+    start = alg.best_improvement(problem, alg.greedy_construction(problem))
+    accepted = []
+
+    class Record(alg.Callbacks):
+        def on_accept(self, progress):
+            accepted.append(progress.objective)
+
+    result = alg.tabu_search(problem, start.copy_solution(), 1.0, callbacks=Record())
+    assert result.objective_value() <= start.objective_value()
+    assert result.objective_value() == min([start.objective_value()] + accepted)
+    # Moves are applied even if they do not improve the current solution
+    assert accepted[0] >= start.objective_value()
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from time import perf_counter
+
+import pytest
+import tsp
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms import StopReason, Termination
+from roar_net_api.algorithms.termination import objective_value
+
+
+@pytest.mark.parametrize(
+    "solve",
+    [
+        lambda p, s, t: alg.sa(p, s, 5.0, 30.0, termination=t),
+        lambda p, s, t: alg.rls(p, s, 5.0, termination=t),
+        lambda p, s, t: alg.first_improvement(p, s, termination=t),
+        lambda p, s, t: alg.best_improvement(p, s, termination=t),
+        lambda p, s, t: alg.vnd(p, s, termination=t),
+    ],
+)
+def test_target(problem, solve):
+    start = alg.greedy_construction(problem)
+    target = start.objective_value() - 1000
+    termination = Termination(target=target)
+    result = solve(problem, start, termination)
+    assert termination.reason is StopReason.TARGET
+    assert result.objective_value() <= target
+
+
+def test_target_reached_by_construction(problem):
+    termination = Termination(target=10**9)
+    alg.beam_search(problem, bw=2, termination=termination)
+    assert termination.reason is StopReason.TARGET
+
+
+def test_evaluations_without_improvement(problem):
+    random.seed(0)
+    start = alg.first_improvement(problem, alg.greedy_construction(problem))
+    evals = 0
+
+    class Count(alg.Callbacks):
+        def on_iteration(self, progress):
+            nonlocal evals
+            evals = progress.evals
+
+    termination = Termination(max_evals_without_improvement=100)
+    alg.rls(problem, start, 5.0, termination=termination, callbacks=Count())
+    assert termination.reason is StopReason.EVALUATIONS_WITHOUT_IMPROVEMENT
+    assert evals == 100
+
+
+def test_time_without_improvement_on_plateau():
+    # All tours have the same length, so every move is a sideways move
+    n = 10
+    problem = tsp.Problem([[int(i != j) for j in range(n)] for i in range(n)], "flat")
+    termination = Termination(max_time_without_improvement=0.1)
+    elapsed = perf_counter()
+    alg.rls(problem, problem.random_solution(), 10.0, termination=termination)
+    elapsed = perf_counter() - elapsed
+    assert termination.reason is StopReason.TIME_WITHOUT_IMPROVEMENT
+    assert elapsed < 5.0
+
+
+def test_converged(problem):
+    termination = Termination()
+    alg.best_improvement(problem, alg.greedy_construction(problem), termination=termination)
+    assert termination.reason is StopReason.CONVERGED
+
+
+def test_objective_value_is_optional():
+    assert objective_value(object()) is None
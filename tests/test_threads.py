@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import csv
+import random
+
+import tsp
+
+import roar_net_api.algorithms as alg
+from roar_net_api.utils.logging import PerformanceLogger, get_logged_problem
+from roar_net_api.utils.threads import solve_in_threads
+
+
+def solve(problem, rng):
+    # A random tour improved by a deterministic local search, so that the result only depends on rng
+    neigh = problem.construction_neighbourhood()
+    solution = problem.empty_solution()
+    for j in rng.sample(range(1, problem.n), problem.n - 1):
+        solution = tsp.AddMove(neigh, solution.tour[-1], j).apply_move(solution)
+    solution = alg.first_improvement(problem, solution, circular=True)
+    solution.objective_value()
+    return solution
+
+
+def test_runs_are_reproducible(problem):
+    seeds = [1, 2, 3, 1]
+    results = solve_in_threads(problem, solve, seeds, max_workers=4)
+    assert [r.tour for r in results] == [solve(problem, random.Random(seed)).tour for seed in seeds]
+    assert results[0].tour == results[3].tour != results[1].tour
+
+
+def test_runs_are_logged_separately(problem, tmp_path):
+    logged = get_logged_problem(tsp.Problem, tsp.Solution)(problem.dist, problem.name)
+    path = tmp_path / "log.csv"
+    perflogger = PerformanceLogger(str(path))
+    try:
+        results = solve_in_threads(logged, solve, [1, 2, 3], max_workers=3, perflogger=perflogger)
+    finally:
+        perflogger.close()
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    runs = {}
+    for row in rows:
+        runs.setdefault(row["index"], []).append(row)
+    assert len(runs) == 3
+    # Each run ends with the objective value of its own solution
+    finals = {int(rs[0]["seed"]): float(rs[-1]["fval"]) for rs in runs.values()}
+    assert finals == {seed: r.objective_value() for seed, r in zip([1, 2, 3], results)}
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import pickle
+
+import pytest
+import tsp
+from conftest import instance_path
+
+BURMA14 = """NAME: burma14
+TYPE: TSP
+COMMENT: 14-Staedte in Burma (Zaw Win)
+DIMENSION: 14
+EDGE_WEIGHT_TYPE: GEO
+EDGE_WEIGHT_FORMAT: FUNCTION
+DISPLAY_DATA_TYPE: COORD_DISPLAY
+NODE_COORD_SECTION
+   1  16.47       96.10
+   2  16.47       94.44
+   3  20.09       92.54
+   4  22.39       93.37
+   5  25.23       97.24
+   6  22.00       96.05
+   7  20.47       97.02
+   8  17.20       96.29
+   9  16.30       97.38
+  10  14.05       98.12
+  11  16.53       97.38
+  12  21.52       95.59
+  13  19.41       97.13
+  14  20.09       94.55
+EOF
+"""
+
+
+def explicit_instance(dist, fmt):
+    n = len(dist)
+    if fmt == "FULL_MATRIX":
+        rows = [dist[i] for i in range(n)]
+    elif fmt == "UPPER_ROW":
+        rows = [dist[i][i + 1 :] for i in range(n)]
+    elif fmt == "UPPER_DIAG_ROW":
+        rows = [dist[i][i:] for i in range(n)]
+    elif fmt == "LOWER_ROW":
+        rows = [dist[i][:i] for i in range(n)]
+    else:
+        rows = [dist[i][: i + 1] for i in range(n)]
+    # Spread the numbers unevenly over lines, as TSPLIB does not require one row per line
+    numbers = [str(x) for row in rows for x in row]
+    lines = [" ".join(numbers[k : k + 7]) for k in range(0, len(numbers), 7)]
+    header = [
+        "NAME : explicit",
+        "TYPE : TSP",
+        f"DIMENSION : {n}",
+        "EDGE_WEIGHT_TYPE : EXPLICIT",
+        f"EDGE_WEIGHT_FORMAT : {fmt}",
+        "EDGE_WEIGHT_SECTION",
+    ]
+    return "\n".join(header + lines + ["EOF"]) + "\n"
+
+
+@pytest.mark.parametrize("fmt", ["FULL_MATRIX", "UPPER_ROW", "UPPER_DIAG_ROW", "LOWER_ROW", "LOWER_DIAG_ROW"])
+@pytest.mark.parametrize("chunk_size", [5, 64, 1 << 20])
+def test_explicit_formats(small_problem, monkeypatch, fmt, chunk_size):
+    # Small chunks split numbers across chunk boundaries
+    monkeypatch.setattr(tsp, "_CHUNK_SIZE", chunk_size)
+    dist = [list(row) for row in small_problem.dist]
+    problem = tsp.Problem.from_textio(io.StringIO(explicit_instance(dist, fmt)))
+    assert [list(row) for row in problem.dist] == dist
+    assert problem.name == "explicit"
+
+
+@pytest.mark.parametrize("chunk_size", [5, 64])
+def test_coordinates_across_chunks(problem, monkeypatch, chunk_size):
+    monkeypatch.setattr(tsp, "_CHUNK_SIZE", chunk_size)
+    chunked = tsp.Problem.from_file(instance_path())
+    assert [list(row) for row in chunked.dist] == [list(row) for row in problem.dist]
+
+
+def test_truncated_instance(small_problem):
+    dist = [list(row) for row in small_problem.dist]
+    text = explicit_instance(dist, "FULL_MATRIX").replace("\nEOF\n", "")
+    text = text[: text.rindex(" ")]
+    with pytest.raises(Exception, match="Unexpected end"):
+        tsp.Problem.from_textio(io.StringIO(text))
+
+
+def test_geo_distances():
+    problem = tsp.Problem.from_textio(io.StringIO(BURMA14))
+    # Known optimal tour and value
+    tour = [c - 1 for c in [1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]]
+    assert sum(problem.dist[tour[ix - 1]][tour[ix]] for ix in range(len(tour))) == 3323
+
+
+def test_att_distance():
+    # sqrt(10) = 3.16 is rounded up, unlike in EUC_2D
+    assert tsp._att(0.0, 0.0, 10.0, 0.0) == 4
+    assert tsp._euc_2d(0.0, 0.0, 10.0, 0.0) == 10
+
+
+def test_binary_round_trip(problem, tmp_path):
+    path = str(tmp_path / "instance.bin")
+    problem.to_binary(path)
+    mapped = tsp.Problem.from_file(path)
+    assert mapped.path == path
+    assert mapped.name == problem.name
+    assert [list(row) for row in mapped.dist] == [list(row) for row in problem.dist]
+
+    # Pickles of a mapped problem refer to the file instead of holding the distances
+    data = pickle.dumps(mapped)
+    assert len(data) < 4 * problem.n
+    assert pickle.loads(data) is mapped
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import roar_net_api.algorithms as alg
+from roar_net_api.algorithms import StopReason, Termination
+
+
+def tour_length(problem, tour):
+    return sum(problem.dist[tour[ix - 1]][tour[ix]] for ix in range(len(tour)))
+
+
+def is_local_optimum(neigh, solution):
+    return all(move.objective_value_increment(solution) >= 0 for move in neigh.moves(solution))
+
+
+def test_or_opt_moves(problem):
+    random.seed(0)
+    _, neigh = problem.local_neighbourhoods()
+    solution = problem.random_solution()
+    assert len(list(neigh.moves(solution))) == len(set((m.ix, m.length, m.jx) for m in neigh.moves(solution)))
+    for _ in range(100):
+        move = neigh.random_move(solution)
+        expected = solution.objective_value() + move.objective_value_increment(solution)
+        solution = move.apply_move(solution)
+        assert sorted(solution.tour) == list(range(problem.n))
+        assert solution.objective_value() == expected == tour_length(problem, solution.tour)
+
+
+def test_vnd_is_optimal_in_all_neighbourhoods(problem):
+    start = alg.greedy_construction(problem)
+    termination = Termination()
+    result = alg.vnd(problem, start, termination=termination)
+    assert termination.reason is StopReason.CONVERGED
+    assert result.objective_value() == tour_length(problem, result.tour)
+    for neigh in problem.local_neighbourhoods():
+        assert is_local_optimum(neigh, result)
+
+
+def test_vnd_with_given_neighbourhoods(problem):
+    two_opt, or_opt = problem.local_neighbourhoods()
+    result = alg.vnd(problem, alg.greedy_construction(problem), neighbourhoods=[two_opt])
+    assert is_local_optimum(two_opt, result)
+    # A 2-opt local optimum can usually still be improved by Or-opt
+    assert not is_local_optimum(or_opt, result)
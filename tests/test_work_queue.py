@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: © 2025 Authors of the roar-net-api-py project <https://github.com/roar-net/roar-net-api-py/blob/main/AUTHORS>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+from roar_net_api.utils.logging import PerformanceLogger, log_value
+from roar_net_api.utils.work_queue import Coordinator, _JobQueue, work
+
+AUTHKEY = b"test"
+
+
+def solve(instance, algorithm, rng):
+    if algorithm == "broken":
+        raise RuntimeError("broken algorithm")
+    value = rng.randrange(1000)
+    log_value(value + 1)
+    log_value(value)
+    return instance, value
+
+
+def run_workers(address, count):
+    finished = [0] * count
+
+    def target(k):
+        finished[k] = work(address, AUTHKEY, solve, name=f"worker{k}")
+
+    threads = [threading.Thread(target=target, args=(k,)) for k in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, finished
+
+
+def test_jobs_are_shared_by_workers(tmp_path):
+    jobs = [(f"instance{i}", "algorithm", seed) for i in range(3) for seed in range(4)]
+    perflogger = PerformanceLogger(str(tmp_path / "log.csv"))
+    try:
+        coordinator = Coordinator(jobs, AUTHKEY, ("127.0.0.1", 0), perflogger=perflogger)
+        address = coordinator.start()
+        threads, finished = run_workers(address, 2)
+        results = coordinator.wait()
+        for thread in threads:
+            thread.join()
+    finally:
+        records = perflogger.close()
+
+    assert sum(finished) == len(jobs)
+    assert set(results) == set(jobs)
+    assert all(results[job][0] == job[0] for job in jobs)
+    assert coordinator.failed == {}
+    # Each job is a run with its attributes, ending with the value it returned
+    runs = {}
+    for index, _, value, instance, algorithm, seed in records:
+        runs.setdefault(index, []).append((value, (instance, algorithm, seed)))
+    assert len(runs) == len(jobs)
+    for entries in runs.values():
+        job = entries[-1][1]
+        assert entries[-1][0] == results[job][1]
+
+
+def test_failing_jobs_are_retried_and_given_up(tmp_path):
+    jobs = [("instance", "algorithm", 0), ("instance", "broken", 1)]
+    coordinator = Coordinator(jobs, AUTHKEY, ("127.0.0.1", 0), max_attempts=2)
+    address = coordinator.start()
+    threads, finished = run_workers(address, 1)
+    results = coordinator.wait()
+    for thread in threads:
+        thread.join()
+
+    assert list(results) == [jobs[0]]
+    assert "broken algorithm" in coordinator.failed[jobs[1]]
+    assert finished == [1]
+
+
+def test_jobs_of_lost_workers_are_handed_out_again():
+    queue = _JobQueue([("instance", "algorithm", 0)], 0.05, 2, None)
+    assert queue.take("lost") == (0, ("instance", "algorithm", 0))
+    # The first worker stops sending heartbeats, so the job is retried by another one
+    time.sleep(0.1)
+    assert queue.take("other") == (0, ("instance", "algorithm", 0))
+    queue.finish("other", 0, "result", [])
+    # A late result of the lost worker is ignored
+    queue.finish("lost", 0, "late", [])
+    finished, done = queue.poll(0, 0.0)
+    assert done
+    assert finished == [(0, "result", [])]
+    assert queue.take("other") is None
+
+
+def test_jobs_are_given_up_after_max_attempts():
+    queue = _JobQueue([("instance", "algorithm", 0)], 0.01, 2, None)
+    for _ in range(2):
+        assert queue.take("lost") is not None
+        time.sleep(0.05)
+    finished, done = queue.poll(0, 0.0)
+    assert done and finished == []
+    assert "worker lost lost" in queue.failed()[0]